@@ -0,0 +1,113 @@
+"""
+Microbenchmark of model access through client properties.
+
+Compares pooled access (``client.address``) with creating the model on every
+access (``client.new(Address)``, which is what properties used to do), both
+alone and as a part of a call to the in-process mock API. Also compares
+building request properties with the prepared builder of ``api_method``
+against running the method body through ``_call_with_props``.
+
+Usage::
+
+    python -m benchmarks.model_access --number 100000 --calls 2000
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from novaposhta.models.address import Address
+from novaposhta.models.internet_document import InternetDocument
+
+from .suite import BenchConfig, MockApi, make_client
+
+
+def best_time_ns(fn: Callable[[], object], number: int, repeat: int) -> float:
+    """
+    Best time of a single execution in nanoseconds over ``repeat`` runs.
+    """
+    return min(timeit.Timer(fn).repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+PRICE_KWARGS = {
+    "city_sender": "8d5a980d-391c-11dd-90d9-001a92567626",
+    "city_recipient": "db5c88e0-391c-11dd-90d9-001a92567626",
+    "weight": 1.5,
+    "service_type": "WarehouseWarehouse",
+    "cost": 500,
+    "cargo_type": "Cargo",
+    "seats_amount": 1,
+}
+
+
+def _compare(
+    pooled: float, new: float, names: Tuple[str, str] = ("pooled", "new")
+) -> Dict[str, float]:
+    return {
+        f"{names[0]}_ns": round(pooled, 1),
+        f"{names[1]}_ns": round(new, 1),
+        "saving_ns": round(new - pooled, 1),
+        "saving_pct": round((new - pooled) / new * 100, 1) if new else 0.0,
+    }
+
+
+def run(number: int = 100000, calls: int = 2000, repeat: int = 5) -> Dict[str, Dict]:
+    """
+    Measure model access alone, model access followed by an API call and
+    building properties of ``getDocumentPrice``.
+
+    :param number: property accesses (and property builds) per run.
+    :param calls: API calls per run.
+    :param repeat: number of runs, the best one is reported.
+    :return: timings per case.
+    """
+    client = make_client(MockApi(BenchConfig(payload_items=1)), async_mode=False)
+
+    def call_pooled():
+        client.address.get_warehouses(limit=1)
+
+    def call_new():
+        client.new(Address).get_warehouses(limit=1)
+
+    model = InternetDocument(SimpleNamespace(profiler=None, send=lambda *args: None))
+    price = InternetDocument.get_document_price
+
+    def build_with_builder():
+        price(model, **PRICE_KWARGS)
+
+    def build_with_body(**kwargs):
+        model._call(price.api_method_name, price.__wrapped__(model, **kwargs))
+
+    return {
+        "access": _compare(
+            best_time_ns(lambda: client.address, number, repeat),
+            best_time_ns(lambda: client.new(Address), number, repeat),
+        ),
+        "call": _compare(
+            best_time_ns(call_pooled, calls, repeat),
+            best_time_ns(call_new, calls, repeat),
+        ),
+        "build_props": _compare(
+            best_time_ns(build_with_builder, number, repeat),
+            best_time_ns(lambda: build_with_body(**PRICE_KWARGS), number, repeat),
+            ("builder", "body"),
+        ),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--number", type=int, default=100000)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args.number, args.calls, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
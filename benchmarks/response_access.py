@@ -0,0 +1,100 @@
+"""
+Microbenchmark of lazy responses.
+
+Compares reading the first item of a large ``data`` list, and reading all of
+them, from a ``LazyResponse`` with decoding the whole body with the client's
+serializer first.
+
+Usage::
+
+    python -m benchmarks.response_access --items 5000 --number 20
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+
+from novaposhta.responses import LazyResponse
+from novaposhta.serializers import get_serializer
+
+from .model_access import best_time_ns
+
+
+def make_body(items: int) -> bytes:
+    """
+    Body of a ``getWarehouses`` page with ``items`` warehouses.
+    """
+    data = [
+        {
+            "Ref": f"{i:036d}",
+            "Description": f"Відділення №{i}: вул. Хрещатик, {i}",
+            "Number": str(i),
+            "Schedule": {"Monday": "08:00-20:00", "Sunday": "09:00-18:00"},
+        }
+        for i in range(items)
+    ]
+    return json.dumps(
+        {"success": True, "data": data, "errors": [], "info": {"totalCount": items}},
+        ensure_ascii=False,
+    ).encode()
+
+
+def _compare(lazy: float, eager: float) -> Dict[str, float]:
+    return {
+        "lazy_ns": round(lazy, 1),
+        "eager_ns": round(eager, 1),
+        "saving_ns": round(eager - lazy, 1),
+        "saving_pct": round((eager - lazy) / eager * 100, 1) if eager else 0.0,
+    }
+
+
+def run(items: int = 5000, number: int = 20, repeat: int = 5) -> Dict[str, Dict]:
+    """
+    Measure reading the first item and all items of a response.
+
+    :param items: items in the response.
+    :param number: reads per run.
+    :param repeat: number of runs, the best one is reported.
+    :return: timings per case.
+    """
+    body = make_body(items)
+    loads = get_serializer().loads
+
+    def first_lazy():
+        return LazyResponse(body)["data"][0]["Ref"]
+
+    def first_eager():
+        return loads(body)["data"][0]["Ref"]
+
+    def all_lazy():
+        return [item["Ref"] for item in LazyResponse(body)["data"]]
+
+    def all_eager():
+        return [item["Ref"] for item in loads(body)["data"]]
+
+    return {
+        "first_item": _compare(
+            best_time_ns(first_lazy, number, repeat),
+            best_time_ns(first_eager, number, repeat),
+        ),
+        "all_items": _compare(
+            best_time_ns(all_lazy, number, repeat),
+            best_time_ns(all_eager, number, repeat),
+        ),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(json.dumps(run(args.items, args.number, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,468 @@
+"""
+Benchmark suite for ``NovaPoshtaApi``.
+
+Drives the client in sync, async and threaded modes against an in-process
+``httpx.MockTransport`` with configurable latency and payload size, and measures
+throughput, latency and client CPU per call for single calls, pagination,
+bulk tracking and chains. CPU per call excludes the work of the mock transport
+and ``httpx``, measured by the same calls made with a bare ``httpx`` client.
+
+Usage::
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --max-regression 0.15
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from novaposhta.bulk import run_bulk
+from novaposhta.chains import Chain
+from novaposhta.client import NovaPoshtaApi
+
+MODES = ("sync", "async", "threaded")
+BULK_REFS = [f"2040000000{i:04d}" for i in range(1000)]
+BULK_CHUNK_SIZE = 100
+BENCH_ENDPOINT = "http://novaposhta.bench/v2.0/json/"
+TRANSPORT_BASELINE_CALLS = 200
+
+# metric name -> direction in which it gets worse
+REGRESSION_METRICS = {"cpu_per_call_us": 1, "p95_ms": 1, "calls_per_second": -1}
+
+
+@dataclass
+class BenchConfig:
+    """
+    Parameters of a benchmark run.
+    """
+
+    latency: float = 0.0
+    payload_items: int = 50
+    item_size: int = 200
+    pages: int = 5
+    operations: int = 200
+    concurrency: int = 8
+
+
+class MockApi:
+    """
+    In-process stand-in for the API: answers every call with ``payload_items``
+    items of about ``item_size`` bytes after ``latency`` seconds.
+    ``Address.getWarehouses`` returns ``pages`` full pages and then an empty one.
+    """
+
+    def __init__(self, config: BenchConfig):
+        self.config = config
+        item = {"Ref": "0" * 36, "Description": "x" * max(config.item_size - 60, 0)}
+        self._page = self._encode([item] * config.payload_items)
+        self._last_page = self._encode([])
+
+    @staticmethod
+    def _encode(data: List[Any]) -> bytes:
+        return json.dumps({"success": True, "data": data, "errors": []}).encode()
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        body = self._page
+        if payload["calledMethod"] == "getWarehouses":
+            page = int(payload["methodProperties"].get("Page", 1))
+            body = self._page if page <= self.config.pages else self._last_page
+        return httpx.Response(
+            200, content=body, headers={"Content-Type": "application/json"}
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if self.config.latency:
+            time.sleep(self.config.latency)
+        return self._respond(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        return self._respond(request)
+
+
+def make_client(api: MockApi, async_mode: bool) -> NovaPoshtaApi:
+    """
+    Create a client that talks to the mock API.
+    """
+    transport = httpx.MockTransport(api.async_handler if async_mode else api.handler)
+    http_client = SimpleNamespace(
+        Client=partial(httpx.Client, transport=transport),
+        AsyncClient=partial(httpx.AsyncClient, transport=transport),
+    )
+    return NovaPoshtaApi(
+        "benchmark",
+        api_endpoint=BENCH_ENDPOINT,
+        http_client=http_client,
+        async_mode=async_mode,
+    )
+
+
+def _track(client: NovaPoshtaApi, numbers: List[str]):
+    documents = [{"DocumentNumber": number} for number in numbers]
+    return client.tracking_document.get_status_documents(documents)
+
+
+def _all_succeeded(refs: List[str], response: Dict[str, Any]):
+    return {ref: None for ref in refs}
+
+
+def _chain(client: NovaPoshtaApi):
+    return Chain(
+        client.address.search_settlements,
+        kwargs={"city_name": "Київ"},
+        prepare_next=lambda r: {"city_ref": r["data"][0]["Ref"]},
+    ) | Chain(client.address.get_warehouses)
+
+
+def transport_cpu_per_call(
+    api: MockApi, mode: str, calls: int = TRANSPORT_BASELINE_CALLS
+) -> float:
+    """
+    CPU time of a single call made to the mock API with a bare ``httpx`` client,
+    i.e. the work of the mock transport and ``httpx`` that every measured call
+    includes but that is not done by ``NovaPoshtaApi``.
+
+    :param api: mock API.
+    :param mode: mode of the calls (``threaded`` is measured as ``sync``).
+    :param calls: number of calls to average over.
+    :return: CPU time in seconds.
+    """
+    content = json.dumps(
+        {
+            "apiKey": "benchmark",
+            "modelName": "TrackingDocument",
+            "calledMethod": "getStatusDocuments",
+            "methodProperties": {},
+        }
+    ).encode()
+    if mode == "async":
+
+        async def main() -> float:
+            transport = httpx.MockTransport(api.async_handler)
+            async with httpx.AsyncClient(transport=transport) as client:
+                start = time.process_time()
+                for _ in range(calls):
+                    (await client.post(BENCH_ENDPOINT, content=content)).json()
+                return time.process_time() - start
+
+        return asyncio.run(main()) / calls
+    with httpx.Client(transport=httpx.MockTransport(api.handler)) as client:
+        start = time.process_time()
+        for _ in range(calls):
+            client.post(BENCH_ENDPOINT, content=content).json()
+        return (time.process_time() - start) / calls
+
+
+class Scenario(ABC):
+    """
+    Benchmark scenario: a single operation done via sync or async client.
+    """
+
+    name = "base"
+
+    def __init__(self, config: BenchConfig):
+        self.config = config
+
+    def calls_per_operation(self) -> int:
+        return 1
+
+    @abstractmethod
+    def run_sync(self, client: NovaPoshtaApi, index: int) -> None:
+        """
+        Do the operation with sync client.
+        """
+
+    @abstractmethod
+    async def run_async(self, client: NovaPoshtaApi, index: int) -> None:
+        """
+        Do the operation with async client.
+        """
+
+
+class SingleCall(Scenario):
+    name = "single"
+
+    def run_sync(self, client, index):
+        _track(client, [BULK_REFS[index % len(BULK_REFS)]])
+
+    async def run_async(self, client, index):
+        await _track(client, [BULK_REFS[index % len(BULK_REFS)]])
+
+
+class Pagination(Scenario):
+    name = "pagination"
+
+    def calls_per_operation(self):
+        return self.config.pages + 1
+
+    def run_sync(self, client, index):
+        page = 1
+        while client.address.get_warehouses(page=page, limit=self.config.payload_items)[
+            "data"
+        ]:
+            page += 1
+
+    async def run_async(self, client, index):
+        page = 1
+        while (
+            await client.address.get_warehouses(
+                page=page, limit=self.config.payload_items
+            )
+        )["data"]:
+            page += 1
+
+
+class BulkTracking(Scenario):
+    name = "bulk_tracking"
+
+    def calls_per_operation(self):
+        return math.ceil(len(BULK_REFS) / BULK_CHUNK_SIZE)
+
+    def _run(self, client, concurrency):
+        return run_bulk(
+            partial(_track, client),
+            BULK_REFS,
+            client.async_mode,
+            extract=_all_succeeded,
+            chunk_size=BULK_CHUNK_SIZE,
+            concurrency=concurrency,
+        )
+
+    def run_sync(self, client, index):
+        self._run(client, 1)
+
+    async def run_async(self, client, index):
+        await self._run(client, self.config.concurrency)
+
+
+class ChainRun(Scenario):
+    name = "chain"
+
+    def calls_per_operation(self):
+        return 2
+
+    def run_sync(self, client, index):
+        _chain(client).execute_sync()
+
+    async def run_async(self, client, index):
+        await _chain(client).execute_async()
+
+
+SCENARIOS = (SingleCall, Pagination, BulkTracking, ChainRun)
+
+
+def _timed(fn: Callable[[int], None], latencies: List[float]) -> Callable[[int], None]:
+    def run(index: int) -> None:
+        start = time.perf_counter()
+        fn(index)
+        latencies.append(time.perf_counter() - start)
+
+    return run
+
+
+def _timed_async(
+    fn: Callable[[int], Awaitable[None]], latencies: List[float]
+) -> Callable[[int], Awaitable[None]]:
+    async def run(index: int) -> None:
+        start = time.perf_counter()
+        await fn(index)
+        latencies.append(time.perf_counter() - start)
+
+    return run
+
+
+def _drive(scenario: Scenario, mode: str, api: MockApi) -> List[float]:
+    """
+    Run all operations of the scenario in the given mode.
+
+    :return: latency of every operation.
+    """
+    operations, concurrency = scenario.config.operations, scenario.config.concurrency
+    latencies: List[float] = []
+    if mode == "async":
+
+        async def main() -> None:
+            client = make_client(api, async_mode=True)
+            semaphore = asyncio.Semaphore(concurrency)
+            run = _timed_async(partial(scenario.run_async, client), latencies)
+
+            async def limited(index: int) -> None:
+                async with semaphore:
+                    await run(index)
+
+            await asyncio.gather(*(limited(i) for i in range(operations)))
+            await client.close_async()
+
+        asyncio.run(main())
+        return latencies
+
+    client = make_client(api, async_mode=False)
+    run = _timed(partial(scenario.run_sync, client), latencies)
+    if mode == "threaded":
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(run, range(operations)))
+    else:
+        for index in range(operations):
+            run(index)
+    client.close_sync()
+    return latencies
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def run_scenario(
+    scenario: Scenario, mode: str, api: MockApi, transport_cpu: float = 0.0
+) -> Dict[str, float]:
+    """
+    Run the scenario in the given mode and summarize measurements.
+
+    :param scenario: scenario to run.
+    :param mode: one of ``MODES``.
+    :param api: mock API.
+    :param transport_cpu: CPU time of the mock transport per call, subtracted
+        from CPU per call (see ``transport_cpu_per_call``).
+    :return: measurements.
+    """
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    latencies = _drive(scenario, mode, api)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    calls = len(latencies) * scenario.calls_per_operation()
+    return {
+        "operations": len(latencies),
+        "calls": calls,
+        "wall_s": round(wall, 4),
+        "calls_per_second": round(calls / wall, 1),
+        "cpu_per_call_us": round(max(cpu / calls - transport_cpu, 0.0) * 1e6, 1),
+        "transport_cpu_per_call_us": round(transport_cpu * 1e6, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000, 3),
+        "max_ms": round(max(latencies) * 1000, 3),
+    }
+
+
+def run_suite(
+    config: BenchConfig,
+    modes: Optional[List[str]] = None,
+    scenarios: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Run benchmark scenarios in the given modes.
+
+    :param config: benchmark parameters.
+    :param modes: modes to run (all by default).
+    :param scenarios: names of scenarios to run (all by default).
+    :return: results keyed by ``mode.scenario`` together with run metadata.
+    """
+    api = MockApi(config)
+    results = {}
+    for mode in modes or MODES:
+        transport_cpu = transport_cpu_per_call(api, mode)
+        for scenario_cls in SCENARIOS:
+            if scenarios and scenario_cls.name not in scenarios:
+                continue
+            scenario = scenario_cls(config)
+            results[f"{mode}.{scenario.name}"] = run_scenario(
+                scenario, mode, api, transport_cpu
+            )
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "httpx": httpx.__version__,
+            "config": asdict(config),
+        },
+        "results": results,
+    }
+
+
+def find_regressions(
+    current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float
+) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    :param current: results of the current run.
+    :param baseline: results of a previous run.
+    :param max_regression: allowed relative change for the worse (0.1 is 10%).
+    :return: descriptions of metrics that regressed more than allowed.
+    """
+    regressions = []
+    for key, metrics in current["results"].items():
+        base = baseline["results"].get(key)
+        if not base:
+            continue
+        for metric, direction in REGRESSION_METRICS.items():
+            old, new = base.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * direction
+            if change > max_regression:
+                regressions.append(
+                    f"{key} {metric}: {old} -> {new} ({change:+.0%} worse)"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--payload-items", type=int, default=50)
+    parser.add_argument("--item-size", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--operations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--mode", action="append", choices=MODES)
+    parser.add_argument(
+        "--scenario", action="append", choices=[s.name for s in SCENARIOS]
+    )
+    parser.add_argument("--output", help="file to write JSON results to")
+    parser.add_argument("--baseline", help="JSON results to compare with")
+    parser.add_argument("--max-regression", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    config = BenchConfig(
+        latency=args.latency,
+        payload_items=args.payload_items,
+        item_size=args.item_size,
+        pages=args.pages,
+        operations=args.operations,
+        concurrency=args.concurrency,
+    )
+    results = run_suite(config, args.mode, args.scenario)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        results["baseline"] = {
+            "file": args.baseline,
+            "max_regression": args.max_regression,
+            "regressions": find_regressions(results, baseline, args.max_regression),
+        }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output)
+    print(output)
+    return 1 if results.get("baseline", {}).get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,474 @@
+"""
+Load generator for sizing pools, rate limits and worker counts.
+
+Sends a weighted mix of tracking, price, warehouse search and save calls to any
+endpoint (or to a local fake server) at a target rate or concurrency and reports
+latency percentiles, error rates and client CPU per request::
+
+    python -m novaposhta.bench --fake --rps 200 --duration 30
+    python -m novaposhta.bench --endpoint https://api.novaposhta.ua/v2.0/json/ \\
+        --api-key KEY --concurrency 16 --requests 1000 --mix tracking=70,warehouses=30
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .client import API_DEFAULT_ENDPOINT, NovaPoshtaApi
+from .fake import FakeServer
+from .types import MaybeAsync
+
+DEFAULT_MIX = "tracking=60,price=20,warehouses=20"
+DEFAULT_CITIES = ("Київ", "Львів", "Одеса", "Харків", "Дніпро")
+PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+@dataclass
+class Workload:
+    """
+    Shape of generated load.
+    With ``rps`` calls arrive at a fixed rate (open loop) and ``concurrency``
+    limits calls in flight; without it ``concurrency`` workers send calls
+    back to back (closed loop). The run stops after ``duration`` seconds or
+    ``requests`` calls, whichever comes first.
+    """
+
+    mix: Dict[str, float]
+    rps: Optional[float] = None
+    concurrency: int = 10
+    duration: float = 10.0
+    requests: Optional[int] = None
+    seed: int = 0
+
+
+class LoadContext:
+    """
+    Client and reference data used by operations.
+    """
+
+    def __init__(
+        self,
+        client: NovaPoshtaApi,
+        city_refs: List[str],
+        tracking_numbers: Optional[List[str]] = None,
+        seed: int = 0,
+    ):
+        self.client = client
+        self.city_refs = city_refs
+        self.tracking_numbers = tracking_numbers
+        self.rng = random.Random(seed)
+
+    def tracking_number(self) -> str:
+        if self.tracking_numbers:
+            return self.rng.choice(self.tracking_numbers)
+        return f"2045{self.rng.randrange(10 ** 10):010d}"
+
+
+def _tracking(context: LoadContext) -> MaybeAsync:
+    documents = [{"DocumentNumber": context.tracking_number()}]
+    return context.client.tracking_document.get_status_documents(documents)
+
+
+def _price(context: LoadContext) -> MaybeAsync:
+    sender, recipient = context.rng.choice(context.city_refs), context.rng.choice(
+        context.city_refs
+    )
+    return context.client.internet_document.get_document_price(
+        sender,
+        recipient,
+        round(context.rng.uniform(0.5, 30), 1),
+        "WarehouseWarehouse",
+        context.rng.randrange(100, 5000),
+        "Cargo",
+        1,
+    )
+
+
+def _warehouses(context: LoadContext) -> MaybeAsync:
+    return context.client.address.get_warehouses(
+        city_ref=context.rng.choice(context.city_refs),
+        page=context.rng.randint(1, 3),
+        limit=50,
+    )
+
+
+def _save(context: LoadContext) -> MaybeAsync:
+    return context.client.internet_document.save(
+        payer_type="Sender",
+        payment_method="Cash",
+        cargo_type="Parcel",
+        weight=1,
+        service_type="WarehouseWarehouse",
+        seats_amount=1,
+        description="Load test",
+        cost=500,
+        city_sender=context.rng.choice(context.city_refs),
+        city_recipient=context.rng.choice(context.city_refs),
+    )
+
+
+OPERATIONS: Dict[str, Callable[[LoadContext], MaybeAsync]] = {
+    "tracking": _tracking,
+    "price": _price,
+    "warehouses": _warehouses,
+    "save": _save,
+}
+# Operations that create data on the server.
+WRITE_OPERATIONS = frozenset({"save"})
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parse workload mix like ``tracking=60,price=20,warehouses=20``.
+
+    :param value: comma separated ``operation=weight`` pairs.
+    :return: mapping of operation to weight.
+    """
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {name}")
+        mix[name] = float(weight or 1)
+    if not any(mix.values()):
+        raise ValueError("Workload mix must have a positive weight")
+    return mix
+
+
+def check_writes(mix: Mapping[str, float], allow_writes: bool) -> None:
+    """
+    Refuse a mix with write operations unless they are explicitly allowed.
+
+    :param mix: mapping of operation to weight.
+    :param allow_writes: whether write operations may be sent.
+    :raises ValueError: if the mix writes and writes are not allowed.
+    """
+    writes = sorted(
+        name for name, weight in mix.items() if weight and name in WRITE_OPERATIONS
+    )
+    if writes and not allow_writes:
+        raise ValueError(
+            f"Operations {', '.join(writes)} create data on the server; "
+            "use a fake server or allow writes explicitly"
+        )
+
+
+@dataclass
+class LoadReport:
+    """
+    Measurements of a load run.
+    """
+
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Counter = field(default_factory=Counter)
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, operation: str, latency: float, error: Optional[str]) -> None:
+        """
+        Record a single call.
+
+        :param operation: name of the operation.
+        :param latency: seconds from the scheduled start to the response.
+        :param error: error class (``api`` for ``success: false``) or ``None``.
+        """
+        with self._lock:
+            self.latencies[operation].append(latency)
+            if error:
+                self.errors[f"{operation}.{error}"] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Latency percentiles (ms) per operation, error rates, throughput and client CPU.
+        """
+        total = sum(len(values) for values in self.latencies.values())
+        operations = {}
+        for operation, values in sorted(self.latencies.items()):
+            ordered = sorted(values)
+            errors = sum(
+                count
+                for key, count in self.errors.items()
+                if key.startswith(f"{operation}.")
+            )
+            operations[operation] = {
+                "requests": len(ordered),
+                "error_rate": round(errors / len(ordered), 4),
+                **{
+                    f"p{int(q * 100)}_ms": round(
+                        ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1000, 3
+                    )
+                    for q in PERCENTILES
+                },
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return {
+            "requests": total,
+            "achieved_rps": round(total / self.wall_time, 1) if self.wall_time else 0,
+            "error_rate": round(sum(self.errors.values()) / total, 4) if total else 0,
+            "errors": dict(self.errors),
+            "cpu_per_request_us": round(self.cpu_time / total * 1e6, 1) if total else 0,
+            "operations": operations,
+        }
+
+
+def _error_of(response: Any) -> Optional[str]:
+    if isinstance(response, Mapping) and not response.get("success", True):
+        return "api"
+    return None
+
+
+class _Schedule:
+    """
+    Picks operations by weight and gives scheduled start time of every call.
+    """
+
+    def __init__(self, workload: Workload) -> None:
+        self.workload = workload
+        self._rng = random.Random(workload.seed)
+        self._names = list(workload.mix)
+        self._weights = list(workload.mix.values())
+        self._issued = 0
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+
+    def next(self) -> Optional[Tuple[str, float]]:
+        """
+        Next call as ``(operation, scheduled start)`` or ``None`` when the run is over.
+        """
+        with self._lock:
+            requests = self.workload.requests
+            if requests is not None and self._issued >= requests:
+                return None
+            if self.workload.rps:
+                offset = self._issued / self.workload.rps
+            else:
+                offset = time.perf_counter() - self.started
+            if offset >= self.workload.duration:
+                return None
+            self._issued += 1
+            operation = self._rng.choices(self._names, self._weights)[0]
+            return operation, self.started + offset
+
+
+async def run_async(context: LoadContext, workload: Workload) -> LoadReport:
+    """
+    Generate load with an async client.
+    Latency is measured from the scheduled start, so queueing behind
+    the concurrency limit in open-loop mode is included.
+    """
+    report, schedule = LoadReport(), _Schedule(workload)
+    cpu_start = time.process_time()
+
+    async def call(operation: str, scheduled: float) -> None:
+        error = None
+        try:
+            error = _error_of(await OPERATIONS[operation](context))  # type: ignore[misc]
+        except Exception as e:
+            error = type(e).__name__
+        report.add(operation, time.perf_counter() - scheduled, error)
+
+    if workload.rps:
+        semaphore = asyncio.Semaphore(workload.concurrency)
+
+        async def limited(operation: str, scheduled: float) -> None:
+            async with semaphore:
+                await call(operation, scheduled)
+
+        tasks = []
+        while (item := schedule.next()) is not None:
+            delay = item[1] - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(limited(*item)))
+        await asyncio.gather(*tasks)
+    else:
+
+        async def worker() -> None:
+            while (item := schedule.next()) is not None:
+                await call(*item)
+
+        await asyncio.gather(*(worker() for _ in range(workload.concurrency)))
+    report.wall_time = time.perf_counter() - schedule.started
+    report.cpu_time = time.process_time() - cpu_start
+    return report
+
+
+def run_threaded(context: LoadContext, workload: Workload) -> LoadReport:
+    """
+    Generate load with a sync client from a pool of ``concurrency`` threads.
+    """
+    report, schedule = LoadReport(), _Schedule(workload)
+    cpu_start = time.process_time()
+
+    def call(operation: str, scheduled: float) -> None:
+        error = None
+        try:
+            error = _error_of(OPERATIONS[operation](context))
+        except Exception as e:
+            error = type(e).__name__
+        report.add(operation, time.perf_counter() - scheduled, error)
+
+    with ThreadPoolExecutor(max_workers=workload.concurrency) as pool:
+        if workload.rps:
+            while (item := schedule.next()) is not None:
+                delay = item[1] - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(call, *item)
+        else:
+
+            def worker() -> None:
+                while (item := schedule.next()) is not None:
+                    call(*item)
+
+            for _ in range(workload.concurrency):
+                pool.submit(worker)
+    report.wall_time = time.perf_counter() - schedule.started
+    report.cpu_time = time.process_time() - cpu_start
+    return report
+
+
+def _city_refs(client: NovaPoshtaApi, cities: List[str]) -> List[str]:
+    """
+    Resolve city names to refs with a sync client before the run.
+    """
+    refs = []
+    for city in cities:
+        addresses = client.address.search_settlements(city, limit=1)["data"]
+        if addresses and addresses[0]["Addresses"]:
+            refs.append(addresses[0]["Addresses"][0]["DeliveryCity"])
+    if not refs:
+        raise ValueError("None of the cities were found")
+    return refs
+
+
+def run(
+    endpoint: str,
+    api_key: str,
+    workload: Workload,
+    mode: str = "async",
+    cities: Optional[List[str]] = None,
+    tracking_numbers: Optional[List[str]] = None,
+    timeout: int = 10,
+    allow_writes: bool = False,
+) -> LoadReport:
+    """
+    Resolve reference data and generate load against the endpoint.
+
+    :param endpoint: API endpoint.
+    :param api_key: API key.
+    :param workload: shape of the load.
+    :param mode: ``async`` or ``threaded``.
+    :param cities: names of cities to use in calls.
+    :param tracking_numbers: document numbers to track (random by default).
+    :param timeout: timeout for HTTP requests.
+    :param allow_writes: allow operations that create data (e.g. ``save``).
+    :return: report of the run.
+    :raises ValueError: if the workload writes and ``allow_writes`` is not set.
+    """
+    check_writes(workload.mix, allow_writes)
+    with NovaPoshtaApi(api_key, api_endpoint=endpoint, timeout=timeout) as setup:
+        city_refs = _city_refs(setup, list(cities or DEFAULT_CITIES))
+    async_mode = mode == "async"
+    client = NovaPoshtaApi(
+        api_key, api_endpoint=endpoint, timeout=timeout, async_mode=async_mode
+    )
+    context = LoadContext(client, city_refs, tracking_numbers, workload.seed)
+    if not async_mode:
+        with client:
+            return run_threaded(context, workload)
+
+    async def main() -> LoadReport:
+        async with client:
+            return await run_async(context, workload)
+
+    return asyncio.run(main())
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(
+        description="Generate load against Nova Poshta API or a local fake server"
+    )
+    parser.add_argument("--endpoint", default=API_DEFAULT_ENDPOINT)
+    parser.add_argument("--api-key", default="bench")
+    parser.add_argument("--fake", action="store_true", help="start local fake server")
+    parser.add_argument(
+        "--allow-writes",
+        action="store_true",
+        help="allow save calls against a real endpoint",
+    )
+    parser.add_argument(
+        "--fake-latency",
+        type=float,
+        nargs="+",
+        default=[0.0],
+        help="seconds or MIN MAX",
+    )
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"default: {DEFAULT_MIX}")
+    parser.add_argument("--rps", type=float, help="target rate (open loop)")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--requests", type=int)
+    parser.add_argument("--mode", choices=("async", "threaded"), default="async")
+    parser.add_argument("--city", action="append", help="city name to use in calls")
+    parser.add_argument("--tracking-number", action="append")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to write JSON report to")
+    args = parser.parse_args(argv)
+
+    allow_writes = args.fake or args.allow_writes
+    try:
+        mix = parse_mix(args.mix)
+        check_writes(mix, allow_writes)
+    except ValueError as e:
+        parser.error(str(e))
+    workload = Workload(
+        mix,
+        rps=args.rps,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        requests=args.requests,
+        seed=args.seed,
+    )
+
+    def load(endpoint: str) -> LoadReport:
+        return run(
+            endpoint,
+            args.api_key,
+            workload,
+            mode=args.mode,
+            cities=args.city,
+            tracking_numbers=args.tracking_number,
+            allow_writes=allow_writes,
+        )
+
+    if args.fake:
+        latency = args.fake_latency
+        with FakeServer(
+            latency=latency[0] if len(latency) == 1 else tuple(latency[:2])
+        ) as server:
+            report = load(server.url)
+    else:
+        report = load(args.endpoint)
+    summary = report.summary()
+    output = json.dumps(summary, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output)
+    print(output)
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""Chunked bulk operations over lists of references."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from .types import DictStrAny, MaybeAsync
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_CONCURRENCY = 4
+
+ChunkCall = Callable[[List[str]], MaybeAsync]
+OutcomeExtractor = Callable[[List[str], DictStrAny], Dict[str, Optional[str]]]
+
+
+@dataclass
+class BulkResult:
+    """
+    Aggregated result of a bulk operation.
+    """
+
+    succeeded: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    responses: List[Any] = field(default_factory=list)
+    attempts: int = 0
+
+    @property
+    def success(self) -> bool:
+        """
+        Whether every reference was processed successfully.
+        """
+        return not self.failed
+
+
+class RateLimiter:
+    """
+    Spaces out calls so that no more than ``rate`` calls start per second.
+    Can be shared between threads (sync mode) or coroutines (async mode).
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Reserve the next free slot.
+
+        :return: number of seconds to wait before the slot starts.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+
+    def wait_sync(self) -> None:
+        """
+        Block until the next call is allowed.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        """
+        Wait until the next call is allowed without blocking the event loop.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def chunked(items: Sequence[T], size: int) -> List[List[T]]:
+    """
+    Split items into consecutive chunks of the given size.
+
+    :param items: items to split.
+    :param size: maximum size of a chunk.
+    :return: list of chunks.
+    """
+    if size <= 0:
+        raise ValueError("Chunk size must be positive")
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+def format_errors(errors: Any) -> str:
+    """
+    Convert errors from API response into a single string.
+
+    :param errors: errors as returned by API (list, dict or anything else).
+    :return: error message.
+    """
+    if isinstance(errors, list):
+        return ", ".join(str(e) for e in errors)
+    if isinstance(errors, dict):
+        return ", ".join(f"{k}: {v}" for k, v in errors.items())
+    return str(errors)
+
+
+def _is_list(node: Any) -> bool:
+    return isinstance(node, Sequence) and not isinstance(node, (str, bytes, bytearray))
+
+
+def _walk_ref_lists(node: Any, key: str) -> Iterable[Any]:
+    """
+    Yield items of every list stored under the given key in a nested structure.
+    Any mapping and any sequence other than a string are walked.
+    """
+    if isinstance(node, Mapping):
+        for k, v in node.items():
+            if k == key and _is_list(v):
+                yield from v
+            else:
+                yield from _walk_ref_lists(v, key)
+    elif _is_list(node):
+        for item in node:
+            yield from _walk_ref_lists(item, key)
+
+
+def collect_outcomes(refs: List[str], response: DictStrAny) -> Dict[str, Optional[str]]:
+    """
+    Default outcome extractor for bulk responses.
+
+    Looks for ``Success`` and ``Errors`` lists anywhere in ``data`` and matches
+    their items with requested references. When the response has no per-item
+    details, the whole chunk gets the outcome of the top-level ``success`` flag.
+
+    :param refs: references sent in the request.
+    :param response: response dict.
+    :return: mapping of reference to error message (``None`` for success).
+    """
+    data = response.get("data")
+    outcomes: Dict[str, Optional[str]] = {}
+    for item in _walk_ref_lists(data, "Success"):
+        ref = item.get("Ref") if isinstance(item, dict) else item
+        if ref in refs:
+            outcomes[ref] = None
+    for item in _walk_ref_lists(data, "Errors"):
+        if not isinstance(item, dict) or item.get("Ref") not in refs:
+            continue
+        error = item.get("Error") or item.get("Message") or "Unknown error"
+        outcomes[item["Ref"]] = format_errors(error)
+
+    if outcomes:
+        missing = "No result reported for reference"
+        return {ref: outcomes.get(ref, missing) for ref in refs}
+    if response.get("success"):
+        return {ref: None for ref in refs}
+    error_msg = format_errors(response.get("errors") or "Request failed")
+    return {ref: error_msg for ref in refs}
+
+
+def _unique(refs: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(refs))
+
+
+def _merge(
+    result: BulkResult,
+    chunk: List[str],
+    response: Any,
+    extract: OutcomeExtractor,
+) -> Dict[str, str]:
+    """
+    Merge a response (or an exception) for a chunk into the result.
+
+    :return: failed references of the chunk with their errors.
+    """
+    if isinstance(response, BaseException):
+        return {ref: str(response) or type(response).__name__ for ref in chunk}
+    result.responses.append(response)
+    failed: Dict[str, str] = {}
+    for ref, error in extract(chunk, response).items():
+        if error is None:
+            result.succeeded.append(ref)
+        else:
+            failed[ref] = error
+    return failed
+
+
+def _run_bulk_sync(
+    call: ChunkCall,
+    refs: List[str],
+    extract: OutcomeExtractor,
+    chunk_size: int,
+    concurrency: int,
+    retries: int,
+    limiter: Optional[RateLimiter],
+) -> BulkResult:
+    def safe_call(chunk: List[str]) -> Any:
+        if limiter:
+            limiter.wait_sync()
+        try:
+            return call(chunk)
+        except Exception as e:
+            return e
+
+    result = BulkResult()
+    pending = _unique(refs)
+    pool = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+    try:
+        while pending and result.attempts <= retries:
+            result.attempts += 1
+            chunks = chunked(pending, chunk_size)
+            if pool:
+                responses = list(pool.map(safe_call, chunks))
+            else:
+                responses = [safe_call(chunk) for chunk in chunks]
+            failed: Dict[str, str] = {}
+            for chunk, response in zip(chunks, responses):
+                failed.update(_merge(result, chunk, response, extract))
+            result.failed = failed
+            pending = list(failed)
+    finally:
+        if pool:
+            pool.shutdown()
+    return result
+
+
+async def _run_bulk_async(
+    call: ChunkCall,
+    refs: List[str],
+    extract: OutcomeExtractor,
+    chunk_size: int,
+    concurrency: int,
+    retries: int,
+    limiter: Optional[RateLimiter],
+) -> BulkResult:
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def safe_call(chunk: List[str]) -> Any:
+        async with semaphore:
+            if limiter:
+                await limiter.wait_async()
+            try:
+                return await call(chunk)  # type: ignore[misc]
+            except Exception as e:
+                return e
+
+    result = BulkResult()
+    pending = _unique(refs)
+    while pending and result.attempts <= retries:
+        result.attempts += 1
+        chunks = chunked(pending, chunk_size)
+        responses = await asyncio.gather(*(safe_call(chunk) for chunk in chunks))
+        failed: Dict[str, str] = {}
+        for chunk, response in zip(chunks, responses):
+            failed.update(_merge(result, chunk, response, extract))
+        result.failed = failed
+        pending = list(failed)
+    return result
+
+
+def run_bulk(
+    call: ChunkCall,
+    refs: Iterable[str],
+    async_mode: bool,
+    extract: OutcomeExtractor = collect_outcomes,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    concurrency: int = 1,
+    retries: int = 1,
+    rate_limit: Optional[float] = None,
+) -> Union[BulkResult, Coroutine[Any, Any, BulkResult]]:
+    """
+    Split references into chunks, call API for every chunk and aggregate outcomes.
+    Only failed references are sent again on retry.
+
+    In sync mode chunks are dispatched via thread pool when ``concurrency > 1``,
+    in async mode via ``asyncio.gather`` limited by a semaphore.
+
+    :param call: function that sends a single chunk of references.
+    :param refs: references to process.
+    :param async_mode: whether ``call`` returns coroutines.
+    :param extract: function that maps chunk response to per-reference outcomes.
+    :param chunk_size: maximum number of references per request.
+    :param concurrency: maximum number of requests in flight.
+    :param retries: how many times failed references are retried.
+    :param rate_limit: maximum number of requests started per second.
+    :return: bulk result (or coroutine with it in async mode).
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    if retries < 0:
+        raise ValueError("Retries must not be negative")
+    refs = list(refs)
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    runner = _run_bulk_async if async_mode else _run_bulk_sync
+    return runner(call, refs, extract, chunk_size, concurrency, retries, limiter)
@@ -0,0 +1,404 @@
+"""Recording and replaying of API traffic through httpx transports."""
+
+import asyncio
+import base64
+import gzip
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from types import SimpleNamespace
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from .types import DictStrAny
+
+ENVELOPE_KEYS = ("modelName", "calledMethod", "methodProperties")
+# Headers that describe the body as sent over the wire; recorded bodies are decoded.
+UNREPLAYED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+DEFAULT_HEADERS = [["Content-Type", "application/json"]]
+
+
+class CassetteMiss(LookupError):
+    """No recorded interaction for the request."""
+
+
+def canonical_key(payload: DictStrAny) -> str:
+    """
+    Key of a call: canonical JSON of its envelope without ``apiKey``,
+    so that recordings do not contain keys and match any key on replay.
+
+    :param payload: request data as sent by ``NovaPoshtaApi.send``.
+    :return: key of the call.
+    """
+    envelope = {k: payload.get(k) for k in ENVELOPE_KEYS}
+    return json.dumps(
+        envelope, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def _request_key(request: httpx.Request) -> str:
+    try:
+        return canonical_key(json.loads(request.content))
+    except (ValueError, AttributeError):
+        return request.content.decode("utf-8", "replace")
+
+
+def _encode_body(content: bytes) -> Tuple[str, str]:
+    """
+    Store body as text: as is when it is UTF-8 (so that it stays readable
+    in the file), base64-encoded otherwise.
+
+    :param content: response body.
+    :return: stored body and its encoding.
+    """
+    try:
+        return content.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+@dataclass
+class Interaction:
+    """
+    Recorded request/response pair.
+    ``offset`` is the time from the start of recording to the request,
+    ``elapsed`` is the time the response took, both in seconds.
+    ``body`` is stored as ``encoding`` says: ``utf-8`` text or ``base64``.
+    """
+
+    key: str
+    status: int
+    body: str
+    elapsed: float
+    offset: float
+    encoding: str = "utf-8"
+    headers: List[List[str]] = field(default_factory=list)
+
+    @property
+    def payload(self) -> DictStrAny:
+        """
+        Envelope of the recorded request.
+        """
+        return json.loads(self.key)
+
+    @property
+    def content(self) -> bytes:
+        """
+        Recorded response body.
+        """
+        if self.encoding == "base64":
+            return base64.b64decode(self.body)
+        return self.body.encode(self.encoding)
+
+
+class Cassette:
+    """
+    Recorded interactions stored as JSON lines, gzip-compressed when
+    the file name ends with ``.gz``. Repeated calls with the same key are
+    replayed in order of recording, cycling when exhausted.
+    """
+
+    def __init__(self, interactions: Optional[List[Interaction]] = None):
+        self.interactions: List[Interaction] = []
+        self._index: Dict[str, List[Interaction]] = {}
+        self._positions: Dict[str, int] = {}
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        for interaction in interactions or []:
+            self.add(interaction)
+
+    def add(self, interaction: Interaction) -> None:
+        """
+        Add recorded interaction.
+        """
+        with self._lock:
+            self.interactions.append(interaction)
+            self._index.setdefault(interaction.key, []).append(interaction)
+
+    def record(
+        self, request: httpx.Request, response: httpx.Response, started: float
+    ) -> None:
+        """
+        Add interaction for the request that started at ``started`` (``time.monotonic``).
+        """
+        body, encoding = _encode_body(response.content)
+        self.add(
+            Interaction(
+                key=_request_key(request),
+                status=response.status_code,
+                body=body,
+                elapsed=time.monotonic() - started,
+                offset=started - self._started,
+                encoding=encoding,
+                headers=[
+                    [name, value]
+                    for name, value in response.headers.multi_items()
+                    if name.lower() not in UNREPLAYED_HEADERS
+                ],
+            )
+        )
+
+    def find(self, key: str) -> Interaction:
+        """
+        Next recorded interaction for the key.
+
+        :param key: key of the call (see ``canonical_key``).
+        :raises CassetteMiss: if the call was not recorded.
+        """
+        with self._lock:
+            matches = self._index.get(key)
+            if not matches:
+                raise CassetteMiss(f"No recorded interaction for {key}")
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            return matches[position % len(matches)]
+
+    def save(self, path: str) -> None:
+        """
+        Write interactions to the file.
+        """
+        lines = "".join(
+            json.dumps(asdict(i), ensure_ascii=False) + "\n" for i in self.interactions
+        ).encode()
+        if path.endswith(".gz"):
+            lines = gzip.compress(lines)
+        with open(path, "wb") as file:
+            file.write(lines)
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """
+        Read interactions from the file.
+        """
+        with open(path, "rb") as file:
+            content = file.read()
+        if path.endswith(".gz"):
+            content = gzip.decompress(content)
+        return cls(
+            [Interaction(**json.loads(line)) for line in content.splitlines() if line]
+        )
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport that passes requests to the wrapped transport and records them into the cassette.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None,
+    ):
+        """
+        :param cassette: cassette to record into.
+        :param transport: transport to wrap (``httpx.HTTPTransport`` for sync clients
+            and ``httpx.AsyncHTTPTransport`` for async ones by default).
+        """
+        self.cassette = cassette
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.transport is None:
+            self.transport = httpx.HTTPTransport()
+        started = time.monotonic()
+        response = self.transport.handle_request(request)  # type: ignore[union-attr]
+        response.read()
+        self.cassette.record(request, response, started)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.transport is None:
+            self.transport = httpx.AsyncHTTPTransport()
+        started = time.monotonic()
+        response = await self.transport.handle_async_request(  # type: ignore[union-attr]
+            request
+        )
+        await response.aread()
+        self.cassette.record(request, response, started)
+        return response
+
+    def close(self) -> None:
+        if isinstance(self.transport, httpx.BaseTransport):
+            self.transport.close()
+
+    async def aclose(self) -> None:
+        if isinstance(self.transport, httpx.AsyncBaseTransport):
+            await self.transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport that answers requests from the cassette without network.
+    """
+
+    def __init__(self, cassette: Cassette, timing: Optional[float] = 1.0):
+        """
+        :param cassette: cassette to replay.
+        :param timing: factor for recorded response times (1.0 replays original
+            timing, 0.5 twice as fast); ``None`` answers immediately.
+        """
+        self.cassette = cassette
+        self.timing = timing
+
+    def _response(self, interaction: Interaction) -> httpx.Response:
+        return httpx.Response(
+            interaction.status,
+            content=interaction.content,
+            headers=[
+                (name, value) for name, value in interaction.headers or DEFAULT_HEADERS
+            ],
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self.cassette.find(_request_key(request))
+        if self.timing:
+            time.sleep(interaction.elapsed * self.timing)
+        return self._response(interaction)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self.cassette.find(_request_key(request))
+        if self.timing:
+            await asyncio.sleep(interaction.elapsed * self.timing)
+        return self._response(interaction)
+
+
+def with_transport(transport: Any) -> SimpleNamespace:
+    """
+    Build ``http_client`` argument for ``NovaPoshtaApi`` that uses the transport.
+
+    :param transport: transport for both sync and async clients.
+    :return: object with ``Client`` and ``AsyncClient`` factories.
+    """
+    return SimpleNamespace(
+        Client=lambda **kwargs: httpx.Client(transport=transport, **kwargs),
+        AsyncClient=lambda **kwargs: httpx.AsyncClient(transport=transport, **kwargs),
+    )
+
+
+@dataclass
+class ReplayReport:
+    """
+    Measurements of a traffic replay.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Latency percentiles (ms), error count and client CPU per call (µs).
+        """
+        ordered = sorted(self.latencies) or [0.0]
+
+        def percentile(q: float) -> float:
+            return round(
+                ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1000, 3
+            )
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "wall_time": round(self.wall_time, 3),
+            "cpu_per_call_us": round(self.cpu_time / max(self.calls, 1) * 1e6, 1),
+            "mean_ms": round(statistics.mean(ordered) * 1000, 3),
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+        }
+
+
+def _schedule(cassette: Cassette) -> List[Interaction]:
+    return sorted(cassette.interactions, key=lambda i: i.offset)
+
+
+def replay_traffic(
+    client: Any, cassette: Cassette, speed: float = 1.0, max_workers: int = 32
+) -> Union[ReplayReport, Coroutine[Any, Any, ReplayReport]]:
+    """
+    Send recorded calls through the client, keeping their original arrival times
+    (divided by ``speed``). Together with ``ReplayTransport`` it reproduces a
+    recorded traffic shape against the current client version.
+
+    :param client: ``NovaPoshtaApi`` instance.
+    :param cassette: cassette with calls to send.
+    :param speed: how many times faster than recorded to send calls.
+    :param max_workers: size of thread pool for sync clients.
+    :return: replay report (or coroutine with it in async mode).
+    """
+    if speed <= 0:
+        raise ValueError("Speed must be positive")
+    if client.async_mode:
+        return _replay_async(client, cassette, speed)
+    return _replay_sync(client, cassette, speed, max_workers)
+
+
+def _call(client: Any, interaction: Interaction) -> Any:
+    payload = interaction.payload
+    return client.send(
+        payload["modelName"], payload["calledMethod"], payload["methodProperties"]
+    )
+
+
+def _replay_sync(
+    client: Any, cassette: Cassette, speed: float, max_workers: int
+) -> ReplayReport:
+    report = ReplayReport()
+    lock = threading.Lock()
+
+    def run(interaction: Interaction) -> None:
+        started = time.perf_counter()
+        try:
+            _call(client, interaction)
+            failed = False
+        except Exception:
+            failed = True
+        with lock:
+            report.latencies.append(time.perf_counter() - started)
+            report.errors += failed
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for interaction in _schedule(cassette):
+            delay = interaction.offset / speed - (time.perf_counter() - wall_start)
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(run, interaction)
+            report.calls += 1
+    report.wall_time = time.perf_counter() - wall_start
+    report.cpu_time = time.process_time() - cpu_start
+    return report
+
+
+async def _replay_async(client: Any, cassette: Cassette, speed: float) -> ReplayReport:
+    report = ReplayReport()
+
+    async def run(interaction: Interaction) -> None:
+        started = time.perf_counter()
+        try:
+            await _call(client, interaction)
+        except Exception:
+            report.errors += 1
+        report.latencies.append(time.perf_counter() - started)
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    tasks = []
+    for interaction in _schedule(cassette):
+        delay = interaction.offset / speed - (time.perf_counter() - wall_start)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(run(interaction)))
+        report.calls += 1
+    await asyncio.gather(*tasks)
+    report.wall_time = time.perf_counter() - wall_start
+    report.cpu_time = time.process_time() - cpu_start
+    return report
@@ -1,11 +1,41 @@
 """Chain of calls with error handling and data passing between calls. """
 
 import asyncio
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+import hashlib
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .hooks import ON_CACHE_HIT, ON_RETRY, RequestInfo
 
 T = TypeVar("T")
 
+Kwargs = Dict[str, Any]
+NextKwargs = Union[Kwargs, List[Kwargs]]
+
 
 @dataclass
 class ChainResult:
@@ -16,7 +46,286 @@ class ChainResult:
     success: bool
     data: Optional[Any]
     error: Optional[str]
-    next_kwargs: Optional[Dict[str, Any]] = None
+    next_kwargs: Optional[NextKwargs] = None
+    name: Optional[str] = None
+    started_at: Optional[float] = None
+    duration: Optional[float] = None
+    attempts: int = 0
+    cached: bool = False
+
+
+@dataclass
+class ChainSpan:
+    """
+    Timing record of a single unit of chain execution: the whole executor run,
+    a chain step or a single call of a fan-out step.
+    """
+
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    start: float
+    duration: Optional[float] = None
+    success: Optional[bool] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    cached: bool = False
+    _started: float = field(default=0.0, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert span to a JSON-serializable dict.
+        """
+        return {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+
+
+class ChainTrace:
+    """
+    Collector of spans produced by chain executions.
+    Spans of chain steps are children of the executor span, spans of
+    fan-out calls are children of the fan-out step span.
+    """
+
+    def __init__(self, on_span: Optional[Callable[[ChainSpan], None]] = None):
+        """
+        Initialize trace.
+
+        :param on_span: hook called with every finished span (e.g. to export it to a tracer).
+        """
+        self.on_span = on_span
+        self.spans: List[ChainSpan] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, parent_id: Optional[int]) -> ChainSpan:
+        """
+        Start a new span.
+
+        :param name: name of the span.
+        :param parent_id: id of the parent span.
+        :return: started span.
+        """
+        with self._lock:
+            span_id = next(self._ids)
+        return ChainSpan(
+            name=name,
+            span_id=span_id,
+            parent_id=parent_id,
+            start=time.time(),
+            _started=time.perf_counter(),
+        )
+
+    def finish_span(self, span: ChainSpan) -> None:
+        """
+        Finish span, record it and pass it to the hook.
+
+        :param span: span to finish.
+        """
+        span.duration = time.perf_counter() - span._started
+        with self._lock:
+            self.spans.append(span)
+        if self.on_span:
+            self.on_span(span)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert trace to a JSON-serializable dict, with spans ordered by start time.
+        """
+        spans = sorted(self.spans, key=lambda span: (span.start, span.span_id))
+        return {"spans": [span.to_dict() for span in spans]}
+
+    def to_json(self, **kwargs: Any) -> str:
+        """
+        Export trace as JSON.
+
+        :param kwargs: arguments passed to ``json.dumps``.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+@dataclass
+class _StepStats:
+    """
+    Counters of a single step execution, shared with nested tasks via context.
+    """
+
+    attempts: int = 0
+    calls: int = 0
+    cache_hits: int = 0
+
+
+_current_step: ContextVar[Optional[_StepStats]] = ContextVar(
+    "novaposhta_chain_step", default=None
+)
+_current_trace: ContextVar[Optional[Tuple[ChainTrace, Optional[int]]]] = ContextVar(
+    "novaposhta_chain_trace", default=None
+)
+_fan_out_slots: ContextVar[Optional[asyncio.Semaphore]] = ContextVar(
+    "novaposhta_fan_out_slots", default=None
+)
+
+
+@contextmanager
+def _span(name: str) -> Iterator[Optional[ChainSpan]]:
+    """
+    Record a span in the current trace, if any. Spans started inside become its children.
+
+    :param name: name of the span.
+    :return: started span or ``None`` when tracing is off.
+    """
+    current = _current_trace.get()
+    if current is None:
+        yield None
+        return
+    trace, parent_id = current
+    span = trace.start_span(name, parent_id)
+    token = _current_trace.set((trace, span.span_id))
+    try:
+        yield span
+    except BaseException as e:
+        span.success = False
+        span.error = str(e) or type(e).__name__
+        raise
+    finally:
+        _current_trace.reset(token)
+        trace.finish_span(span)
+
+
+def _emit_client_event(
+    method: Callable,
+    event: str,
+    error: Optional[BaseException] = None,
+    attempt: int = 1,
+) -> None:
+    """
+    Emit hook event on the client, if the method belongs to a model of a client with hooks.
+
+    :param method: method of the chain.
+    :param event: name of the event.
+    :param error: error that caused the event.
+    :param attempt: number of the upcoming attempt.
+    """
+    model = getattr(method, "__self__", None)
+    client = getattr(model, "_client", None)
+    if not getattr(client, "_hooks", None):
+        return
+    api_method = getattr(method, "api_method_name", getattr(method, "__name__", ""))
+    info = RequestInfo(model.name, api_method, {}, error=error, attempt=attempt)  # type: ignore[union-attr]
+    client.emit(event, info)  # type: ignore[union-attr]
+
+
+def _in_context(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Bind function to a copy of the current context, so it can run in another thread.
+    """
+    return partial(copy_context().run, fn)
+
+
+class ChainCache:
+    """
+    Cache of successful chain step responses, keyed on the step's method and
+    its resolved kwargs. A single cache can be shared by many chains and
+    executor runs, so repeated pipelines skip calls already made.
+    Cached responses are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, ttl: float = 300, maxsize: Optional[int] = 1024):
+        """
+        Initialize cache.
+
+        :param ttl: time in seconds for which responses are kept.
+        :param maxsize: maximum number of kept responses (least recently used are evicted).
+        """
+        if ttl <= 0:
+            raise ValueError("TTL must be positive")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(method: Callable, kwargs: Kwargs) -> str:
+        """
+        Build cache key from method and its kwargs.
+        Methods of API models are identified by model and method names and
+        a hash of the client API key, so that clients with different keys
+        never share responses.
+
+        :param method: called method.
+        :param kwargs: kwargs of the call.
+        :return: cache key.
+        """
+        owner = getattr(method, "__self__", None)
+        name = getattr(method, "__qualname__", repr(method))
+        if owner is not None and hasattr(owner, "name"):
+            name = f"{owner.name}.{getattr(method, '__name__', name)}"
+            api_key = getattr(getattr(owner, "_client", None), "api_key", None)
+            if api_key:
+                digest = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+                name = f"{digest}:{name}"
+        return f"{name}:{json.dumps(kwargs, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Get response from cache.
+
+        :param key: cache key.
+        :return: whether the key was found and the cached response.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Put response into cache.
+
+        :param key: cache key.
+        :param value: response to cache.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """
+        Number of cached responses that have not expired yet.
+        """
+        with self._lock:
+            now = time.monotonic()
+            expired = [
+                k for k, (expires_at, _) in self._entries.items() if expires_at <= now
+            ]
+            for key in expired:
+                del self._entries[key]
+            return len(self._entries)
+
+
+@dataclass
+class _StepRecord:
+    """
+    Stats and result of a step being executed.
+    """
+
+    stats: _StepStats = field(default_factory=_StepStats)
+    result: Optional[ChainResult] = None
 
 
 @dataclass
@@ -27,35 +336,364 @@ class Chain:
 
     method: Callable
     kwargs: Optional[Dict[str, Any]] = None
-    prepare_next: Optional[Callable[[Any], Dict[str, Any]]] = None
+    prepare_next: Optional[Callable[[Any], NextKwargs]] = None
+    name: Optional[str] = None
+    depends_on: Optional[List[str]] = None
+    timeout: Optional[float] = None
+    retries: int = 0
+    fallback: Optional[Callable] = None
+    cache: Optional["ChainCache"] = None
 
-    async def execute(self, prev_result: Optional[ChainResult] = None) -> ChainResult:
+    def __post_init__(self) -> None:
+        if self.retries < 0:
+            raise ValueError("Retries must not be negative")
+
+    async def execute(
+        self,
+        prev_result: Optional[ChainResult] = None,
+        deadline: Optional[float] = None,
+    ) -> ChainResult:
         """
         Execute the chain.
+        Failed calls (exceptions and timeouts) are retried ``retries`` times,
+        then ``fallback`` is called with the same kwargs, if provided.
+        The fallback is bound by the step timeout and the remaining time before
+        the deadline as well, so it is not called once the deadline is exceeded.
 
         :param prev_result: result of the previous chain.
+        :param deadline: ``time.monotonic()`` value after which the step is cancelled.
         :return: result of the current chain.
         """
+        with self._step() as step:
+            step.result = await self._execute(prev_result, deadline)
+        return step.result
+
+    async def _execute(
+        self, prev_result: Optional[ChainResult], deadline: Optional[float]
+    ) -> ChainResult:
+        """
+        Execute the chain without recording its timings.
+        """
+        next_kwargs = prev_result.next_kwargs if prev_result else None
         try:
-            execution_kwargs = {**(self.kwargs or {})}
-            if prev_result and prev_result.next_kwargs:
-                execution_kwargs.update(prev_result.next_kwargs)
+            try:
+                result = await self._attempt(next_kwargs, deadline)
+            except Exception:
+                if self.fallback is None:
+                    raise
+                result = await self._run_within(
+                    next_kwargs, self._step_timeout(deadline), self.fallback
+                )
+            return self._to_result(result)
+        except Exception as e:
+            return ChainResult(success=False, data=None, error=str(e), next_kwargs=None)
 
-            result = self.method(**execution_kwargs)
-            if asyncio.iscoroutine(result):
-                result = await result
+    def execute_sync(
+        self,
+        prev_result: Optional[ChainResult] = None,
+        deadline: Optional[float] = None,
+    ) -> ChainResult:
+        """
+        Execute the chain synchronously. The method must not be async.
+        Running sync calls can not be cancelled, so ``timeout`` is not supported
+        (use timeout of HTTP client) and ``deadline`` is only checked before
+        each attempt and before the fallback.
 
-            next_kwargs = self.prepare_next(result) if self.prepare_next else {}
+        :param prev_result: result of the previous chain.
+        :param deadline: ``time.monotonic()`` value after which no attempts are made.
+        :return: result of the current chain.
+        :raises ValueError: if the chain has ``timeout``.
+        """
+        self._check_sync()
+        with self._step() as step:
+            step.result = self._execute_sync(prev_result, deadline)
+        return step.result
 
-            return ChainResult(
-                success=result.get("success", False),
-                data=result.get("data"),
-                error=None,
-                next_kwargs=next_kwargs,
-            )
+    def _execute_sync(
+        self, prev_result: Optional[ChainResult], deadline: Optional[float]
+    ) -> ChainResult:
+        """
+        Sync version of ``_execute``.
+        """
+        next_kwargs = prev_result.next_kwargs if prev_result else None
+        try:
+            try:
+                result = self._attempt_sync(next_kwargs, deadline)
+            except Exception:
+                if self.fallback is None:
+                    raise
+                self._step_timeout(deadline)
+                result = self._run_sync(next_kwargs, self.fallback)
+            return self._to_result(result)
         except Exception as e:
             return ChainResult(success=False, data=None, error=str(e), next_kwargs=None)
 
+    def _check_sync(self) -> None:
+        """
+        Check that the chain can be executed synchronously.
+
+        :raises ValueError: if the chain has ``timeout``, which can not be enforced.
+        """
+        if self.timeout is not None:
+            raise ValueError(
+                f"Timeout of {self.display_name} can not be enforced in sync mode, "
+                f"use timeout of HTTP client instead"
+            )
+
+    @property
+    def display_name(self) -> str:
+        """
+        Name of the chain used in traces: explicit name or name of the method.
+        """
+        return self.name or str(getattr(self.method, "__name__", type(self).__name__))
+
+    @contextmanager
+    def _step(self) -> Iterator["_StepRecord"]:
+        """
+        Record timings, attempts and cache hits of the step into its result and trace.
+        """
+        record = _StepRecord()
+        token = _current_step.set(record.stats)
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            with _span(self.display_name) as span:
+                yield record
+                if record.result is not None:
+                    record.result.name = self.name
+                    record.result.started_at = started_at
+                    record.result.duration = time.perf_counter() - start
+                    record.result.attempts = record.stats.attempts
+                    record.result.cached = (
+                        record.stats.cache_hits > 0 and record.stats.calls == 0
+                    )
+                    if span is not None:
+                        span.success = record.result.success
+                        span.error = record.result.error
+                        span.attempts = record.result.attempts
+                        span.cached = record.result.cached
+        finally:
+            _current_step.reset(token)
+
+    def _step_timeout(self, deadline: Optional[float]) -> Optional[float]:
+        """
+        Calculate timeout of the next attempt from step timeout and chain deadline.
+
+        :param deadline: ``time.monotonic()`` value of chain deadline.
+        :return: timeout in seconds or ``None`` for no timeout.
+        :raises TimeoutError: if the deadline is already exceeded.
+        """
+        if deadline is None:
+            return self.timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Chain deadline exceeded")
+        return remaining if self.timeout is None else min(self.timeout, remaining)
+
+    async def _attempt(
+        self, next_kwargs: Optional[NextKwargs], deadline: Optional[float]
+    ) -> Any:
+        """
+        Run the step, retrying on errors and timeouts.
+
+        :param next_kwargs: kwargs prepared by the previous chain.
+        :param deadline: ``time.monotonic()`` value of chain deadline.
+        :return: response of the method.
+        """
+        stats = _current_step.get()
+        for attempt in range(self.retries + 1):
+            timeout = self._step_timeout(deadline)
+            if stats:
+                stats.attempts += 1
+            try:
+                return await self._run_within(next_kwargs, timeout)
+            except Exception as e:
+                if attempt == self.retries:
+                    raise
+                _emit_client_event(self.method, ON_RETRY, e, attempt + 2)
+
+    async def _run_within(
+        self,
+        next_kwargs: Optional[NextKwargs],
+        timeout: Optional[float],
+        method: Optional[Callable] = None,
+    ) -> Any:
+        """
+        Run the step, cancelling it after the timeout.
+
+        :param next_kwargs: kwargs prepared by the previous chain.
+        :param timeout: timeout in seconds or ``None`` for no timeout.
+        :param method: method to call instead of the chain method (e.g. fallback).
+        :return: response of the method.
+        :raises TimeoutError: if the step timed out.
+        """
+        if timeout is None:
+            return await self._run(next_kwargs, method)
+        try:
+            return await asyncio.wait_for(self._run(next_kwargs, method), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Step timed out after {timeout:.3g}s")
+
+    def _attempt_sync(
+        self, next_kwargs: Optional[NextKwargs], deadline: Optional[float]
+    ) -> Any:
+        """
+        Sync version of ``_attempt``.
+        """
+        stats = _current_step.get()
+        for attempt in range(self.retries + 1):
+            self._step_timeout(deadline)
+            if stats:
+                stats.attempts += 1
+            try:
+                return self._run_sync(next_kwargs)
+            except Exception as e:
+                if attempt == self.retries:
+                    raise
+                _emit_client_event(self.method, ON_RETRY, e, attempt + 2)
+
+    def _to_result(self, result: Any) -> ChainResult:
+        """
+        Convert response of the method into chain result.
+
+        :param result: response of the method.
+        :return: result of the current chain.
+        """
+        next_kwargs = self.prepare_next(result) if self.prepare_next else {}
+        return ChainResult(
+            success=result.get("success", False),
+            data=result.get("data"),
+            error=None,
+            next_kwargs=next_kwargs,
+        )
+
+    def _resolve_kwargs(self, next_kwargs: Optional[Kwargs]) -> Kwargs:
+        """
+        Merge own kwargs with kwargs prepared by the previous chain.
+
+        :param next_kwargs: kwargs prepared by the previous chain.
+        :return: kwargs to call the method with.
+        """
+        if isinstance(next_kwargs, list):
+            raise TypeError(
+                "Chain received a list of kwargs, use FanOut to map over it"
+            )
+        execution_kwargs = {**(self.kwargs or {})}
+        if next_kwargs:
+            execution_kwargs.update(next_kwargs)
+        return execution_kwargs
+
+    async def _call(
+        self, execution_kwargs: Kwargs, method: Optional[Callable] = None
+    ) -> Any:
+        """
+        Call the method, awaiting the result if the method is async.
+
+        :param execution_kwargs: kwargs to call the method with.
+        :param method: method to call instead of the chain method (e.g. fallback).
+        :return: response of the method.
+        """
+        key = self._cache_key(execution_kwargs, method)
+        hit, cached = self._cache_lookup(key)
+        if hit:
+            return cached
+        result = (method or self.method)(**execution_kwargs)
+        if asyncio.iscoroutine(result):
+            result = await result
+        self._cache_store(key, result)
+        return result
+
+    def _call_sync(
+        self, execution_kwargs: Kwargs, method: Optional[Callable] = None
+    ) -> Any:
+        """
+        Call the method synchronously.
+
+        :param execution_kwargs: kwargs to call the method with.
+        :param method: method to call instead of the chain method (e.g. fallback).
+        :return: response of the method.
+        :raises TypeError: if the method is async.
+        """
+        key = self._cache_key(execution_kwargs, method)
+        hit, cached = self._cache_lookup(key)
+        if hit:
+            return cached
+        result = (method or self.method)(**execution_kwargs)
+        if asyncio.iscoroutine(result):
+            result.close()
+            raise TypeError("Async method can not be executed synchronously")
+        self._cache_store(key, result)
+        return result
+
+    def _cache_key(
+        self, execution_kwargs: Kwargs, method: Optional[Callable]
+    ) -> Optional[str]:
+        """
+        Build cache key for the call, if caching applies to it.
+        Fallback calls are never cached.
+
+        :param execution_kwargs: kwargs to call the method with.
+        :param method: method to call instead of the chain method.
+        :return: cache key or ``None``.
+        """
+        if self.cache is None or method is not None:
+            return None
+        return self.cache.make_key(self.method, execution_kwargs)
+
+    def _cache_lookup(self, key: Optional[str]) -> Tuple[bool, Any]:
+        """
+        Look up response in cache, counting calls and cache hits of the current step.
+
+        :param key: cache key (``None`` if caching does not apply).
+        :return: whether the key was found and the cached response.
+        """
+        hit, cached = (
+            self.cache.get(key)  # type: ignore[union-attr]
+            if key is not None
+            else (False, None)
+        )
+        stats = _current_step.get()
+        if stats:
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.calls += 1
+        if hit:
+            _emit_client_event(self.method, ON_CACHE_HIT)
+        return hit, cached
+
+    def _cache_store(self, key: Optional[str], result: Any) -> None:
+        """
+        Store successful response in cache.
+
+        :param key: cache key (``None`` if caching does not apply).
+        :param result: response of the method.
+        """
+        if key is not None and isinstance(result, Mapping) and result.get("success"):
+            self.cache.set(key, result)  # type: ignore[union-attr]
+
+    async def _run(
+        self, next_kwargs: Optional[NextKwargs], method: Optional[Callable] = None
+    ) -> Any:
+        """
+        Produce response of the chain from kwargs prepared by the previous chain.
+
+        :param next_kwargs: kwargs prepared by the previous chain.
+        :param method: method to call instead of the chain method (e.g. fallback).
+        :return: response of the method.
+        """
+        execution_kwargs = self._resolve_kwargs(next_kwargs)  # type: ignore[arg-type]
+        return await self._call(execution_kwargs, method)
+
+    def _run_sync(
+        self, next_kwargs: Optional[NextKwargs], method: Optional[Callable] = None
+    ) -> Any:
+        """
+        Sync version of ``_run``.
+        """
+        execution_kwargs = self._resolve_kwargs(next_kwargs)  # type: ignore[arg-type]
+        return self._call_sync(execution_kwargs, method)
+
     def __or__(self, other: "Chain") -> "ChainExecutor":
         """
         Create a chain executor with the current chain and another chain.
@@ -67,9 +705,212 @@ class Chain:
         return ChainExecutor([self, other])
 
 
+def _reduce_responses(responses: List[Any]) -> Dict[str, Any]:
+    """
+    Default reduce step of ``FanOut``: succeeds only if every call succeeded.
+
+    :param responses: responses of all calls.
+    :return: response-like dict with list of data of every call.
+    """
+    return {
+        "success": all(response.get("success", False) for response in responses),
+        "data": [response.get("data") for response in responses],
+    }
+
+
+@dataclass
+class FanOut(Chain):
+    """
+    Chain step that maps a list of kwargs prepared by the previous chain
+    into concurrent calls of the method, at most ``concurrency`` at a time
+    (via thread pool when executed synchronously).
+    Responses are combined by ``reduce`` (in order of the input list) into a single
+    response-like dict, which is then handled as a response of a regular chain.
+    """
+
+    concurrency: int = 10
+    reduce: Optional[Callable[[List[Any]], Dict[str, Any]]] = None
+
+    async def _execute(
+        self, prev_result: Optional[ChainResult], deadline: Optional[float]
+    ) -> ChainResult:
+        """
+        Execute the chain, sharing ``concurrency`` slots between the retries
+        and the fallback.
+        """
+        token = _fan_out_slots.set(asyncio.Semaphore(max(self.concurrency, 1)))
+        try:
+            return await super()._execute(prev_result, deadline)
+        finally:
+            _fan_out_slots.reset(token)
+
+    async def _run(
+        self, next_kwargs: Optional[NextKwargs], method: Optional[Callable] = None
+    ) -> Any:
+        """
+        Call the method once for each item of kwargs prepared by the previous chain.
+        When a call fails (or the step is cancelled), the rest are cancelled and
+        awaited, so no call outlives the step.
+
+        :param next_kwargs: list of kwargs prepared by the previous chain.
+        :param method: method to call instead of the chain method (e.g. fallback).
+        :return: reduced response.
+        """
+        semaphore = _fan_out_slots.get() or asyncio.Semaphore(max(self.concurrency, 1))
+
+        async def call(index: int, item: Kwargs) -> Any:
+            async with semaphore:
+                with _span(f"{self.display_name}[{index}]") as span:
+                    response = await self._call(self._resolve_kwargs(item), method)
+                    if span is not None:
+                        span.success = bool(response.get("success"))
+                    return response
+
+        tasks = [
+            asyncio.ensure_future(call(index, item))
+            for index, item in enumerate(self._items(next_kwargs))
+        ]
+        try:
+            responses = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return (self.reduce or _reduce_responses)(list(responses))
+
+    def _run_sync(
+        self, next_kwargs: Optional[NextKwargs], method: Optional[Callable] = None
+    ) -> Any:
+        """
+        Sync version of ``_run``.
+        """
+
+        def call(index: int, item: Kwargs) -> Any:
+            with _span(f"{self.display_name}[{index}]") as span:
+                response = self._call_sync(self._resolve_kwargs(item), method)
+                if span is not None:
+                    span.success = bool(response.get("success"))
+                return response
+
+        items = self._items(next_kwargs)
+        with ThreadPoolExecutor(max_workers=max(self.concurrency, 1)) as pool:
+            futures = [
+                pool.submit(_in_context(call), index, item)
+                for index, item in enumerate(items)
+            ]
+            responses = [future.result() for future in futures]
+        return (self.reduce or _reduce_responses)(responses)
+
+    @staticmethod
+    def _items(next_kwargs: Optional[NextKwargs]) -> List[Kwargs]:
+        """
+        Normalize kwargs prepared by the previous chain into a list.
+        """
+        if next_kwargs is None:
+            return []
+        if isinstance(next_kwargs, dict):
+            return [next_kwargs]
+        return next_kwargs
+
+
+@dataclass
+class MapResult:
+    """
+    Results of chains executed for a single input of ``ChainExecutor.map``.
+    """
+
+    input: Kwargs
+    results: List[ChainResult]
+    success: bool
+
+
+async def _as_async_iterator(items: Iterable[T]) -> AsyncIterator[T]:
+    """
+    Wrap a regular iterable into async iterator.
+    """
+    for item in items:
+        yield item
+
+
+@contextmanager
+def _trace_run(trace: Optional[ChainTrace]) -> Iterator[Optional[ChainSpan]]:
+    """
+    Record span of the whole executor run into the given trace
+    (or into the current one, when executor runs inside a traced chain).
+
+    :param trace: trace to record into.
+    :return: span of the run or ``None`` when tracing is off.
+    """
+    token = _current_trace.set((trace, None)) if trace is not None else None
+    try:
+        with _span("ChainExecutor") as span:
+            yield span
+    finally:
+        if token is not None:
+            _current_trace.reset(token)
+
+
+def _finish_run_span(
+    span: Optional[ChainSpan], results: List[ChainResult], chains_count: int
+) -> None:
+    """
+    Mark span of the executor run as successful if every chain succeeded.
+    """
+    if span is not None:
+        span.success = len(results) == chains_count and all(
+            result.success for result in results
+        )
+
+
+def _prepare_prev(
+    prev_results: List[Optional[ChainResult]], initial_result: Optional[ChainResult]
+) -> Tuple[bool, Optional[ChainResult]]:
+    """
+    Decide whether a chain can run and build its previous result.
+
+    :param prev_results: results of dependencies (``None`` for skipped ones).
+    :param initial_result: result to pass to chains without dependencies.
+    :return: whether the chain can run and its previous result.
+    """
+    if any(result is None or not result.success for result in prev_results):
+        return False, None
+    if not prev_results:
+        return True, initial_result
+    return True, _join_results(prev_results)  # type: ignore[arg-type]
+
+
+def _join_results(results: List[ChainResult]) -> ChainResult:
+    """
+    Join results of several chains into a single result for the dependent chain.
+    ``next_kwargs`` are merged in order of dependencies. A list of kwargs can not
+    be merged, it is passed on as is and fails the dependent chain.
+
+    :param results: results of dependencies.
+    :return: joined result.
+    """
+    if len(results) == 1:
+        return results[0]
+    data = [result.data for result in results]
+    next_kwargs: Kwargs = {}
+    for result in results:
+        if isinstance(result.next_kwargs, list):
+            return ChainResult(
+                success=True, data=data, error=None, next_kwargs=result.next_kwargs
+            )
+        next_kwargs.update(result.next_kwargs or {})
+    return ChainResult(success=True, data=data, error=None, next_kwargs=next_kwargs)
+
+
 class ChainExecutor:
     """
-    Chain executor that executes multiple chains in a sequence.
+    Chain executor that executes multiple chains.
+
+    By default each chain depends on the previous one, so chains run in a sequence.
+    Chains can declare ``depends_on`` with names of other chains (empty list for
+    no dependencies); independent chains then run concurrently and results of
+    all dependencies are joined into ``next_kwargs`` of the dependent chain.
+    Use ``execute_async`` with async client and ``execute_sync`` with sync client.
     """
 
     def __init__(self, chains: Optional[List[Chain]] = None):
@@ -85,20 +926,275 @@ class ChainExecutor:
         self.chains.append(chain)
         return self
 
-    async def execute_async(self) -> List[ChainResult]:
+    def _dependencies(self) -> List[List[int]]:
+        """
+        Resolve dependencies of each chain into indexes of other chains.
+
+        :return: list of dependency indexes for each chain.
+        :raises ValueError: if names are duplicated or dependency is unknown.
+        """
+        names: Dict[str, int] = {}
+        for index, chain in enumerate(self.chains):
+            if chain.name is None:
+                continue
+            if chain.name in names:
+                raise ValueError(f"Duplicate chain name: {chain.name}")
+            names[chain.name] = index
+
+        dependencies = []
+        for index, chain in enumerate(self.chains):
+            if chain.depends_on is None:
+                dependencies.append([index - 1] if index else [])
+                continue
+            unknown = [name for name in chain.depends_on if name not in names]
+            if unknown:
+                raise ValueError(f"Unknown chain dependencies: {', '.join(unknown)}")
+            dependencies.append([names[name] for name in chain.depends_on])
+        return dependencies
+
+    def _topological_order(self, dependencies: List[List[int]]) -> List[int]:
+        """
+        Order chains so that every chain goes after its dependencies.
+
+        :param dependencies: list of dependency indexes for each chain.
+        :return: ordered chain indexes.
+        :raises ValueError: if dependencies are cyclic or a ``FanOut`` has
+            several dependencies (its list input can not be joined).
+        """
+        for chain, deps in zip(self.chains, dependencies):
+            if isinstance(chain, FanOut) and len(deps) > 1:
+                raise ValueError(
+                    f"FanOut input must be prepared by a single chain: "
+                    f"{chain.display_name}"
+                )
+        order: List[int] = []
+        done: Set[int] = set()
+        while len(order) < len(dependencies):
+            ready = [
+                index
+                for index, deps in enumerate(dependencies)
+                if index not in done and all(dep in done for dep in deps)
+            ]
+            if not ready:
+                raise ValueError("Chain dependencies are cyclic")
+            order.extend(ready)
+            done.update(ready)
+        return order
+
+    async def execute_async(
+        self,
+        initial_kwargs: Optional[Kwargs] = None,
+        budget: Optional[float] = None,
+        trace: Optional[ChainTrace] = None,
+    ) -> List[ChainResult]:
         """
         Execute all chains in the chain executor asynchronously.
+        Each chain starts as soon as all its dependencies succeed; chains that
+        depend on a failed chain are skipped.
 
-        :return: list of results of each chain execution
+        :param initial_kwargs: kwargs passed to chains without dependencies.
+        :param budget: overall time limit in seconds; steps still running when
+            it is spent are cancelled and fail with timeout.
+        :param trace: trace to record spans of the execution into.
+        :return: list of results of each executed chain, in order of declaration.
         """
-        results = []
-        prev_result = None
+        with _trace_run(trace) as span:
+            results = await self._execute_async(initial_kwargs, budget)
+            _finish_run_span(span, results, len(self.chains))
+        return results
 
-        for chain in self.chains:
-            result = await chain.execute(prev_result)
-            results.append(result)
-            if not result.success:
-                break
-            prev_result = result
+    async def _execute_async(
+        self, initial_kwargs: Optional[Kwargs], budget: Optional[float]
+    ) -> List[ChainResult]:
+        """
+        Execute all chains asynchronously without tracing the run.
+        """
+        deadline = self._deadline(budget)
+        dependencies = self._dependencies()
+        initial_result = self._initial_result(initial_kwargs)
+        tasks: Dict[int, "asyncio.Task[Optional[ChainResult]]"] = {}
+
+        async def run(index: int) -> Optional[ChainResult]:
+            prev_results = [await tasks[dep] for dep in dependencies[index]]
+            runnable, prev_result = _prepare_prev(prev_results, initial_result)
+            if not runnable:
+                return None
+            return await self.chains[index].execute(prev_result, deadline)
+
+        for index in self._topological_order(dependencies):
+            tasks[index] = asyncio.ensure_future(run(index))
+        results = await asyncio.gather(*(tasks[i] for i in range(len(self.chains))))
+        return [result for result in results if result is not None]
 
+    def execute_sync(
+        self,
+        initial_kwargs: Optional[Kwargs] = None,
+        max_workers: Optional[int] = None,
+        budget: Optional[float] = None,
+        trace: Optional[ChainTrace] = None,
+    ) -> List[ChainResult]:
+        """
+        Execute all chains synchronously, calling sync methods directly without event loop.
+        By default chains run one by one in order of dependencies. With ``max_workers``
+        independent chains run concurrently in a thread pool.
+
+        :param initial_kwargs: kwargs passed to chains without dependencies.
+        :param max_workers: size of thread pool for parallel branches.
+        :param budget: overall time limit in seconds; steps not started
+            before it is spent fail with timeout.
+        :param trace: trace to record spans of the execution into.
+        :return: list of results of each executed chain, in order of declaration.
+        :raises ValueError: if any chain has ``timeout`` (see ``Chain.execute_sync``).
+        """
+        with _trace_run(trace) as span:
+            results = self._execute_sync(initial_kwargs, max_workers, budget)
+            _finish_run_span(span, results, len(self.chains))
         return results
+
+    def _execute_sync(
+        self,
+        initial_kwargs: Optional[Kwargs],
+        max_workers: Optional[int],
+        budget: Optional[float],
+    ) -> List[ChainResult]:
+        """
+        Execute all chains synchronously without tracing the run.
+        """
+        deadline = self._deadline(budget)
+        dependencies = self._dependencies()
+        order = self._topological_order(dependencies)
+        for chain in self.chains:
+            chain._check_sync()
+        initial_result = self._initial_result(initial_kwargs)
+        results: Dict[int, Optional[ChainResult]] = {}
+
+        if not max_workers:
+            for index in order:
+                prev_results = [results[dep] for dep in dependencies[index]]
+                runnable, prev_result = _prepare_prev(prev_results, initial_result)
+                results[index] = (
+                    self.chains[index].execute_sync(prev_result, deadline)
+                    if runnable
+                    else None
+                )
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                running: Dict["Future[ChainResult]", int] = {}
+                while order or running:
+                    for index in list(order):
+                        if not all(dep in results for dep in dependencies[index]):
+                            continue
+                        order.remove(index)
+                        prev_results = [results[dep] for dep in dependencies[index]]
+                        runnable, prev_result = _prepare_prev(
+                            prev_results, initial_result
+                        )
+                        if not runnable:
+                            results[index] = None
+                            continue
+                        future = pool.submit(
+                            _in_context(self.chains[index].execute_sync),
+                            prev_result,
+                            deadline,
+                        )
+                        running[future] = index
+                    if not running:
+                        continue
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[running.pop(future)] = future.result()
+
+        ordered = [results.get(index) for index in range(len(self.chains))]
+        return [result for result in ordered if result is not None]
+
+    @staticmethod
+    def _deadline(budget: Optional[float]) -> Optional[float]:
+        """
+        Convert time budget into ``time.monotonic()`` deadline.
+        """
+        if budget is None:
+            return None
+        if budget <= 0:
+            raise ValueError("Budget must be positive")
+        return time.monotonic() + budget
+
+    @staticmethod
+    def _initial_result(initial_kwargs: Optional[Kwargs]) -> Optional[ChainResult]:
+        """
+        Wrap initial kwargs into result passed to chains without dependencies.
+        """
+        if initial_kwargs is None:
+            return None
+        return ChainResult(
+            success=True, data=None, error=None, next_kwargs=initial_kwargs
+        )
+
+    async def _execute_for(
+        self,
+        initial_kwargs: Kwargs,
+        budget: Optional[float],
+        trace: Optional[ChainTrace],
+    ) -> MapResult:
+        """
+        Execute chains for a single input of ``map``.
+
+        :param initial_kwargs: kwargs passed to chains without dependencies.
+        :param budget: time limit in seconds for the execution.
+        :param trace: trace to record spans of the execution into.
+        :return: results tagged with the input.
+        """
+        results = await self.execute_async(initial_kwargs, budget, trace)
+        return MapResult(
+            input=initial_kwargs,
+            results=results,
+            success=len(results) == len(self.chains)
+            and all(result.success for result in results),
+        )
+
+    async def map(
+        self,
+        inputs: Union[Iterable[Kwargs], AsyncIterable[Kwargs]],
+        concurrency: int = 10,
+        budget: Optional[float] = None,
+        trace: Optional[ChainTrace] = None,
+    ) -> AsyncIterator[MapResult]:
+        """
+        Execute the chains for each of the inputs, running at most ``concurrency``
+        pipelines at a time. Inputs are consumed lazily, so they may come from
+        a (possibly endless) generator or async iterator.
+
+        :param inputs: initial kwargs for each execution.
+        :param concurrency: maximum number of pipelines in flight.
+        :param budget: time limit in seconds for each execution.
+        :param trace: trace to record spans of all executions into.
+        :return: async iterator of results, yielded as soon as each execution completes.
+        """
+        self._topological_order(self._dependencies())
+        if isinstance(inputs, AsyncIterable):
+            iterator: AsyncIterator[Kwargs] = inputs.__aiter__()
+        else:
+            iterator = _as_async_iterator(inputs)
+        pending: Set["asyncio.Future[MapResult]"] = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max(concurrency, 1):
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(
+                        asyncio.ensure_future(self._execute_for(item, budget, trace))
+                    )
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
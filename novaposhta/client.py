@@ -1,9 +1,41 @@
 """Client for Nova Poshta API. """
 
-from typing import Final, Optional, Type, TypeVar
+import asyncio
+import pickle
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Coroutine,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import httpx
 
+from .hooks import (
+    AFTER_RESPONSE,
+    BEFORE_REQUEST,
+    HOOK_EVENTS,
+    ON_ERROR,
+    Hook,
+    RequestInfo,
+)
+from .metrics import MetricsRegistry
 from .models.additional_service import AdditionalService
 from .models.address import Address
 from .models.base import BaseModel
@@ -13,11 +45,18 @@ from .models.counterparty import Counterparty
 from .models.internet_document import InternetDocument
 from .models.scan_sheet import ScanSheet
 from .models.tracking_document import TrackingDocument
-from .types import DictStrAny, HttpRequest, MaybeAsync, RequestData, RequestSender
+from .profiling import CHECK_ERRORS, DECODE, ENCODE, NETWORK, Profiler, measure
+from .responses import LazyResponse, RawResponse, leading_success
+from .serializers import Serializer, get_serializer
+from .streaming import AsyncItemStream, ItemStream, SyncItemStream
+from .types import DictStrAny, HttpRequest, MaybeAsync, RequestSender
 
 HEADERS: Final[dict[str, str]] = {"Content-Type": "application/json"}
 API_DEFAULT_ENDPOINT: Final[str] = "https://api.novaposhta.ua/v2.0/json/"
 DEFAULT_TIMEOUT: Final[int] = 10
+DEFAULT_STREAM_CHUNK_SIZE: Final[int] = 64 * 1024
+# Bytes of a downloaded body to look at before writing it, to tell API errors from data.
+DOWNLOAD_HEAD_SIZE: Final[int] = 64
 
 BaseModelType = TypeVar("BaseModelType", bound=BaseModel)
 
@@ -42,16 +81,33 @@ class NovaPoshtaApi:
         timeout: int = 10,
         raise_for_errors: bool = False,
         async_mode: bool = False,
+        serializer: Union[str, Serializer, None] = None,
+        decode_offload_threshold: Optional[int] = None,
+        decode_executor: Optional[Executor] = None,
+        lazy_responses: bool = False,
     ):
         """
         Initialize Nova Poshta API client.
 
         :param api_key: API key from Nova Poshta.
         :param api_endpoint: API endpoint to use.
-        :param http_client: HTTP client to use. Defaults to httpx.
+        :param http_client: HTTP client to use. Defaults to httpx. Its clients must
+            accept pre-encoded bodies as ``post(..., content=bytes)`` and expose
+            ``response.content`` (see README).
         :param timeout: Timeout for HTTP requests.
         :param raise_for_errors: Whether to check and raise errors as exceptions.
         :param async_mode: Whether to use async mode.
+        :param serializer: JSON serializer or its name (``orjson``, ``msgspec``, ``json``).
+            Defaults to the fastest installed one.
+        :param decode_offload_threshold: size of response body in bytes from which
+            async mode decodes it in ``decode_executor`` instead of the event loop.
+            ``None`` (default) always decodes on the loop.
+        :param decode_executor: executor for decoding large responses, required with
+            ``decode_offload_threshold``. Decoders hold the GIL, so only a
+            ``ProcessPoolExecutor`` (with a picklable serializer) keeps the loop free.
+            Serializers that can not be pickled are rejected with ``ValueError``.
+        :param lazy_responses: return ``LazyResponse`` mappings that parse the body
+            only as far as it is read, instead of dicts (never offloaded).
         """
         if not api_key:
             raise ValueError("API key is required")
@@ -59,6 +115,8 @@ class NovaPoshtaApi:
             raise ValueError("Timeout must be positive")
         if not api_endpoint or not api_endpoint.startswith(("http://", "https://")):
             raise ValueError("Invalid API endpoint URL")
+        if decode_offload_threshold is not None and decode_executor is None:
+            raise ValueError("decode_offload_threshold requires decode_executor")
 
         self.api_key = api_key
         self.api_endpoint = api_endpoint
@@ -74,59 +132,695 @@ class NovaPoshtaApi:
                 timeout=timeout
             )
             self._send = self._send_sync
-            self._send = self._send_sync
         self.raise_for_errors = raise_for_errors
         self.async_mode = async_mode
         self._models_pool: DictStrAny = {}
+        self._models_lock = threading.Lock()
+        self._hooks: Dict[str, List[Hook]] = {}
+        self.metrics: Optional[MetricsRegistry] = None
+        self.profiler: Optional[Profiler] = None
+        self.serializer = get_serializer(serializer)
+        if isinstance(decode_executor, ProcessPoolExecutor):
+            try:
+                pickle.dumps(self.serializer.loads)
+            except Exception as e:
+                raise ValueError(
+                    f"Serializer {self.serializer.name} can not be pickled "
+                    f"to decode in ProcessPoolExecutor"
+                ) from e
+        self._body_prefixes: Dict[Tuple[str, str, str], bytes] = {}
+        self.decode_offload_threshold = decode_offload_threshold
+        self.decode_executor = decode_executor
+        self.lazy_responses = lazy_responses
+        self._loads: Callable[[bytes], Any] = (
+            LazyResponse if lazy_responses else self.serializer.loads
+        )
+
+    def add_hook(self, event: str, hook: Hook) -> None:
+        """
+        Register a hook for a request lifecycle event.
+
+        Client emits ``before_request``, ``after_response`` and ``on_error``;
+        ``on_retry`` and ``on_cache_hit`` are emitted by layers that retry
+        or cache calls (e.g. chains).
+
+        :param event: name of the event (see ``novaposhta.hooks.HOOK_EVENTS``).
+        :param hook: callable that receives ``RequestInfo``.
+        """
+        if event not in HOOK_EVENTS:
+            raise ValueError(f"Unknown hook event: {event}")
+        self._hooks.setdefault(event, []).append(hook)
+
+    def remove_hook(self, event: str, hook: Hook) -> None:
+        """
+        Unregister a hook.
+
+        :param event: name of the event.
+        :param hook: previously registered hook.
+        """
+        hooks = self._hooks.get(event, [])
+        if hook in hooks:
+            hooks.remove(hook)
+        if not hooks:
+            self._hooks.pop(event, None)
+
+    def enable_metrics(
+        self, registry: Optional[MetricsRegistry] = None
+    ) -> MetricsRegistry:
+        """
+        Start collecting in-process metrics of requests made by this client.
+        Registry enabled before is detached and replaced, unless it is passed again.
+
+        :param registry: registry to collect into (new one by default).
+        :return: registry with collected metrics.
+        """
+        if registry is not None and registry is self.metrics:
+            return registry
+        self.disable_metrics()
+        self.metrics = (registry or MetricsRegistry()).attach(self)
+        return self.metrics
+
+    def disable_metrics(self) -> Optional[MetricsRegistry]:
+        """
+        Stop collecting metrics of requests made by this client.
+
+        :return: registry with collected metrics, if metrics were enabled.
+        """
+        registry, self.metrics = self.metrics, None
+        if registry:
+            registry.detach(self)
+        return registry
+
+    def enable_profiling(
+        self, profiler: Optional[Profiler] = None, trace_allocations: bool = True
+    ) -> Profiler:
+        """
+        Start measuring time and allocations of client-side phases of every call.
+
+        Profiler enabled before is stopped and replaced, unless it is passed again.
+
+        :param profiler: profiler to collect into (new one by default).
+        :param trace_allocations: whether to measure allocations via ``tracemalloc``.
+        :return: profiler with collected measurements.
+        """
+        if profiler is not None and profiler is self.profiler:
+            return profiler
+        self.disable_profiling()
+        self.profiler = (profiler or Profiler(trace_allocations)).start()
+        return self.profiler
 
-    def _send_sync(self, request: HttpRequest) -> DictStrAny:
+    def disable_profiling(self) -> Optional[Profiler]:
+        """
+        Stop profiling calls of this client.
+
+        :return: profiler with collected measurements, if profiling was enabled.
+        """
+        profiler, self.profiler = self.profiler, None
+        if profiler:
+            profiler.stop()
+        return profiler
+
+    def emit(self, event: str, info: RequestInfo) -> None:
+        """
+        Call all hooks registered for the event.
+
+        :param event: name of the event.
+        :param info: information about the call.
+        """
+        for hook in self._hooks.get(event, ()):
+            hook(info)
+
+    def _send_sync(self, content: bytes) -> DictStrAny:
         """
         Sends sync request to the API.
 
-        :param request: request dict.
+        :param content: request body.
         :return: response dict.
         """
         if not self.sync_http_client:
             raise ValueError("Sync client is not initialized")
-        response = self.sync_http_client.post(**request)
-        return self._maybe_check_errors(response.json())
+        response = self.sync_http_client.post(
+            self.api_endpoint, headers=HEADERS, content=content, timeout=self.timeout
+        )
+        return self._maybe_check_errors(self._loads(response.content))
 
-    async def _send_async(self, request: HttpRequest) -> DictStrAny:
+    async def _send_async(self, content: bytes) -> DictStrAny:
         """
         Sends async request to the API.
 
-        :param request: request dict.
+        :param content: request body.
         :return: response dict.
         """
         if not self.async_http_client:
             raise ValueError("Async client is not initialized")
-        response: httpx.Response = await self.async_http_client.post(**request)
-        return self._maybe_check_errors(response.json())
+        response: httpx.Response = await self.async_http_client.post(
+            self.api_endpoint, headers=HEADERS, content=content, timeout=self.timeout
+        )
+        return self._maybe_check_errors(await self._decode_async(response.content))
+
+    def _send_raw_sync(self, content: bytes) -> RawResponse:
+        """
+        Sends sync request to the API without decoding the response.
+
+        :param content: request body.
+        :return: raw response.
+        """
+        if not self.sync_http_client:
+            raise ValueError("Sync client is not initialized")
+        response = self.sync_http_client.post(
+            self.api_endpoint, headers=HEADERS, content=content, timeout=self.timeout
+        )
+        return self._maybe_check_raw(self._raw(response))
+
+    async def _send_raw_async(self, content: bytes) -> RawResponse:
+        """
+        Sends async request to the API without decoding the response.
+
+        :param content: request body.
+        :return: raw response.
+        """
+        if not self.async_http_client:
+            raise ValueError("Async client is not initialized")
+        response = await self.async_http_client.post(
+            self.api_endpoint, headers=HEADERS, content=content, timeout=self.timeout
+        )
+        return self._maybe_check_raw(self._raw(response))
+
+    def _raw(self, response: httpx.Response) -> RawResponse:
+        return RawResponse(response.content, response.status_code, self.serializer)
+
+    async def _decode_async(self, content: bytes) -> Any:
+        """
+        Decode response body, moving large bodies to ``decode_executor``
+        if offloading is enabled.
+
+        :param content: response body.
+        :return: decoded body.
+        """
+        threshold = self.decode_offload_threshold
+        if self.lazy_responses or threshold is None or len(content) < threshold:
+            return self._loads(content)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.decode_executor, self.serializer.loads, content
+        )
+
+    def _download_sync(
+        self, request: HttpRequest, sink: BinaryIO, chunk_size: int, skip_lines: int
+    ) -> int:
+        """
+        Streams response body of sync request into the sink.
+
+        :param request: request dict.
+        :param sink: binary file-like object to write to.
+        :param chunk_size: size of chunks to read from network.
+        :param skip_lines: number of leading lines of the body not to write.
+        :return: number of written bytes.
+        """
+        if not self.sync_http_client:
+            raise ValueError("Sync client is not initialized")
+        with self.sync_http_client.stream("POST", **request) as response:
+            chunks = response.iter_bytes(chunk_size)
+            head = b""
+            for chunk in chunks:
+                head += chunk
+                if len(head) >= DOWNLOAD_HEAD_SIZE:
+                    break
+            if self._is_download_error(response, head):
+                self._raise_download_error(response, head + b"".join(chunks))
+            written, skip_lines = _write_chunk(sink, head, skip_lines)
+            for chunk in chunks:
+                size, skip_lines = _write_chunk(sink, chunk, skip_lines)
+                written += size
+        return written
+
+    async def _download_async(
+        self, request: HttpRequest, sink: BinaryIO, chunk_size: int, skip_lines: int
+    ) -> int:
+        """
+        Streams response body of async request into the sink.
+
+        :param request: request dict.
+        :param sink: binary file-like object to write to.
+        :param chunk_size: size of chunks to read from network.
+        :param skip_lines: number of leading lines of the body not to write.
+        :return: number of written bytes.
+        """
+        if not self.async_http_client:
+            raise ValueError("Async client is not initialized")
+        async with self.async_http_client.stream("POST", **request) as response:
+            chunks = response.aiter_bytes(chunk_size)
+            head = b""
+            async for chunk in chunks:
+                head += chunk
+                if len(head) >= DOWNLOAD_HEAD_SIZE:
+                    break
+            if self._is_download_error(response, head):
+                rest = b"".join([chunk async for chunk in chunks])
+                self._raise_download_error(response, head + rest)
+            written, skip_lines = _write_chunk(sink, head, skip_lines)
+            async for chunk in chunks:
+                size, skip_lines = _write_chunk(sink, chunk, skip_lines)
+                written += size
+        return written
+
+    @staticmethod
+    def _is_download_error(response: httpx.Response, head: bytes) -> bool:
+        """
+        Whether a downloaded body is an error instead of data: an HTTP error
+        status or an API response with ``success: false``.
+
+        :param response: streamed response.
+        :param head: first bytes of the body.
+        """
+        return response.is_error or leading_success(head) is False
+
+    def _raise_download_error(self, response: httpx.Response, body: bytes) -> None:
+        """
+        Raise error of a download.
+
+        :param response: streamed response.
+        :param body: whole response body.
+        :raises httpx.HTTPStatusError: on HTTP error status.
+        :raises InvalidAPIKeyError: if API key is invalid.
+        :raises APIRequestError: if any other API error occurs.
+        """
+        response.raise_for_status()
+        self._raise_errors(self.serializer.loads(body))
+
+    def download(
+        self,
+        model_name: str,
+        api_method: str,
+        method_props: DictStrAny,
+        sink: BinaryIO,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        skip_lines: int = 0,
+    ) -> Union[int, Coroutine[Any, Any, int]]:
+        """
+        Sends request to the API and writes raw response body into the sink by chunks,
+        without loading the whole body into memory.
+
+        Nothing is written when the API answers with an error: HTTP errors raise
+        ``httpx.HTTPStatusError`` and API errors (``success: false``) raise
+        ``InvalidAPIKeyError`` or ``APIRequestError`` regardless of
+        ``raise_for_errors``, since there is no response dict to return them in.
+
+        :param model_name: name of the model to use.
+        :param api_method: name of the method to call.
+        :param method_props: properties to pass to the method.
+        :param sink: binary file-like object to write to.
+        :param chunk_size: size of chunks to read from network.
+        :param skip_lines: number of leading lines of the body not to write
+            (e.g. a header repeated by every part of a report).
+        :return: number of written bytes.
+        """
+        if self._hooks or self.profiler is not None:
+            info = RequestInfo(model_name, api_method, method_props)
+            if self.async_mode:
+                return self._download_async_instrumented(
+                    info, sink, chunk_size, skip_lines
+                )
+            return self._download_sync_instrumented(info, sink, chunk_size, skip_lines)
+        request = self._build_request(model_name, api_method, method_props)
+        if self.async_mode:
+            return self._download_async(request, sink, chunk_size, skip_lines)
+        return self._download_sync(request, sink, chunk_size, skip_lines)
+
+    def _download_sync_instrumented(
+        self, info: RequestInfo, sink: BinaryIO, chunk_size: int, skip_lines: int
+    ) -> int:
+        """
+        Streams response body of sync request into the sink, emitting hook events
+        and feeding the profiler if enabled. ``response_size`` of the call is
+        the number of written bytes.
+
+        :param info: information about the call.
+        :param sink: binary file-like object to write to.
+        :param chunk_size: size of chunks to read from network.
+        :param skip_lines: number of leading lines of the body not to write.
+        :return: number of written bytes.
+        """
+        with self._track(info):
+            request = self._build_request_instrumented(info)
+            sent = time.perf_counter()
+            with measure(self.profiler, info.key, NETWORK):
+                written = self._download_sync(request, sink, chunk_size, skip_lines)
+            info.network_time = time.perf_counter() - sent
+            info.response_size = written
+        return written
+
+    async def _download_async_instrumented(
+        self, info: RequestInfo, sink: BinaryIO, chunk_size: int, skip_lines: int
+    ) -> int:
+        """
+        Async version of ``_download_sync_instrumented``.
+        """
+        with self._track(info):
+            request = self._build_request_instrumented(info)
+            sent = time.perf_counter()
+            with measure(self.profiler, info.key, NETWORK):
+                written = await self._download_async(
+                    request, sink, chunk_size, skip_lines
+                )
+            info.network_time = time.perf_counter() - sent
+            info.response_size = written
+        return written
+
+    def stream(
+        self,
+        model_name: str,
+        api_method: str,
+        method_props: DictStrAny,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> ItemStream:
+        """
+        Sends request to the API and parses items of ``data`` while the body is
+        being received, so that memory use does not grow with the response size.
+        The request is sent when iteration starts. Iterate with ``for`` in sync mode
+        and with ``async for`` in async mode. ``success``, ``errors`` and the rest
+        of the response are available on the stream after the last item; with
+        ``raise_for_errors`` API errors are raised at the end of iteration.
+
+        :param model_name: name of the model to use.
+        :param api_method: name of the method to call.
+        :param method_props: properties to pass to the method.
+        :param chunk_size: size of chunks to read from network.
+        :return: iterable of items.
+        """
+        track = None
+        if self._hooks or self.profiler is not None:
+            info = RequestInfo(model_name, api_method, method_props)
+            request = self._build_request_instrumented(info)
+            track = partial(self._track_stream, info)
+        else:
+            request = self._build_request(model_name, api_method, method_props)
+        if self.async_mode:
+            if not self.async_http_client:
+                raise ValueError("Async client is not initialized")
+            client = self.async_http_client
+            return AsyncItemStream(
+                lambda: client.stream("POST", **request),
+                self._maybe_check_errors,
+                chunk_size,
+                track,
+            )
+        if not self.sync_http_client:
+            raise ValueError("Sync client is not initialized")
+        sync_client = self.sync_http_client
+        return SyncItemStream(
+            lambda: sync_client.stream("POST", **request),
+            self._maybe_check_errors,
+            chunk_size,
+            track,
+        )
 
+    @contextmanager
+    def _track_stream(self, info: RequestInfo, stream: ItemStream) -> Iterator[None]:
+        """
+        Emit hook events and feed the profiler while a stream is iterated.
+        ``network`` phase includes parsing of items, which happens while the body
+        is received; ``response_size`` is the number of received bytes.
+
+        :param info: information about the call.
+        :param stream: iterated stream.
+        """
+        with self._track(info):
+            sent = time.perf_counter()
+            try:
+                with measure(self.profiler, info.key, NETWORK):
+                    yield
+            finally:
+                info.network_time = time.perf_counter() - sent
+                info.response_size = stream.received
+
+    @contextmanager
+    def _track(self, info: RequestInfo) -> Iterator[None]:
+        """
+        Emit hook events around a call made outside of ``send`` (downloads and
+        streams). A stream that is closed before its end counts as a successful call.
+
+        :param info: information about the call.
+        """
+        self.emit(BEFORE_REQUEST, info)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            info.error = e
+            info.total_time = time.perf_counter() - start
+            self.emit(ON_ERROR, info)
+            raise
+        except GeneratorExit:
+            info.total_time = time.perf_counter() - start
+            self.emit(AFTER_RESPONSE, info)
+            raise
+        info.total_time = time.perf_counter() - start
+        self.emit(AFTER_RESPONSE, info)
+
+    @overload
     def send(
-        self, model_name: str, api_method: str, method_props: DictStrAny
-    ) -> MaybeAsync:
+        self,
+        model_name: str,
+        api_method: str,
+        method_props: DictStrAny,
+        raw: Literal[False] = False,
+    ) -> MaybeAsync: ...
+
+    @overload
+    def send(
+        self,
+        model_name: str,
+        api_method: str,
+        method_props: DictStrAny,
+        raw: Literal[True],
+    ) -> Union[RawResponse, Coroutine[Any, Any, RawResponse]]: ...
+
+    @overload
+    def send(
+        self,
+        model_name: str,
+        api_method: str,
+        method_props: DictStrAny,
+        raw: bool,
+    ) -> Union[MaybeAsync, RawResponse, Coroutine[Any, Any, RawResponse]]: ...
+
+    def send(
+        self,
+        model_name: str,
+        api_method: str,
+        method_props: DictStrAny,
+        raw: bool = False,
+    ) -> Union[MaybeAsync, RawResponse, Coroutine[Any, Any, RawResponse]]:
         """
         Sends request to the API.
 
         :param model_name: name of the model to use.
         :param api_method: name of the method to call.
         :param method_props: properties to pass to the method.
-        :return: response dict.
+        :param raw: return undecoded response body (``RawResponse``) instead of
+            response dict. Only ``success`` is checked, by scanning the body;
+            the body is decoded only to raise API errors with ``raise_for_errors``.
+        :return: response dict (or raw response).
+        """
+        if self._hooks or self.profiler is not None:
+            info = RequestInfo(model_name, api_method, method_props)
+            if self.async_mode:
+                return self._send_async_instrumented(info, raw)
+            return self._send_sync_instrumented(info, raw)
+        content = self._encode_body(model_name, api_method, method_props)
+        if raw:
+            if self.async_mode:
+                return self._send_raw_async(content)
+            return self._send_raw_sync(content)
+        return self._send(content)
+
+    def _encode_request(self, info: RequestInfo) -> bytes:
+        """
+        Serialize request body, recording its size.
+
+        :param info: information about the call.
+        :return: request body.
+        """
+        body = self._encode_body(info.model_name, info.method, info.method_props)
+        info.request_size = len(body)
+        return body
+
+    def _send_sync_instrumented(self, info: RequestInfo, raw: bool = False) -> Any:
+        """
+        Sends sync request to the API, measuring its phases, emitting hook events
+        and feeding the profiler if enabled.
+
+        :param info: information about the call.
+        :param raw: whether to return undecoded response (``info.response`` stays empty).
+        :return: response dict (or raw response).
+        """
+        if not self.sync_http_client:
+            raise ValueError("Sync client is not initialized")
+        self.emit(BEFORE_REQUEST, info)
+        profiler, key = self.profiler, info.key
+        start = time.perf_counter()
+        try:
+            with measure(profiler, key, ENCODE):
+                body = self._encode_request(info)
+            sent = time.perf_counter()
+            info.serialize_time = sent - start
+            with measure(profiler, key, NETWORK):
+                response = self.sync_http_client.post(
+                    url=self.api_endpoint,
+                    headers=HEADERS,
+                    content=body,
+                    timeout=self.timeout,
+                )
+            received = time.perf_counter()
+            info.network_time = received - sent
+            info.response_size = len(response.content)
+            with measure(profiler, key, DECODE):
+                data: Any = (
+                    self._raw(response) if raw else self._loads(response.content)
+                )
+            info.decode_time = time.perf_counter() - received
+            with measure(profiler, key, CHECK_ERRORS):
+                result: Any = (
+                    self._maybe_check_raw(data)
+                    if raw
+                    else self._maybe_check_errors(data)
+                )
+        except Exception as e:
+            info.error = e
+            info.total_time = time.perf_counter() - start
+            self.emit(ON_ERROR, info)
+            raise
+        if not raw:
+            info.response = result
+        info.total_time = time.perf_counter() - start
+        self.emit(AFTER_RESPONSE, info)
+        return result
+
+    async def _send_async_instrumented(
+        self, info: RequestInfo, raw: bool = False
+    ) -> Any:
+        """
+        Sends async request to the API, measuring its phases, emitting hook events
+        and feeding the profiler if enabled.
+
+        :param info: information about the call.
+        :param raw: whether to return undecoded response (``info.response`` stays empty).
+        :return: response dict (or raw response).
+        """
+        if not self.async_http_client:
+            raise ValueError("Async client is not initialized")
+        self.emit(BEFORE_REQUEST, info)
+        profiler, key = self.profiler, info.key
+        start = time.perf_counter()
+        try:
+            with measure(profiler, key, ENCODE):
+                body = self._encode_request(info)
+            sent = time.perf_counter()
+            info.serialize_time = sent - start
+            with measure(profiler, key, NETWORK):
+                response = await self.async_http_client.post(
+                    url=self.api_endpoint,
+                    headers=HEADERS,
+                    content=body,
+                    timeout=self.timeout,
+                )
+            received = time.perf_counter()
+            info.network_time = received - sent
+            info.response_size = len(response.content)
+            with measure(profiler, key, DECODE):
+                data: Any = (
+                    self._raw(response)
+                    if raw
+                    else await self._decode_async(response.content)
+                )
+            info.decode_time = time.perf_counter() - received
+            with measure(profiler, key, CHECK_ERRORS):
+                result: Any = (
+                    self._maybe_check_raw(data)
+                    if raw
+                    else self._maybe_check_errors(data)
+                )
+        except Exception as e:
+            info.error = e
+            info.total_time = time.perf_counter() - start
+            self.emit(ON_ERROR, info)
+            raise
+        if not raw:
+            info.response = result
+        info.total_time = time.perf_counter() - start
+        self.emit(AFTER_RESPONSE, info)
+        return result
+
+    def _build_request(
+        self, model_name: str, api_method: str, method_props: DictStrAny
+    ) -> HttpRequest:
+        """
+        Builds HTTP request for the API call.
+
+        :param model_name: name of the model to use.
+        :param api_method: name of the method to call.
+        :param method_props: properties to pass to the method.
+        :return: request dict.
+        """
+        return self._http_request(
+            self._encode_body(model_name, api_method, method_props)
+        )
+
+    def _build_request_instrumented(self, info: RequestInfo) -> HttpRequest:
+        """
+        Builds HTTP request for the API call, measuring its encoding.
+
+        :param info: information about the call.
+        :return: request dict.
+        """
+        start = time.perf_counter()
+        with measure(self.profiler, info.key, ENCODE):
+            request = self._http_request(self._encode_request(info))
+        info.serialize_time = time.perf_counter() - start
+        return request
+
+    def _http_request(self, content: bytes) -> HttpRequest:
+        """
+        Wraps request body into HTTP request.
+
+        :param content: request body.
+        :return: request dict.
         """
-        data: RequestData = {
-            "apiKey": self.api_key,
-            "modelName": model_name,
-            "calledMethod": api_method,
-            "methodProperties": method_props,
-        }
         request: HttpRequest = {
             "url": self.api_endpoint,
             "headers": HEADERS,
-            "json": data,
+            "content": content,
             "timeout": self.timeout,
         }
-        return self._send(request)
+        return request
+
+    def _encode_body(
+        self, model_name: str, api_method: str, method_props: DictStrAny
+    ) -> bytes:
+        """
+        Serialize request data. The static part of the envelope (``apiKey``,
+        ``modelName`` and ``calledMethod``) is encoded once per method and
+        reused, so only ``methodProperties`` is serialized per call.
+
+        :param model_name: name of the model to use.
+        :param api_method: name of the method to call.
+        :param method_props: properties to pass to the method.
+        :return: request body.
+        """
+        key = (self.api_key, model_name, api_method)
+        prefix = self._body_prefixes.get(key)
+        if prefix is None:
+            envelope = self.serializer.dumps(
+                {
+                    "apiKey": self.api_key,
+                    "modelName": model_name,
+                    "calledMethod": api_method,
+                }
+            )
+            prefix = envelope[:-1] + b',"methodProperties":'
+            self._body_prefixes[key] = prefix
+        return prefix + self.serializer.dumps(method_props) + b"}"
 
     def new(self, model: Type[BaseModelType]) -> BaseModelType:
         """
@@ -135,13 +829,30 @@ class NovaPoshtaApi:
         This property initializes a new model and provides
         access to its methods and attributes, facilitating interactions
         with the Nova Poshta API for model-related operations.
+        The new instance replaces the one in the pool.
 
         :param model: model to add.
         """
-        if model.name in self._models_pool:
-            del self._models_pool[model.name]
-        self._models_pool[model.name] = model(self)
-        return self._models_pool[model.name]
+        instance = model(self)
+        with self._models_lock:
+            self._models_pool[model.name] = instance
+        return instance
+
+    def _model(self, model: Type[BaseModelType]) -> BaseModelType:
+        """
+        Get model instance from the pool, creating it on first access.
+        Safe to call from several threads: only one instance is ever pooled.
+
+        :param model: model to get.
+        """
+        instance = self._models_pool.get(model.name)
+        if isinstance(instance, model):
+            return instance  # type: ignore[return-value]
+        with self._models_lock:
+            instance = self._models_pool.get(model.name)
+            if not isinstance(instance, model):
+                instance = self._models_pool[model.name] = model(self)
+        return instance  # type: ignore[return-value]
 
     def get(self, name: str) -> Optional[BaseModel]:
         """
@@ -166,6 +877,18 @@ class NovaPoshtaApi:
         if response["success"]:
             return response
 
+        self._raise_errors(response)
+        return response
+
+    @staticmethod
+    def _raise_errors(response: DictStrAny) -> None:
+        """
+        Raise errors of a failed response.
+
+        :param response: response dict.
+        :raises InvalidAPIKeyError: if API key is invalid
+        :raises APIRequestError: if any other API error occurs
+        """
         errors = response["errors"]
         error_msg = (
             ", ".join(errors)
@@ -181,6 +904,17 @@ class NovaPoshtaApi:
             raise InvalidAPIKeyError(error_msg)
         raise APIRequestError(error_msg)
 
+    def _maybe_check_raw(self, response: RawResponse) -> RawResponse:
+        """
+        Check raw response for errors, decoding it only if the call failed.
+
+        :param response: raw response.
+        :return: raw response.
+        """
+        if self.raise_for_errors and not response.success:
+            self._maybe_check_errors(response.json())
+        return response
+
     def close_sync(self):
         """
         Close sync client.
@@ -225,56 +959,75 @@ class NovaPoshtaApi:
         """
         Provide access to the Address model.
         """
-        return self.new(Address)
+        return self._model(Address)
 
     @property
     def counterparty(self) -> Counterparty:
         """
         Provide access to the Counterparty model.
         """
-        return self.new(Counterparty)
+        return self._model(Counterparty)
 
     @property
     def contact_person(self) -> ContactPerson:
         """
         Provide access to the ContactPerson model.
         """
-        return self.new(ContactPerson)
+        return self._model(ContactPerson)
 
     @property
     def scan_sheet(self) -> ScanSheet:
         """
         Provide access to the ScanSheet model.
         """
-        return self.new(ScanSheet)
+        return self._model(ScanSheet)
 
     @property
     def common(self) -> Common:
         """
         Provide access to the Common model.
         """
-        return self.new(Common)
+        return self._model(Common)
 
     @property
     def additional_service(self) -> AdditionalService:
         """
         Provide access to the AdditionalService model.
         """
-        return self.new(AdditionalService)
+        return self._model(AdditionalService)
 
     @property
     def internet_document(self) -> InternetDocument:
         """
         Provide access to the InternetDocument model.
         """
-        return self.new(InternetDocument)
+        return self._model(InternetDocument)
 
     @property
     def tracking_document(self) -> TrackingDocument:
         """
         Provide access to the TrackingDocument model.
         """
-        return self.new(TrackingDocument)
+        return self._model(TrackingDocument)
+
+
+def _write_chunk(sink: BinaryIO, chunk: bytes, skip_lines: int) -> Tuple[int, int]:
+    """
+    Write chunk of a downloaded body, dropping lines that are still to be skipped.
+
+    :param sink: binary file-like object to write to.
+    :param chunk: chunk of the body.
+    :param skip_lines: number of lines still to skip.
+    :return: number of written bytes and number of lines still to skip.
+    """
+    while skip_lines and chunk:
+        end = chunk.find(b"\n")
+        if end < 0:
+            return 0, skip_lines
+        chunk, skip_lines = chunk[end + 1 :], skip_lines - 1
+    if chunk:
+        sink.write(chunk)
+    return len(chunk), skip_lines
 
 
 class NovaPoshtaError(Exception):
@@ -0,0 +1,6 @@
+"""Local fake Nova Poshta API for offline load and integration testing."""
+
+from .data import FakeDirectory
+from .server import FakeNovaPoshta, FakeServer
+
+__all__ = ["FakeDirectory", "FakeNovaPoshta", "FakeServer"]
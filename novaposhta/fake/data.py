@@ -0,0 +1,223 @@
+"""Seeded directories and state of the fake Nova Poshta API."""
+
+import random
+import uuid
+from typing import Dict, Final, List, Tuple
+
+from ..types import DictStrAny
+
+# (city, area) pairs of the largest cities served by Nova Poshta.
+CITIES: Final[Tuple[Tuple[str, str], ...]] = (
+    ("Київ", "Київська"),
+    ("Харків", "Харківська"),
+    ("Одеса", "Одеська"),
+    ("Дніпро", "Дніпропетровська"),
+    ("Запоріжжя", "Запорізька"),
+    ("Львів", "Львівська"),
+    ("Кривий Ріг", "Дніпропетровська"),
+    ("Миколаїв", "Миколаївська"),
+    ("Вінниця", "Вінницька"),
+    ("Полтава", "Полтавська"),
+    ("Чернігів", "Чернігівська"),
+    ("Черкаси", "Черкаська"),
+    ("Хмельницький", "Хмельницька"),
+    ("Житомир", "Житомирська"),
+    ("Суми", "Сумська"),
+    ("Рівне", "Рівненська"),
+    ("Івано-Франківськ", "Івано-Франківська"),
+    ("Тернопіль", "Тернопільська"),
+    ("Луцьк", "Волинська"),
+    ("Біла Церква", "Київська"),
+    ("Кропивницький", "Кіровоградська"),
+    ("Ужгород", "Закарпатська"),
+    ("Чернівці", "Чернівецька"),
+    ("Бровари", "Київська"),
+)
+
+STREETS: Final[Tuple[str, ...]] = (
+    "Шевченка",
+    "Соборна",
+    "Незалежності",
+    "Грушевського",
+    "Івана Франка",
+    "Лесі Українки",
+    "Героїв України",
+    "Садова",
+    "Миру",
+    "Центральна",
+    "Богдана Хмельницького",
+    "Київська",
+    "Гагаріна",
+    "Шкільна",
+    "Зелена",
+)
+
+WAREHOUSE_TYPES: Final[Tuple[Tuple[str, int], ...]] = (
+    ("Вантажне відділення", 1100),
+    ("Поштове відділення", 30),
+    ("Поштомат", 20),
+)
+
+COMMON_LISTS: Final[Dict[str, Tuple[str, ...]]] = {
+    "getTimeIntervals": ("09:00-12:00", "12:00-15:00", "15:00-18:00", "18:00-21:00"),
+    "getCargoTypes": ("Cargo", "Documents", "TiresWheels", "Pallet", "Parcel"),
+    "getBackwardDeliveryCargoTypes": ("Documents", "Money", "CreditDocuments"),
+    "getPalletsList": ("Палета 0.5", "Палета 1", "Палета 1.5", "Палета 2"),
+    "getTypesOfPayersForRedelivery": ("Sender", "Recipient"),
+    "getPackList": ("Коробка 2 кг", "Коробка 5 кг", "Коробка 10 кг", "Конверт"),
+    "getTiresWheelsList": ("Шина R13-R14", "Шина R15-R16", "Диск R13-R14"),
+    "getCargoDescriptionList": ("Одяг", "Взуття", "Книги", "Електроніка", "Іграшки"),
+    "getMessageCodeText": ("API key is invalid", "Document not found"),
+    "getServiceTypes": (
+        "WarehouseWarehouse",
+        "WarehouseDoors",
+        "DoorsWarehouse",
+        "DoorsDoors",
+    ),
+    "getOwnershipFormsList": ("ТОВ", "ФОП", "ПП", "АТ"),
+    "getReturnReasons": ("Не підійшов розмір", "Пошкоджено", "Не відповідає опису"),
+    "getReturnReasonsSubtypes": ("Брак", "Інше"),
+    "getCounterpartyOptions": ("CanAfterpaymentOnGoodsCost", "CanNonCashPayment"),
+}
+
+TRACKING_STATUSES: Final[Tuple[Tuple[int, str], ...]] = (
+    (1, "Відправник самостійно створив цю накладну, але ще не надав до відправки"),
+    (4, "Відправлення у місті відправника"),
+    (5, "Відправлення прямує до міста одержувача"),
+    (7, "Прибув на відділення"),
+    (9, "Відправлення отримано"),
+)
+
+
+class FakeDirectory:
+    """
+    Deterministic directories (areas, cities, warehouses, streets, counterparties)
+    generated from the seed, plus mutable state of created documents and scan sheets.
+    """
+
+    def __init__(self, seed: int = 0, warehouses_per_city: int = 50):
+        """
+        Generate directories.
+
+        :param seed: seed of the generator; same seed gives same refs and data.
+        :param warehouses_per_city: number of warehouses in every city.
+        """
+        self._rng = random.Random(seed)
+        self.warehouses_per_city = warehouses_per_city
+        self.areas: List[DictStrAny] = []
+        self.cities: List[DictStrAny] = []
+        self.warehouses: List[DictStrAny] = []
+        self.streets: List[DictStrAny] = []
+        self.warehouse_types = [
+            {"Ref": self.new_ref(), "Description": name, "MaxWeight": max_weight}
+            for name, max_weight in WAREHOUSE_TYPES
+        ]
+        self.common = {
+            method: [{"Ref": self.new_ref(), "Description": d} for d in descriptions]
+            for method, descriptions in COMMON_LISTS.items()
+        }
+        self.counterparties = [
+            {
+                "Ref": self.new_ref(),
+                "Description": "Приватна особа",
+                "CounterpartyType": "PrivatePerson",
+                "CounterpartyProperty": prop,
+            }
+            for prop in ("Sender", "Recipient", "ThirdPerson")
+        ]
+        self.contact_persons = [
+            {
+                "Ref": self.new_ref(),
+                "Description": f"{last} {first}",
+                "FirstName": first,
+                "LastName": last,
+                "Phones": phone,
+            }
+            for first, last, phone in (
+                ("Іван", "Петренко", "380501234567"),
+                ("Олена", "Коваленко", "380671234567"),
+            )
+        ]
+        self.documents: Dict[str, DictStrAny] = {}
+        self.scan_sheets: Dict[str, DictStrAny] = {}
+        self._generate(warehouses_per_city)
+
+    def new_ref(self) -> str:
+        """
+        Generate the next reference (UUID) from the seeded generator.
+        """
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def _generate(self, warehouses_per_city: int) -> None:
+        areas: Dict[str, DictStrAny] = {}
+        for index, (name, area_name) in enumerate(CITIES, start=1):
+            if area_name not in areas:
+                areas[area_name] = {
+                    "Ref": self.new_ref(),
+                    "Description": area_name,
+                    "AreasCenter": None,
+                }
+                self.areas.append(areas[area_name])
+            area = areas[area_name]
+            city = {
+                "Ref": self.new_ref(),
+                "Description": name,
+                "Area": area["Ref"],
+                "AreaDescription": area_name,
+                "SettlementType": self.new_ref(),
+                "SettlementTypeDescription": "місто",
+                "CityID": str(index),
+                "IsBranch": "0",
+            }
+            area["AreasCenter"] = area["AreasCenter"] or city["Ref"]
+            self.cities.append(city)
+            for street in STREETS:
+                self.streets.append(
+                    {
+                        "Ref": self.new_ref(),
+                        "Description": street,
+                        "StreetsType": "вул.",
+                        "CityRef": city["Ref"],
+                    }
+                )
+            for number in range(1, warehouses_per_city + 1):
+                self.warehouses.append(self._warehouse(city, number))
+
+    def _warehouse(self, city: DictStrAny, number: int) -> DictStrAny:
+        kind = self.warehouse_types[self._rng.randrange(len(self.warehouse_types))]
+        street = self._rng.choice(STREETS)
+        house = self._rng.randint(1, 150)
+        return {
+            "Ref": self.new_ref(),
+            "SiteKey": str(int(city["CityID"]) * 1000 + number),
+            "Description": f"{kind['Description']} №{number}: вул. {street}, {house}",
+            "ShortAddress": f"{city['Description']}, {street}, {house}",
+            "Number": str(number),
+            "CityRef": city["Ref"],
+            "CityDescription": city["Description"],
+            "SettlementRef": city["Ref"],
+            "SettlementAreaDescription": city["AreaDescription"],
+            "TypeOfWarehouse": kind["Ref"],
+            "TotalMaxWeightAllowed": str(kind["MaxWeight"]),
+            "Phone": "0800500609",
+            "Longitude": f"{self._rng.uniform(22.5, 40.0):.6f}",
+            "Latitude": f"{self._rng.uniform(44.5, 52.0):.6f}",
+            "BicycleParking": str(self._rng.randint(0, 1)),
+            "PostFinance": str(self._rng.randint(0, 1)),
+            "WarehouseStatus": "Working",
+        }
+
+    def tracking_status(self, number: str) -> Tuple[int, str]:
+        """
+        Status of a document: stable for the same number within a directory.
+
+        :param number: document number.
+        :return: status code and status description.
+        """
+        document = next(
+            (d for d in self.documents.values() if d["IntDocNumber"] == number), None
+        )
+        if document is not None:
+            return TRACKING_STATUSES[0]
+        digits = [int(c) for c in number if c.isdigit()] or [0]
+        return TRACKING_STATUSES[sum(digits) % len(TRACKING_STATUSES)]
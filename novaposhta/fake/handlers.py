@@ -0,0 +1,437 @@
+"""Handlers of the fake Nova Poshta API methods."""
+
+import datetime
+import inspect
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from ..models.additional_service import AdditionalService
+from ..models.address import Address
+from ..models.base import BaseModel
+from ..models.common import Common
+from ..models.contact_person import ContactPerson
+from ..models.counterparty import Counterparty
+from ..models.internet_document import InternetDocument
+from ..models.scan_sheet import ScanSheet
+from ..models.tracking_document import TrackingDocument
+from ..types import DictStrAny
+from .data import COMMON_LISTS, FakeDirectory
+
+MODELS: Tuple[Type[BaseModel], ...] = (
+    AdditionalService,
+    Address,
+    Common,
+    ContactPerson,
+    Counterparty,
+    InternetDocument,
+    ScanSheet,
+    TrackingDocument,
+)
+
+MAX_TRACKED_DOCUMENTS = 100
+
+Handler = Callable[[FakeDirectory, DictStrAny], DictStrAny]
+
+
+def supported_methods(
+    models: Iterable[Type[BaseModel]] = MODELS,
+) -> Set[Tuple[str, str]]:
+    """
+    Collect ``(modelName, calledMethod)`` pairs of all API methods of the models.
+
+    :param models: model classes to inspect.
+    :return: set of supported calls.
+    """
+    methods = set()
+    for model in models:
+        for _, member in inspect.getmembers(model, inspect.isfunction):
+            method_name = getattr(member, "api_method_name", None)
+            if method_name:
+                methods.add((model.name, method_name))
+    return methods
+
+
+def ok(data: List[Any], **info: Any) -> DictStrAny:
+    """
+    Successful reply with data and optional info.
+    """
+    return {"data": data, "info": info}
+
+
+def fail(*errors: str, data: Optional[List[Any]] = None) -> DictStrAny:
+    """
+    Failed reply with errors.
+    """
+    return {"success": False, "data": data or [], "errors": list(errors)}
+
+
+def _page(items: List[Any], props: DictStrAny) -> DictStrAny:
+    limit = int(props.get("Limit") or 0)
+    page = max(int(props.get("Page") or 1), 1)
+    if limit:
+        return ok(items[(page - 1) * limit : page * limit], totalCount=len(items))
+    return ok(items, totalCount=len(items))
+
+
+def _filter(items: List[DictStrAny], props: DictStrAny, **fields: str) -> List[Any]:
+    """
+    Keep items whose fields match the properties.
+    ``fields`` maps property name to item field; ``FindByString`` matches
+    the beginning of any word of ``Description``.
+    """
+    for prop, item_field in fields.items():
+        value = props.get(prop)
+        if value:
+            items = [i for i in items if str(i.get(item_field)) == str(value)]
+    search = str(props.get("FindByString") or "").lower()
+    if search:
+        items = [
+            i
+            for i in items
+            if any(w.startswith(search) for w in i["Description"].lower().split())
+            or i["Description"].lower().startswith(search)
+        ]
+    return items
+
+
+def _refs(value: Any) -> List[str]:
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return [str(value)] if value else []
+
+
+def search_settlements(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    name = str(props.get("CityName") or "").lower()
+    cities = [c for c in directory.cities if c["Description"].lower().startswith(name)]
+    page = _page(cities, props)["data"]
+    addresses = [
+        {
+            "Present": f"м. {c['Description']}, {c['AreaDescription']} обл.",
+            "Warehouses": directory.warehouses_per_city,
+            "MainDescription": c["Description"],
+            "Area": c["AreaDescription"],
+            "Region": "",
+            "SettlementTypeCode": "м.",
+            "Ref": c["Ref"],
+            "DeliveryCity": c["Ref"],
+        }
+        for c in page
+    ]
+    return ok([{"TotalCount": len(cities), "Addresses": addresses}])
+
+
+def search_settlement_streets(
+    directory: FakeDirectory, props: DictStrAny
+) -> DictStrAny:
+    name = str(props.get("StreetName") or "").lower()
+    streets = [
+        s
+        for s in directory.streets
+        if s["CityRef"] == props.get("SettlementRef")
+        and s["Description"].lower().startswith(name)
+    ]
+    page = _page(streets, props)["data"]
+    addresses = [
+        {
+            "SettlementRef": s["CityRef"],
+            "SettlementStreetRef": s["Ref"],
+            "Present": f"{s['StreetsType']} {s['Description']}",
+            "StreetsType": s["StreetsType"],
+            "StreetsTypeDescription": "вулиця",
+            "SettlementStreetDescription": s["Description"],
+        }
+        for s in page
+    ]
+    return ok([{"TotalCount": len(streets), "Addresses": addresses}])
+
+
+def get_cities(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return _page(_filter(directory.cities, props, Ref="Ref", AreaRef="Area"), props)
+
+
+def get_areas(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return ok(_filter(directory.areas, props, Ref="Ref"))
+
+
+def get_settlement_country_region(
+    directory: FakeDirectory, props: DictStrAny
+) -> DictStrAny:
+    cities = _filter(directory.cities, props, AreaRef="Area")
+    return ok(
+        [{"Ref": c["Ref"], "Description": f"{c['Description']} район"} for c in cities]
+    )
+
+
+def get_warehouses(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    warehouses = _filter(
+        directory.warehouses,
+        props,
+        Ref="Ref",
+        CityRef="CityRef",
+        SettlementRef="SettlementRef",
+        CityName="CityDescription",
+        TypeOfWarehouseRef="TypeOfWarehouse",
+        WarehouseId="Number",
+        BicycleParking="BicycleParking",
+        PostFinance="PostFinance",
+    )
+    return _page(warehouses, props)
+
+
+def get_warehouse_types(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return ok(directory.warehouse_types)
+
+
+def get_street(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    if not props.get("CityRef"):
+        return fail("CityRef is required")
+    return _page(_filter(directory.streets, props, CityRef="CityRef"), props)
+
+
+def get_counterparties(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    counterparties = _filter(
+        directory.counterparties, props, CounterpartyProperty="CounterpartyProperty"
+    )
+    return _page(counterparties, props)
+
+
+def get_contact_persons(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return _page(directory.contact_persons, props)
+
+
+def get_document_price(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    weight = float(props.get("Weight") or 0.1)
+    cost = float(props.get("Cost") or 0)
+    seats = int(props.get("SeatsAmount") or 1)
+    price = 60 + 5 * math.ceil(weight) * seats + round(cost * 0.005, 2)
+    return ok([{"AssessedCost": cost, "Cost": price, "CostRedelivery": 0}])
+
+
+def _delivery_date(props: DictStrAny) -> DictStrAny:
+    days = 1 if props.get("CitySender") == props.get("CityRecipient") else 2
+    date = datetime.date.today() + datetime.timedelta(days=days)
+    return {
+        "date": f"{date.isoformat()} 00:00:00.000000",
+        "timezone_type": 3,
+        "timezone": "Europe/Kyiv",
+    }
+
+
+def get_document_delivery_date(
+    directory: FakeDirectory, props: DictStrAny
+) -> DictStrAny:
+    return ok([{"DeliveryDate": _delivery_date(props)}])
+
+
+def save_document(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    ref = directory.new_ref()
+    document = {
+        "Ref": ref,
+        "IntDocNumber": f"2045{len(directory.documents) + 1:010d}",
+        "CostOnSite": get_document_price(directory, props)["data"][0]["Cost"],
+        "EstimatedDeliveryDate": _delivery_date(props)["date"][:10],
+        "TypeDocument": "InternetDocument",
+    }
+    directory.documents[ref] = dict(props, **document)
+    return ok([document])
+
+
+def update_document(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    document = directory.documents.get(props.get("Ref", ""))
+    if document is None:
+        return fail("Document not found")
+    document.update(props)
+    return ok([{"Ref": document["Ref"], "IntDocNumber": document["IntDocNumber"]}])
+
+
+def delete_documents(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    refs = _refs(props.get("DocumentRefs"))
+    deleted = [{"Ref": r} for r in refs if directory.documents.pop(r, None)]
+    if len(deleted) == len(refs):
+        return ok(deleted)
+    return {"success": bool(deleted), "data": deleted, "errors": ["Document not found"]}
+
+
+def get_document_list(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return _page(list(directory.documents.values()), props)
+
+
+def generate_report(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    refs = _refs(props.get("DocumentRefs"))
+    return ok([directory.documents[r] for r in refs if r in directory.documents])
+
+
+def get_status_documents(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    documents = props.get("Documents") or []
+    if len(documents) > MAX_TRACKED_DOCUMENTS:
+        return fail(f"Documents limit is {MAX_TRACKED_DOCUMENTS}")
+    statuses = []
+    for document in documents:
+        number = str(document.get("DocumentNumber", ""))
+        code, status = directory.tracking_status(number)
+        statuses.append({"Number": number, "StatusCode": str(code), "Status": status})
+    return ok(statuses)
+
+
+def _scan_sheet_outcome(
+    directory: FakeDirectory, refs: List[str], sheet: DictStrAny, insert: bool
+) -> DictStrAny:
+    success, errors = [], []
+    for ref in refs:
+        document = directory.documents.get(ref)
+        if document is None:
+            errors.append({"Ref": ref, "Error": "Document not found"})
+            continue
+        if insert:
+            sheet["Documents"][ref] = document["IntDocNumber"]
+        else:
+            sheet["Documents"].pop(ref, None)
+        success.append({"Ref": ref, "Number": document["IntDocNumber"]})
+    return {"Success": success, "Errors": errors}
+
+
+def insert_documents(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    ref = props.get("Ref") or directory.new_ref()
+    sheet = directory.scan_sheets.setdefault(
+        ref,
+        {
+            "Ref": ref,
+            "Number": f"105-{len(directory.scan_sheets) + 1:08d}",
+            "Date": props.get("Date") or datetime.date.today().isoformat(),
+            "Documents": {},
+        },
+    )
+    outcome = _scan_sheet_outcome(
+        directory, _refs(props.get("DocumentRefs")), sheet, True
+    )
+    return ok(
+        [
+            {
+                "Ref": ref,
+                "Number": sheet["Number"],
+                "Date": sheet["Date"],
+                "Warnings": [],
+                **outcome,
+            }
+        ]
+    )
+
+
+def _scan_sheet_summary(sheet: DictStrAny) -> DictStrAny:
+    return {
+        "Ref": sheet["Ref"],
+        "Number": sheet["Number"],
+        "DateTime": sheet["Date"],
+        "Count": str(len(sheet["Documents"])),
+    }
+
+
+def get_scan_sheet(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    sheet = directory.scan_sheets.get(props.get("Ref", ""))
+    if sheet is None:
+        return fail("ScanSheet not found")
+    return ok([_scan_sheet_summary(sheet)])
+
+
+def get_scan_sheet_list(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return ok([_scan_sheet_summary(s) for s in directory.scan_sheets.values()])
+
+
+def delete_scan_sheet(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    success, errors = [], []
+    for ref in _refs(props.get("ScanSheetRefs")):
+        if directory.scan_sheets.pop(ref, None) is None:
+            errors.append({"Ref": ref, "Error": "ScanSheet not found"})
+        else:
+            success.append({"Ref": ref})
+    return ok([{"ScanSheetRefs": {"Success": success, "Errors": errors}}])
+
+
+def remove_documents(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    sheet = directory.scan_sheets.get(props.get("Ref", ""))
+    if sheet is None:
+        return fail("ScanSheet not found")
+    outcome = _scan_sheet_outcome(
+        directory, _refs(props.get("DocumentRefs")), sheet, False
+    )
+    return ok([{"DocumentRefs": outcome}])
+
+
+def save_generic(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return ok([dict(props, Ref=directory.new_ref())])
+
+
+def update_generic(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return ok([dict(props)])
+
+
+def delete_generic(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return ok([{"Ref": props.get("Ref")}])
+
+
+def check_generic(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return ok([{"Number": props.get("Number"), "Possible": True}])
+
+
+def list_generic(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+    return _page([], props)
+
+
+HANDLERS: Dict[Tuple[str, str], Handler] = {
+    ("Address", "searchSettlements"): search_settlements,
+    ("Address", "searchSettlementStreets"): search_settlement_streets,
+    ("Address", "getSettlements"): get_cities,
+    ("Address", "getCities"): get_cities,
+    ("Address", "getAreas"): get_areas,
+    ("Address", "getSettlementAreas"): get_areas,
+    ("Address", "getSettlementCountryRegion"): get_settlement_country_region,
+    ("Address", "getWarehouses"): get_warehouses,
+    ("Address", "getWarehouseTypes"): get_warehouse_types,
+    ("Address", "getStreet"): get_street,
+    ("Counterparty", "getCounterparties"): get_counterparties,
+    ("Counterparty", "getCounterpartyContactPersons"): get_contact_persons,
+    ("InternetDocument", "getDocumentPrice"): get_document_price,
+    ("InternetDocument", "getDocumentDeliveryDate"): get_document_delivery_date,
+    ("InternetDocument", "save"): save_document,
+    ("InternetDocument", "update"): update_document,
+    ("InternetDocument", "delete"): delete_documents,
+    ("InternetDocument", "getDocumentList"): get_document_list,
+    ("InternetDocument", "generateReport"): generate_report,
+    ("TrackingDocument", "getStatusDocuments"): get_status_documents,
+    ("ScanSheet", "insertDocuments"): insert_documents,
+    ("ScanSheet", "getScanSheet"): get_scan_sheet,
+    ("ScanSheet", "getScanSheetList"): get_scan_sheet_list,
+    ("ScanSheet", "deleteScanSheet"): delete_scan_sheet,
+    ("ScanSheet", "removeDocuments"): remove_documents,
+}
+
+
+def _lookup_list(method: str) -> Handler:
+    def handler(directory: FakeDirectory, props: DictStrAny) -> DictStrAny:
+        return ok(directory.common[method])
+
+    return handler
+
+
+def resolve_handler(model: str, method: str) -> Handler:
+    """
+    Find handler of a supported call: a dedicated one, a lookup list
+    or a generic one chosen by the method name.
+
+    :param model: name of the model.
+    :param method: name of the method.
+    :return: handler.
+    """
+    if (model, method) in HANDLERS:
+        return HANDLERS[model, method]
+    if method in COMMON_LISTS:
+        return _lookup_list(method)
+    if method == "save":
+        return save_generic
+    if method == "update":
+        return update_generic
+    if method == "delete":
+        return delete_generic
+    if method.lower().startswith("check"):
+        return check_generic
+    return list_generic
@@ -0,0 +1,408 @@
+"""Local stand-in for the Nova Poshta API: ASGI app and plain asyncio HTTP server."""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple, Union
+
+from ..types import DictStrAny
+from .data import FakeDirectory
+from .handlers import resolve_handler, supported_methods
+
+Latency = Union[float, Tuple[float, float], Callable[[random.Random], float]]
+
+RATE_LIMIT_ERROR: Final[str] = "To many requests"
+INTERNAL_ERROR: Final[str] = "Internal server error"
+INVALID_API_KEY_ERROR: Final[str] = "API key is invalid"
+REASONS: Final[Dict[int, str]] = {
+    200: "OK",
+    400: "Bad Request",
+    405: "Method Not Allowed",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+START_TIMEOUT: Final[float] = 10.0
+
+
+class TokenBucket:
+    """
+    Token bucket that allows ``rate`` requests per second with bursts up to ``burst``.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.burst = burst or max(int(rate), 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def take(self) -> bool:
+        """
+        Take a token if available.
+
+        :return: whether the request is allowed.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class FakeNovaPoshta:
+    """
+    Fake Nova Poshta API that dispatches ``modelName``/``calledMethod`` of every
+    model of the client to handlers working on seeded directories.
+
+    It can be used as an ASGI app (e.g. with ``httpx.ASGITransport`` or any ASGI
+    server) or served by the bundled asyncio HTTP server (see ``serve`` and
+    ``FakeServer``). Latency, API and HTTP errors are injected at random with
+    the seeded generator; rate limiting is applied per API key.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[FakeDirectory] = None,
+        seed: int = 0,
+        latency: Latency = 0.0,
+        error_rate: float = 0.0,
+        http_error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        api_keys: Optional[List[str]] = None,
+    ):
+        """
+        Initialize the fake API.
+
+        :param directory: directories and state (generated from ``seed`` by default).
+        :param seed: seed of directories and of injected latency and errors.
+        :param latency: seconds per request: constant, ``(min, max)`` for uniform
+            distribution or a callable that takes ``random.Random`` and returns seconds.
+        :param error_rate: fraction of requests answered with ``success: false``.
+        :param http_error_rate: fraction of requests answered with HTTP 503.
+        :param rate_limit: allowed requests per second per API key.
+        :param burst: maximum burst of requests per API key.
+        :param api_keys: accepted API keys (any key by default).
+        """
+        self.directory = directory or FakeDirectory(seed)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.http_error_rate = http_error_rate
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.api_keys = set(api_keys) if api_keys else None
+        self.methods = supported_methods()
+        self.stats: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _delay(self) -> float:
+        if callable(self.latency):
+            return self.latency(self._rng)
+        if isinstance(self.latency, tuple):
+            return self._rng.uniform(*self.latency)
+        return self.latency
+
+    def _allowed(self, api_key: str) -> bool:
+        if self.rate_limit is None:
+            return True
+        if api_key not in self._buckets:
+            self._buckets[api_key] = TokenBucket(self.rate_limit, self.burst)
+        return self._buckets[api_key].take()
+
+    def dispatch(self, payload: DictStrAny) -> DictStrAny:
+        """
+        Call handler of the method, without latency, errors and rate limiting.
+
+        :param payload: request data with ``apiKey``, ``modelName``, ``calledMethod``
+            and ``methodProperties``.
+        :return: response dict in the API format.
+        """
+        model, method = payload.get("modelName", ""), payload.get("calledMethod", "")
+        if self.api_keys is not None and payload.get("apiKey") not in self.api_keys:
+            reply = {"success": False, "errors": [INVALID_API_KEY_ERROR]}
+        elif (model, method) not in self.methods:
+            reply = {"success": False, "errors": [f"Method {model}.{method} not found"]}
+        else:
+            props = payload.get("methodProperties") or {}
+            reply = resolve_handler(model, method)(self.directory, props)
+        self.stats[f"{model}.{method}"] += 1
+        return {
+            "success": reply.get("success", True),
+            "data": reply.get("data", []),
+            "errors": reply.get("errors", []),
+            "warnings": [],
+            "info": reply.get("info", []),
+            "messageCodes": [],
+            "errorCodes": [],
+            "warningCodes": [],
+            "infoCodes": [],
+        }
+
+    async def handle(self, body: bytes) -> Tuple[int, bytes]:
+        """
+        Handle raw request body.
+
+        :param body: JSON request body.
+        :return: HTTP status and JSON response body.
+        """
+        self.stats["requests"] += 1
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, self._encode(self._error("Invalid JSON"))
+        if not self._allowed(str(payload.get("apiKey"))):
+            self.stats["rate_limited"] += 1
+            return 429, self._encode(self._error(RATE_LIMIT_ERROR))
+        delay = self._delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.http_error_rate and self._rng.random() < self.http_error_rate:
+            self.stats["http_errors"] += 1
+            return 503, self._encode(self._error(INTERNAL_ERROR))
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.stats["api_errors"] += 1
+            return 200, self._encode(self._error(INTERNAL_ERROR))
+        return 200, self._encode(self.dispatch(payload))
+
+    async def _respond(self, method: bytes, body: bytes) -> Tuple[int, bytes]:
+        """
+        Handle request of any HTTP method; handler errors are answered with HTTP 500.
+
+        :param method: HTTP method.
+        :param body: request body.
+        :return: HTTP status and JSON response body.
+        """
+        if method != b"POST":
+            return 405, self._encode(self._error("Only POST is allowed"))
+        try:
+            return await self.handle(body)
+        except Exception as e:
+            self.stats["server_errors"] += 1
+            return 500, self._encode(self._error(f"{INTERNAL_ERROR}: {e!r}"))
+
+    @staticmethod
+    def _error(message: str) -> DictStrAny:
+        return {"success": False, "data": [], "errors": [message]}
+
+    @staticmethod
+    def _encode(response: DictStrAny) -> bytes:
+        return json.dumps(response, ensure_ascii=False).encode()
+
+    async def __call__(self, scope: DictStrAny, receive: Callable, send: Callable):
+        """
+        ASGI entry point.
+        """
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        body, more_body = b"", True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        status, content = await self._respond(scope["method"].encode(), body)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(content)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serve HTTP/1.1 requests of a single keep-alive connection.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                method = request_line.split(b" ", 1)[0]
+                status, content = await self._respond(method, body)
+                close = headers.get("connection", "").lower() == "close"
+                head = (
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(content)}\r\n"
+                    f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+                )
+                writer.write(head.encode() + content)
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """
+        Start plain asyncio HTTP server with the fake API.
+
+        :param host: host to listen on.
+        :param port: port to listen on (0 picks a free one).
+        :return: started server.
+        """
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+
+class FakeServer:
+    """
+    Runs ``FakeNovaPoshta`` HTTP server in a background thread,
+    so that both sync and async clients can talk to it over the network.
+    """
+
+    def __init__(
+        self,
+        app: Optional[FakeNovaPoshta] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        **options: Any,
+    ):
+        """
+        Initialize the server.
+
+        :param app: fake API to serve (created from ``options`` by default).
+        :param host: host to listen on.
+        :param port: port to listen on (0 picks a free one).
+        :param options: options of ``FakeNovaPoshta``.
+        """
+        self.app = app or FakeNovaPoshta(**options)
+        self.host = host
+        self.port = port
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    @property
+    def url(self) -> str:
+        """
+        API endpoint of the server to pass to the client.
+        """
+        return f"http://{self.host}:{self.port}/v2.0/json/"
+
+    def _run(self) -> None:
+        loop = self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            server = loop.run_until_complete(self.app.serve(self.host, self.port))
+            self.port = server.sockets[0].getsockname()[1]
+        except BaseException as e:
+            self._error = e
+            loop.close()
+            return
+        finally:
+            self._ready.set()
+        loop.run_forever()
+        server.close()
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.close()
+
+    def start(self, timeout: float = START_TIMEOUT) -> "FakeServer":
+        """
+        Start serving in a background thread.
+
+        :param timeout: seconds to wait for the server to start.
+        :return: the server itself.
+        :raises TimeoutError: if the server did not start in time.
+        :raises OSError: if the server could not listen (e.g. the port is taken).
+        """
+        self._ready.clear()
+        self._error = None
+        thread = self._thread = threading.Thread(target=self._run, daemon=True)
+        thread.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError(f"Fake server did not start in {timeout}s")
+        if self._error is not None:
+            thread.join()
+            self._thread = None
+            raise self._error
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop serving and wait for the thread to finish.
+        """
+        if self._loop and self._thread:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakeServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Run the fake API server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Local fake Nova Poshta API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--warehouses-per-city", type=int, default=50)
+    parser.add_argument(
+        "--latency", type=float, nargs="+", default=[0.0], help="seconds or MIN MAX"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--http-error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float)
+    parser.add_argument("--burst", type=int)
+    args = parser.parse_args(argv)
+
+    latency: Latency = (
+        args.latency[0] if len(args.latency) == 1 else tuple(args.latency[:2])
+    )
+    app = FakeNovaPoshta(
+        FakeDirectory(args.seed, args.warehouses_per_city),
+        seed=args.seed,
+        latency=latency,
+        error_rate=args.error_rate,
+        http_error_rate=args.http_error_rate,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+    )
+
+    async def run() -> None:
+        server = await app.serve(args.host, args.port)
+        print(f"Fake Nova Poshta API at http://{args.host}:{args.port}/v2.0/json/")
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
@@ -0,0 +1,52 @@
+"""Request lifecycle events for instrumentation of the client."""
+
+from dataclasses import dataclass
+from typing import Callable, Final, Optional, Tuple
+
+from .types import DictStrAny
+
+BEFORE_REQUEST: Final[str] = "before_request"
+AFTER_RESPONSE: Final[str] = "after_response"
+ON_ERROR: Final[str] = "on_error"
+ON_RETRY: Final[str] = "on_retry"
+ON_CACHE_HIT: Final[str] = "on_cache_hit"
+
+HOOK_EVENTS: Final[Tuple[str, ...]] = (
+    BEFORE_REQUEST,
+    AFTER_RESPONSE,
+    ON_ERROR,
+    ON_RETRY,
+    ON_CACHE_HIT,
+)
+
+
+@dataclass
+class RequestInfo:
+    """
+    Information about a single API call passed to hooks.
+    Timings are in seconds, sizes are in bytes; they are filled in
+    as the request goes through its phases.
+    """
+
+    model_name: str
+    method: str
+    method_props: DictStrAny
+    request_size: Optional[int] = None
+    response_size: Optional[int] = None
+    serialize_time: Optional[float] = None
+    network_time: Optional[float] = None
+    decode_time: Optional[float] = None
+    total_time: Optional[float] = None
+    response: Optional[DictStrAny] = None
+    error: Optional[BaseException] = None
+    attempt: int = 1
+
+    @property
+    def key(self) -> str:
+        """
+        Name of the call in ``modelName.calledMethod`` form.
+        """
+        return f"{self.model_name}.{self.method}"
+
+
+Hook = Callable[[RequestInfo], None]
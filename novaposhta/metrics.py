@@ -0,0 +1,257 @@
+"""In-process metrics of API calls collected via client hooks."""
+
+import bisect
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Final, List, Mapping, Optional, Sequence, Tuple
+
+import httpx
+
+from .hooks import AFTER_RESPONSE, ON_CACHE_HIT, ON_ERROR, ON_RETRY, RequestInfo
+
+DEFAULT_BUCKETS: Final[Tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUANTILES: Final[Tuple[float, ...]] = (0.5, 0.95, 0.99)
+PREFIX: Final[str] = "novaposhta"
+
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets (upper bounds in seconds).
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Record a single observation.
+
+        :param value: observed value.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate quantile by linear interpolation inside the bucket it falls into.
+
+        :param q: quantile between 0 and 1.
+        :return: estimated value (0 when nothing was observed).
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                upper = min(upper, self.max)
+                lower = min(lower, upper)
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.max
+
+
+def _error_class(error: Optional[BaseException]) -> str:
+    """
+    Name of error class used as metric label; all transport failures are grouped.
+    """
+    if isinstance(error, httpx.TransportError):
+        return "TransportError"
+    return type(error).__name__
+
+
+def _response_error_class(response: Any) -> Optional[str]:
+    """
+    Name of error class of a failed API response, the same as the error raised
+    for it with ``raise_for_errors``; ``None`` for successful responses.
+    """
+    if not isinstance(response, Mapping) or response.get("success", True):
+        return None
+    if "API key" in str(response.get("errors")):
+        return "InvalidAPIKeyError"
+    return "APIRequestError"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class MetricsRegistry:
+    """
+    Collects counters of requests, errors (by error class), cache hits and retries
+    and latency histograms per ``modelName.calledMethod``.
+    Attach it to a client to start collecting.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize registry.
+
+        :param buckets: upper bounds (in seconds) of latency histogram buckets.
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Drop all collected metrics.
+        """
+        with self._lock:
+            self.requests: Dict[str, int] = defaultdict(int)
+            self.errors: Dict[Tuple[str, str], int] = defaultdict(int)
+            self.cache_hits: Dict[str, int] = defaultdict(int)
+            self.retries: Dict[str, int] = defaultdict(int)
+            self.latency: Dict[str, Histogram] = {}
+
+    def attach(self, client: Any) -> "MetricsRegistry":
+        """
+        Start collecting metrics of the client.
+
+        :param client: ``NovaPoshtaApi`` instance.
+        :return: the registry itself.
+        """
+        client.add_hook(AFTER_RESPONSE, self.on_response)
+        client.add_hook(ON_ERROR, self.on_error)
+        client.add_hook(ON_RETRY, self.on_retry)
+        client.add_hook(ON_CACHE_HIT, self.on_cache_hit)
+        return self
+
+    def detach(self, client: Any) -> None:
+        """
+        Stop collecting metrics of the client.
+
+        :param client: ``NovaPoshtaApi`` instance.
+        """
+        client.remove_hook(AFTER_RESPONSE, self.on_response)
+        client.remove_hook(ON_ERROR, self.on_error)
+        client.remove_hook(ON_RETRY, self.on_retry)
+        client.remove_hook(ON_CACHE_HIT, self.on_cache_hit)
+
+    def _observe(self, info: RequestInfo) -> None:
+        self.requests[info.key] += 1
+        if info.total_time is not None:
+            histogram = self.latency.get(info.key)
+            if histogram is None:
+                histogram = self.latency[info.key] = Histogram(self.buckets)
+            histogram.observe(info.total_time)
+
+    def on_response(self, info: RequestInfo) -> None:
+        """
+        Hook for ``after_response`` event.
+        Responses with ``success: false`` are counted as errors as well.
+        """
+        error_class = _response_error_class(info.response)
+        with self._lock:
+            self._observe(info)
+            if error_class is not None:
+                self.errors[(info.key, error_class)] += 1
+
+    def on_error(self, info: RequestInfo) -> None:
+        """
+        Hook for ``on_error`` event.
+        """
+        with self._lock:
+            self._observe(info)
+            self.errors[(info.key, _error_class(info.error))] += 1
+
+    def on_retry(self, info: RequestInfo) -> None:
+        """
+        Hook for ``on_retry`` event.
+        """
+        with self._lock:
+            self.retries[info.key] += 1
+
+    def on_cache_hit(self, info: RequestInfo) -> None:
+        """
+        Hook for ``on_cache_hit`` event.
+        """
+        with self._lock:
+            self.cache_hits[info.key] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Plain dict with current values of all metrics.
+        """
+        with self._lock:
+            errors: Dict[str, Dict[str, int]] = defaultdict(dict)
+            for (key, error_class), count in self.errors.items():
+                errors[key][error_class] = count
+            latency = {}
+            for key, histogram in self.latency.items():
+                latency[key] = {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "max": histogram.max,
+                    **{f"p{int(q * 100)}": histogram.quantile(q) for q in QUANTILES},
+                }
+            return {
+                "requests": dict(self.requests),
+                "errors": dict(errors),
+                "cache_hits": dict(self.cache_hits),
+                "retries": dict(self.retries),
+                "latency": latency,
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Export metrics in Prometheus text exposition format.
+        """
+        lines: List[str] = []
+        with self._lock:
+            counters = (
+                ("requests_total", "Total number of API requests.", self.requests),
+                ("cache_hits_total", "Calls served from cache.", self.cache_hits),
+                ("retries_total", "Retried calls.", self.retries),
+            )
+            for name, description, values in counters:
+                lines.append(f"# HELP {PREFIX}_{name} {description}")
+                lines.append(f"# TYPE {PREFIX}_{name} counter")
+                for key, count in sorted(values.items()):
+                    lines.append(f'{PREFIX}_{name}{{method="{_escape(key)}"}} {count}')
+
+            lines.append(f"# HELP {PREFIX}_errors_total Failed API requests.")
+            lines.append(f"# TYPE {PREFIX}_errors_total counter")
+            for (key, error_class), count in sorted(self.errors.items()):
+                labels = f'method="{_escape(key)}",error="{_escape(error_class)}"'
+                lines.append(f"{PREFIX}_errors_total{{{labels}}} {count}")
+
+            name = f"{PREFIX}_request_duration_seconds"
+            lines.append(f"# HELP {name} Latency of API requests.")
+            lines.append(f"# TYPE {name} histogram")
+            for key, histogram in sorted(self.latency.items()):
+                method = _escape(key)
+                cumulative = 0
+                bounds = [_format_bound(b) for b in histogram.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(
+                        f'{name}_bucket{{method="{method}",le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f'{name}_sum{{method="{method}"}} {histogram.sum}')
+                lines.append(f'{name}_count{{method="{method}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
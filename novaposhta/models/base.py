@@ -1,28 +1,210 @@
 """BaseModel module."""
 
+import dis
+import inspect
+from contextlib import contextmanager
 from functools import wraps
-from typing import Any
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from ..types import DictStrAny
+from ..profiling import BUILD_PROPS
+from ..types import DictStrAny, Sink
+
+# Values of these types are sent as is, others are converted to strings.
+PASS_THROUGH_TYPES = (list, dict)
+# Instructions of a method that only loads values and makes a single call.
+_CALL_OPS = frozenset({"CALL", "CALL_KW", "CALL_FUNCTION_KW", "CALL_METHOD"})
+_PLAIN_OPS = frozenset(
+    {
+        "RESUME",
+        "NOP",
+        "CACHE",
+        "EXTENDED_ARG",
+        "COPY_FREE_VARS",
+        "PUSH_NULL",
+        "PRECALL",
+        "KW_NAMES",
+        "RETURN_VALUE",
+        "RETURN_CONST",
+    }
+)
+
+# Number of sets of keyword names remembered per method.
+MAX_KEYWORD_SETS = 64
+_EMPTY = inspect.Parameter.empty
+
+PropsBuilder = Callable[[DictStrAny], Optional[DictStrAny]]
+
+
+class _Probe:
+    """
+    Stands in for a model to record what a method passes to ``_call_with_props``.
+    """
+
+    def __init__(self) -> None:
+        self.properties: Optional[DictStrAny] = None
+
+    def _call_with_props(self, **properties: Any) -> "_Probe":
+        self.properties = properties
+        return self
+
+
+def _is_plain(func: Callable) -> bool:
+    """
+    Whether the method only loads arguments and constants and makes a single
+    call, without branches, loops or other operations.
+    """
+    calls = 0
+    for instruction in dis.get_instructions(func):
+        if instruction.opname in _CALL_OPS:
+            calls += 1
+        elif not (
+            instruction.opname in _PLAIN_OPS or instruction.opname.startswith("LOAD_")
+        ):
+            return False
+    return calls == 1
+
+
+def props_builder(func: Callable) -> Optional[PropsBuilder]:
+    """
+    Build properties of a method from its keyword arguments directly,
+    without calling it, for methods that only pass their parameters and
+    constants to ``_call_with_props``.
+
+    API keys of parameters are found once by calling the method with
+    placeholder arguments, and constants and defaults are converted in advance,
+    so a call converts only the arguments that were passed. Keys for every
+    set of keyword names are looked up once as well.
+
+    :param func: method to build properties for.
+    :return: builder that returns properties for keyword arguments of the
+        method (``None`` if they do not match its parameters), or ``None``
+        if the method does more than passing them.
+    """
+    if not _is_plain(func):
+        return None
+    params = list(inspect.signature(func).parameters.values())[1:]
+    kinds = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    if any(param.kind not in kinds for param in params):
+        return None
+    placeholders = {param.name: object() for param in params}
+    probe = _Probe()
+    try:
+        result = func(probe, **placeholders)
+    except Exception:
+        return None
+    if result is not probe or probe.properties is None:
+        return None
+    names = {id(value): name for name, value in placeholders.items()}
+    defaults = {param.name: param.default for param in params}
+    keys: Dict[str, str] = {}
+    base: DictStrAny = {}
+    for key, value in probe.properties.items():
+        name = names.get(id(value))
+        if name is not None:
+            if name in keys:
+                return None
+            keys[name] = key
+            value = defaults[name]
+            if value is _EMPTY:
+                continue
+        if value is not None:
+            base[key] = value if isinstance(value, PASS_THROUGH_TYPES) else str(value)
+    required = frozenset(name for name, value in defaults.items() if value is _EMPTY)
+    accepted = frozenset(defaults)
+    shapes: Dict[Tuple[str, ...], Tuple[Optional[str], ...]] = {}
+
+    def build(kwargs: DictStrAny) -> Optional[DictStrAny]:
+        shape = tuple(kwargs)
+        api_keys = shapes.get(shape)
+        if api_keys is None:
+            if not required <= kwargs.keys() <= accepted:
+                return None
+            api_keys = tuple(keys.get(name) for name in shape)
+            if len(shapes) < MAX_KEYWORD_SETS:
+                shapes[shape] = api_keys
+        props = base.copy()
+        for key, value in zip(api_keys, kwargs.values()):
+            if key is None:
+                continue
+            if type(value) is str:
+                props[key] = value
+            elif value is None:
+                props.pop(key, None)
+            else:
+                props[key] = (
+                    value if isinstance(value, PASS_THROUGH_TYPES) else str(value)
+                )
+        return props
+
+    return build
 
 
 def api_method(method_name: str):
     """
     Decorator for methods to provide the api method name.
+    Methods that only pass their parameters to ``_call_with_props`` get their
+    properties from a builder prepared once (see ``props_builder``) when
+    called with keyword arguments.
     :param method_name: name of the method from API.
     """
 
-    def decorator(func):
+    def decorator(func: Callable) -> Callable:
+        # Profiler keys by model name, so that profiled calls do not format them.
+        profiler_keys: Dict[str, str] = {}
+        build = props_builder(func)
+
+        def props_of(self, args, kwargs):
+            if (
+                build is None
+                or args
+                or self._call_with_props is not _call_with_props
+                or (props := build(kwargs)) is None
+            ):
+                return func(self, *args, **kwargs)
+            return props
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            props = func(self, *args, **kwargs)
+            profiler = getattr(self._client, "profiler", None)
+            if profiler is None:
+                return self._call(method_name, props_of(self, args, kwargs))
+            key = profiler_keys.get(self.name)
+            if key is None:
+                key = profiler_keys[self.name] = f"{self.name}.{method_name}"
+            with profiler.measure(key, BUILD_PROPS):
+                props = props_of(self, args, kwargs)
             return self._call(method_name, props)
 
+        wrapper.api_method_name = method_name  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
 
 
+@contextmanager
+def open_sink(sink: Sink) -> Iterator[BinaryIO]:
+    """
+    Open sink for writing if it is a path, otherwise use it as is.
+
+    :param sink: file path or binary file-like object.
+    """
+    if hasattr(sink, "write"):
+        yield sink  # type: ignore[misc]
+        return
+    with open(sink, "wb") as file:  # type: ignore[arg-type]
+        yield file
+
+
 class BaseModel:
     """
     Base model class for all models.
@@ -43,6 +225,72 @@ class BaseModel:
         """
         return self._client.send(self.name, method, props)
 
+    def _download(
+        self,
+        method: str,
+        props_list: List[DictStrAny],
+        sink: Sink,
+        header_lines: int = 0,
+    ):
+        """
+        Wraps streaming download of one or more calls into the same sink.
+        Response bodies are written one after another in order of ``props_list``.
+
+        :param method: name of the called method from API.
+        :param props_list: payloads to send to API, one request per payload.
+        :param sink: file path or binary file-like object.
+        :param header_lines: number of header lines of every body; they are
+            written only for the first one.
+        :return: number of written bytes.
+        """
+        if self._client.async_mode:
+            return self._download_async(method, props_list, sink, header_lines)
+        with open_sink(sink) as file:
+            return sum(
+                self._client.download(
+                    self.name, method, props, file, skip_lines=header_lines if i else 0
+                )
+                for i, props in enumerate(props_list)
+            )
+
+    async def _download_async(
+        self,
+        method: str,
+        props_list: List[DictStrAny],
+        sink: Sink,
+        header_lines: int = 0,
+    ) -> int:
+        """
+        Async version of ``_download``.
+        """
+        written = 0
+        with open_sink(sink) as file:
+            for i, props in enumerate(props_list):
+                written += await self._client.download(
+                    self.name, method, props, file, skip_lines=header_lines if i else 0
+                )
+        return written
+
+    def stream(self, method: Union[str, Callable], *args: Any, **kwargs: Any):
+        """
+        Call the API method of the model in streaming mode: items of ``data``
+        are parsed and yielded one by one while the response is received.
+
+            for warehouse in client.address.stream("get_warehouses", city_ref=ref):
+                ...
+
+        :param method: API method of the model or its name.
+        :param args: positional arguments of the method.
+        :param kwargs: keyword arguments of the method.
+        :return: item stream (see ``NovaPoshtaApi.stream``).
+        """
+        bound = getattr(self, method) if isinstance(method, str) else method
+        func: Any = getattr(bound, "__func__", bound)
+        if not hasattr(func, "api_method_name"):
+            raise ValueError(f"{func.__name__} is not an API method")
+        props = func.__wrapped__(self, *args, **kwargs)
+        return self._client.stream(self.name, func.api_method_name, props)
+
     @staticmethod
     def _call_with_props(**properties: Any):
         """
@@ -52,7 +300,7 @@ class BaseModel:
         :return: filtered properties.
         """
         props = {
-            k: str(v) if not isinstance(v, (list, dict)) else v
+            k: str(v) if not isinstance(v, PASS_THROUGH_TYPES) else v
             for k, v in properties.items()
             if v is not None
         }
@@ -63,3 +311,6 @@ class BaseModel:
         String representation of the model.
         """
         return self.name
+
+
+_call_with_props = BaseModel._call_with_props
@@ -1,11 +1,44 @@
 """InternetDocument model module."""
 
-from typing import List
+from typing import Dict, Iterable, List, Optional, Union
 
-from ..types import OptDict, OptInt, OptListOfDicts, OptStr, OptStrOrNum, StrOrNum
+from ..bulk import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONCURRENCY,
+    chunked,
+    format_errors,
+    run_bulk,
+)
+from ..types import (
+    DictStrAny,
+    OptDict,
+    OptFloat,
+    OptInt,
+    OptListOfDicts,
+    OptStr,
+    OptStrOrNum,
+    Sink,
+    StrOrNum,
+)
 from .base import BaseModel, api_method
 
 
+def _deleted_outcomes(
+    refs: List[str], response: DictStrAny
+) -> Dict[str, Optional[str]]:
+    """
+    Match references returned by ``delete`` method with requested ones.
+
+    :param refs: references sent in the request.
+    :param response: response dict.
+    :return: mapping of reference to error message (``None`` for success).
+    """
+    data = response.get("data") or []
+    deleted = {item.get("Ref") for item in data if isinstance(item, dict)}
+    error_msg = format_errors(response.get("errors") or "Document was not deleted")
+    return {ref: None if ref in deleted else error_msg for ref in refs}
+
+
 class InternetDocument(BaseModel):
     """
     InternetDocument model class.
@@ -345,7 +378,7 @@ class InternetDocument(BaseModel):
         )
 
     @api_method("delete")
-    def delete(self, document_refs: str):
+    def delete(self, document_refs: Union[str, List[str]]):
         """
         Delete document (delivery).
 
@@ -354,6 +387,35 @@ class InternetDocument(BaseModel):
         """
         return self._call_with_props(DocumentRefs=document_refs)
 
+    def delete_bulk(
+        self,
+        document_refs: Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit: OptFloat = None,
+        retries: int = 1,
+    ):
+        """
+        Delete any number of documents (deliveries) by chunks sent concurrently.
+
+        :param document_refs: document references.
+        :param chunk_size: maximum number of documents per request.
+        :param concurrency: maximum number of requests in flight.
+        :param rate_limit: maximum number of requests started per second.
+        :param retries: how many times failed documents are retried.
+        :return: bulk result with per-document outcomes.
+        """
+        return run_bulk(
+            self.delete,
+            document_refs,
+            self._client.async_mode,
+            extract=_deleted_outcomes,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            retries=retries,
+            rate_limit=rate_limit,
+        )
+
     @api_method("generateReport")
     def generate_report(self, document_refs: List[str], _type: str, date_time: str):
         """
@@ -367,3 +429,41 @@ class InternetDocument(BaseModel):
         return self._call_with_props(
             DocumentRefs=document_refs, Type=_type, DateTime=date_time
         )
+
+    def download_report(
+        self,
+        sink: Sink,
+        document_refs: List[str],
+        _type: str,
+        date_time: str,
+        refs_per_request: OptInt = None,
+    ):
+        """
+        Generate report and stream it into a file without holding it in memory.
+        When ``refs_per_request`` is set, references are split into several
+        ``generateReport`` requests and their reports are concatenated into the sink.
+        Only ``csv`` reports can be split: the header line is written once, for
+        the first request.
+
+        :param sink: file path or binary file-like object.
+        :param document_refs: document references.
+        :param _type: type.
+        :param date_time: date and time.
+        :param refs_per_request: maximum number of references per request.
+        :return: number of written bytes.
+        :raises ValueError: if a report of other type has to be split.
+        """
+        chunks = (
+            chunked(document_refs, refs_per_request)
+            if refs_per_request
+            else [document_refs]
+        )
+        if len(chunks) > 1 and _type.lower() != "csv":
+            raise ValueError(
+                f"{_type} reports cannot be split into several requests, only csv"
+            )
+        props_list = [
+            self._call_with_props(DocumentRefs=chunk, Type=_type, DateTime=date_time)
+            for chunk in chunks
+        ]
+        return self._download("generateReport", props_list, sink, header_lines=1)
@@ -1,7 +1,8 @@
 """ScanSheet model module."""
 
-from typing import List
+from typing import Iterable, List
 
+from ..bulk import DEFAULT_CHUNK_SIZE, DEFAULT_CONCURRENCY, run_bulk
 from .base import BaseModel, api_method
 
 
@@ -63,3 +64,87 @@ class ScanSheet(BaseModel):
         :param ref: reference.
         """
         return self._call_with_props(DocumentRefs=document_refs, Ref=ref)
+
+    def insert_documents_bulk(
+        self,
+        document_refs: Iterable[str],
+        ref: str,
+        date: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = 1,
+        retries: int = 1,
+    ):
+        """
+        Insert any number of documents into the scan sheet by chunks.
+        Chunks are sent one by one by default, since all of them modify the same scan sheet.
+
+        :param document_refs: document references.
+        :param ref: scan sheet reference.
+        :param date: date.
+        :param chunk_size: maximum number of documents per request.
+        :param concurrency: maximum number of requests in flight.
+        :param retries: how many times failed documents are retried.
+        :return: bulk result.
+        """
+        return run_bulk(
+            lambda chunk: self.insert_documents(chunk, ref, date),
+            document_refs,
+            self._client.async_mode,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            retries=retries,
+        )
+
+    def remove_documents_bulk(
+        self,
+        document_refs: Iterable[str],
+        ref: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = 1,
+        retries: int = 1,
+    ):
+        """
+        Remove any number of documents from the scan sheet by chunks.
+        Chunks are sent one by one by default, since all of them modify the same scan sheet.
+
+        :param document_refs: document references.
+        :param ref: scan sheet reference.
+        :param chunk_size: maximum number of documents per request.
+        :param concurrency: maximum number of requests in flight.
+        :param retries: how many times failed documents are retried.
+        :return: bulk result.
+        """
+        return run_bulk(
+            lambda chunk: self.remove_documents(chunk, ref),
+            document_refs,
+            self._client.async_mode,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            retries=retries,
+        )
+
+    def delete_scan_sheet_bulk(
+        self,
+        scan_sheet_refs: Iterable[str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = 1,
+    ):
+        """
+        Delete any number of scan sheets by chunks.
+        Scan sheets are independent, so chunks are sent concurrently.
+
+        :param scan_sheet_refs: scan sheet references.
+        :param chunk_size: maximum number of scan sheets per request.
+        :param concurrency: maximum number of requests in flight.
+        :param retries: how many times failed scan sheets are retried.
+        :return: bulk result.
+        """
+        return run_bulk(
+            self.delete_scan_sheet,
+            scan_sheet_refs,
+            self._client.async_mode,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+            retries=retries,
+        )
@@ -0,0 +1,197 @@
+"""Profiling of client-side overhead of API calls."""
+
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from typing import Any, ContextManager, Dict, Final, Iterator, List, Optional, Tuple
+
+BUILD_PROPS: Final[str] = "build_props"
+ENCODE: Final[str] = "encode"
+NETWORK: Final[str] = "network"
+DECODE: Final[str] = "decode"
+CHECK_ERRORS: Final[str] = "check_errors"
+
+PHASES: Final[Tuple[str, ...]] = (BUILD_PROPS, ENCODE, NETWORK, DECODE, CHECK_ERRORS)
+
+
+@dataclass
+class PhaseStats:
+    """
+    Aggregated measurements of a single phase of a method.
+    ``allocated`` is the net change of traced memory in bytes, summed over calls;
+    it is only filled when ``tracemalloc`` is tracing.
+    """
+
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    allocated: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        """
+        Mean duration of the phase in seconds.
+        """
+        return self.total_time / self.count if self.count else 0.0
+
+    def add(self, seconds: float, allocated: Optional[int]) -> None:
+        """
+        Add a single measurement.
+
+        :param seconds: duration of the phase.
+        :param allocated: net allocated bytes, if traced.
+        """
+        self.count += 1
+        self.total_time += seconds
+        self.max_time = max(self.max_time, seconds)
+        if allocated is not None:
+            self.allocated += allocated
+
+
+class Profiler:
+    """
+    Measures time and allocations of every client-side phase of API calls
+    and aggregates them per ``modelName.calledMethod``.
+
+    Phases are ``build_props`` (model method body), ``encode`` (building and
+    serializing request data), ``network``, ``decode`` (parsing response body)
+    and ``check_errors``. Allocations are measured as the difference of traced
+    memory before and after a phase, without touching global ``tracemalloc``
+    state, so concurrent calls do not disturb each other's measurements; but
+    allocations of other threads and coroutines running at the same time
+    (e.g. during the async ``network`` phase) are included.
+    """
+
+    def __init__(self, trace_allocations: bool = True):
+        """
+        Initialize the profiler.
+
+        :param trace_allocations: whether to measure allocations via ``tracemalloc``.
+        """
+        self.trace_allocations = trace_allocations
+        self._stats: Dict[str, Dict[str, PhaseStats]] = {}
+        self._lock = threading.Lock()
+        self._started_tracing = False
+
+    def start(self) -> "Profiler":
+        """
+        Start tracing allocations if requested and not traced already.
+
+        :return: the profiler itself.
+        """
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop tracing allocations if it was started by this profiler.
+        """
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _memory(self) -> Optional[int]:
+        if not self.trace_allocations or not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.get_traced_memory()[0]
+
+    @contextmanager
+    def measure(self, key: str, phase: str) -> Iterator[None]:
+        """
+        Measure the wrapped block as a phase of the method.
+
+        :param key: name of the call in ``modelName.calledMethod`` form.
+        :param phase: name of the phase.
+        """
+        before = self._memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            allocated = None
+            if before is not None and tracemalloc.is_tracing():
+                allocated = tracemalloc.get_traced_memory()[0] - before
+            self.record(key, phase, seconds, allocated)
+
+    def record(
+        self,
+        key: str,
+        phase: str,
+        seconds: float,
+        allocated: Optional[int] = None,
+    ) -> None:
+        """
+        Record a single measurement of a phase.
+
+        :param key: name of the call in ``modelName.calledMethod`` form.
+        :param phase: name of the phase.
+        :param seconds: duration of the phase.
+        :param allocated: net allocated bytes, if traced.
+        """
+        with self._lock:
+            phases = self._stats.setdefault(key, {})
+            phases.setdefault(phase, PhaseStats()).add(seconds, allocated)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregated measurements per method.
+        ``client_time`` is the total time spent outside of the network phase.
+
+        :return: mapping of method to its calls, client time and phase stats.
+        """
+        with self._lock:
+            result = {}
+            for key, phases in self._stats.items():
+                result[key] = {
+                    "calls": max(s.count for s in phases.values()),
+                    "client_time": sum(
+                        s.total_time for p, s in phases.items() if p != NETWORK
+                    ),
+                    "phases": {
+                        phase: dict(asdict(stats), mean_time=stats.mean_time)
+                        for phase, stats in phases.items()
+                    },
+                }
+            return result
+
+    def report(self) -> str:
+        """
+        Render measurements as a text table sorted by client time.
+        """
+        lines: List[str] = [
+            f"{'method':<45} {'phase':<13} {'calls':>7} {'mean ms':>9} "
+            f"{'max ms':>9} {'alloc KiB':>10}"
+        ]
+        snapshot = self.snapshot()
+        for key in sorted(snapshot, key=lambda k: -snapshot[k]["client_time"]):
+            for phase in PHASES:
+                stats = snapshot[key]["phases"].get(phase)
+                if stats is None:
+                    continue
+                lines.append(
+                    f"{key:<45} {phase:<13} {stats['count']:>7} "
+                    f"{stats['mean_time'] * 1000:>9.3f} {stats['max_time'] * 1000:>9.3f} "
+                    f"{stats['allocated'] / 1024:>10.1f}"
+                )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """
+        Drop all measurements.
+        """
+        with self._lock:
+            self._stats.clear()
+
+
+def measure(profiler: Optional[Profiler], key: str, phase: str) -> ContextManager:
+    """
+    Measure a phase with the profiler, or do nothing when profiling is disabled.
+    """
+    if profiler is None:
+        return nullcontext()
+    return profiler.measure(key, phase)
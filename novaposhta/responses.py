@@ -0,0 +1,218 @@
+"""Response wrappers that avoid decoding the whole body up front."""
+
+import re
+from typing import Any, Final, Iterator, List, Mapping, Optional, Sequence, Union
+
+from .serializers import Serializer, get_serializer
+from .streaming import ItemParser
+from .types import DictStrAny
+
+# The API puts ``success`` first in every response object.
+_SUCCESS_PREFIX = re.compile(rb'\s*\{\s*"success"\s*:\s*(true|false)\b')
+# Bytes of the body parsed at a time by lazy responses.
+LAZY_CHUNK_SIZE: Final[int] = 16 * 1024
+
+
+def leading_success(content: bytes) -> Optional[bool]:
+    """
+    ``success`` flag from the start of an API response body, without decoding it.
+
+    :param content: response body or its first bytes.
+    :return: the flag, or ``None`` if the body does not start with it.
+    """
+    match = _SUCCESS_PREFIX.match(content)
+    return None if match is None else match.group(1) == b"true"
+
+
+class RawResponse:
+    """
+    Undecoded body of an API response, e.g. for forwarding it as is.
+    ``success`` is found by scanning the start of the body; the body is
+    decoded only when it cannot be found that way or when ``errors`` of a
+    failed call are requested.
+    """
+
+    __slots__ = ("content", "status_code", "_serializer", "_decoded")
+
+    def __init__(
+        self,
+        content: bytes,
+        status_code: int = 200,
+        serializer: Optional[Serializer] = None,
+    ):
+        """
+        :param content: response body.
+        :param status_code: HTTP status of the response.
+        :param serializer: serializer to decode the body with when needed.
+        """
+        self.content = content
+        self.status_code = status_code
+        self._serializer = serializer
+        self._decoded: Optional[DictStrAny] = None
+
+    def json(self) -> DictStrAny:
+        """
+        Decode the body (once).
+
+        :return: response dict.
+        """
+        if self._decoded is None:
+            if self._serializer is None:
+                self._serializer = get_serializer()
+            self._decoded = self._serializer.loads(self.content)
+        return self._decoded
+
+    @property
+    def success(self) -> bool:
+        """
+        ``success`` flag of the response; ``False`` if the body is not valid JSON.
+        """
+        success = leading_success(self.content)
+        if success is not None:
+            return success
+        try:
+            response = self.json()
+        except ValueError:
+            return False
+        return isinstance(response, dict) and bool(response.get("success"))
+
+    @property
+    def errors(self) -> Any:
+        """
+        ``errors`` of the response (decodes the body only if the call failed).
+        """
+        if self.success:
+            return []
+        return self.json().get("errors", [])
+
+    def __bytes__(self) -> bytes:
+        return self.content
+
+    def __len__(self) -> int:
+        return len(self.content)
+
+    def __repr__(self) -> str:
+        return f"<RawResponse [{self.status_code}] {len(self.content)} bytes>"
+
+
+class LazyItems(Sequence):
+    """
+    Items of ``data`` of a lazy response, parsed from the body as far as
+    they are indexed or iterated.
+    """
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response: "LazyResponse"):
+        """
+        :param response: response the items belong to.
+        """
+        self._response = response
+
+    def __len__(self) -> int:
+        self._response._parse_all()
+        return len(self._response._items)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        response = self._response
+        if isinstance(index, slice) or index < 0:
+            response._parse_all()
+        else:
+            while len(response._items) <= index and response._advance():
+                pass
+        return response._items[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        response = self._response
+        index = 0
+        while index < len(response._items) or response._advance():
+            if index < len(response._items):
+                yield response._items[index]
+                index += 1
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyItems)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<LazyItems [{len(self._response._items)} parsed]>"
+
+
+class LazyResponse(Mapping[str, Any]):
+    """
+    Read-only response dict that parses the body only as far as it is read:
+    ``response["data"][0]["Ref"]`` decodes the fields before ``data`` and its
+    first item, not the rest of the list. Reading every item is slower than
+    decoding the whole body at once, so use it when only a few items are read.
+    Fields after ``data`` (``errors``, ``info``...) are found by parsing all
+    items; use ``to_dict`` where a real ``dict`` is required.
+    Invalid JSON raises ``ValueError`` when the broken part is read.
+    """
+
+    __slots__ = ("content", "_parser", "_items", "_offset", "_done", "_data")
+
+    def __init__(self, content: bytes):
+        """
+        :param content: response body.
+        """
+        self.content = content
+        self._parser = ItemParser()
+        self._items: List[Any] = []
+        self._offset = 0
+        self._done = False
+        self._data = LazyItems(self)
+
+    def _advance(self) -> bool:
+        """
+        Parse the next chunk of the body.
+
+        :return: ``False`` if the whole body was already parsed.
+        """
+        if self._done:
+            return False
+        chunk = self.content[self._offset : self._offset + LAZY_CHUNK_SIZE]
+        if chunk:
+            self._offset += len(chunk)
+            self._items.extend(self._parser.feed(chunk))
+        else:
+            self._done = True
+            self._items.extend(self._parser.close())
+        return True
+
+    def _parse_all(self) -> None:
+        while self._advance():
+            pass
+
+    def __getitem__(self, key: str) -> Any:
+        parser = self._parser
+        while True:
+            if key in parser.envelope:
+                return parser.envelope[key]
+            if key == "data" and parser.data_index is not None:
+                return self._data
+            if not self._advance():
+                raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        self._parse_all()
+        keys = list(self._parser.envelope)
+        if self._parser.data_index is not None:
+            keys.insert(self._parser.data_index, "data")
+        return iter(keys)
+
+    def __len__(self) -> int:
+        self._parse_all()
+        return len(self._parser.envelope) + (self._parser.data_index is not None)
+
+    def to_dict(self) -> DictStrAny:
+        """
+        Fully decoded response as a plain dict.
+        """
+        return {
+            key: list(value) if isinstance(value, LazyItems) else value
+            for key, value in self.items()
+        }
+
+    def __repr__(self) -> str:
+        return f"<LazyResponse {len(self.content)} bytes>"
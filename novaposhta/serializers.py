@@ -0,0 +1,122 @@
+"""Pluggable JSON serializers for request and response bodies."""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Final, Tuple, Union
+
+
+class Serializer(ABC):
+    """
+    JSON serializer: encodes objects into UTF-8 bytes and decodes them back.
+    Encoded output is compact and keeps non-ASCII characters as is.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode object into JSON bytes.
+        """
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode JSON bytes.
+        """
+
+
+class StdlibSerializer(Serializer):
+    """
+    Serializer based on the standard ``json`` module.
+    """
+
+    name = "json"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer(Serializer):
+    """
+    Serializer based on ``orjson``.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+
+class MsgspecSerializer(Serializer):
+    """
+    Serializer based on ``msgspec``.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._dumps = msgspec.json.Encoder().encode
+        self._loads = msgspec.json.Decoder().decode
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._loads(data)
+
+    def __reduce__(self) -> Tuple[type, Tuple[()]]:
+        """
+        Pickle by creating a new serializer, since msgspec encoder and decoder
+        can not be pickled (e.g. to decode in ``ProcessPoolExecutor``).
+        """
+        return type(self), ()
+
+
+SERIALIZERS: Final[Dict[str, Callable[[], Serializer]]] = {
+    OrjsonSerializer.name: OrjsonSerializer,
+    MsgspecSerializer.name: MsgspecSerializer,
+    StdlibSerializer.name: StdlibSerializer,
+}
+
+
+def get_serializer(serializer: Union[str, Serializer, None] = None) -> Serializer:
+    """
+    Resolve serializer by name.
+    Without a name the fastest installed one is used: ``orjson``,
+    then ``msgspec``, then the standard library.
+
+    :param serializer: serializer instance, its name or ``None``.
+    :return: serializer.
+    :raises ValueError: if the name is unknown.
+    :raises ImportError: if the requested library is not installed.
+    """
+    if isinstance(serializer, Serializer):
+        return serializer
+    if serializer is not None:
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown serializer: {serializer}")
+        return SERIALIZERS[serializer]()
+    for factory in (OrjsonSerializer, MsgspecSerializer):
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return StdlibSerializer()
@@ -0,0 +1,187 @@
+"""Log of slow (and sampled) API calls with redacted payloads."""
+
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, Final, List, Optional
+
+from .hooks import AFTER_RESPONSE, ON_ERROR, RequestInfo
+
+REDACTED: Final[str] = "***"
+SENSITIVE_KEYS: Final[re.Pattern] = re.compile(r"apikey|phone", re.IGNORECASE)
+# Ukrainian phone numbers: 0XX XXX XX XX with optional +38 prefix, brackets and
+# separators. Digits around are not allowed, so that e.g. document numbers are kept.
+PHONE_NUMBER: Final[re.Pattern] = re.compile(
+    r"(?<![\d+])(?:\+?38[\s\-]?)?(?:\(0\d{2}\)|0\d{2})"
+    r"[\s\-]?\d{3}[\s\-]?\d{2}[\s\-]?\d{2}(?!\d)"
+)
+
+
+def _summarize(value: Any, max_length: int, max_items: int) -> Any:
+    """
+    Summarize a single value: redact phone numbers, cut long strings and lists.
+    """
+    if isinstance(value, dict):
+        return summarize_props(value, max_length, max_items)
+    if isinstance(value, list):
+        items = [_summarize(v, max_length, max_items) for v in value[:max_items]]
+        if len(value) > max_items:
+            items.append(f"... ({len(value)} items)")
+        return items
+    if isinstance(value, str):
+        value = PHONE_NUMBER.sub(REDACTED, value)
+        if len(value) > max_length:
+            return f"{value[:max_length]}... ({len(value)} chars)"
+    return value
+
+
+def summarize_props(
+    props: Dict[str, Any], max_length: int = 64, max_items: int = 5
+) -> Dict[str, Any]:
+    """
+    Build a compact copy of method properties safe for logging.
+    Values of API keys and phone fields are replaced, phone numbers inside
+    other strings are masked, long strings and lists are cut.
+
+    :param props: method properties.
+    :param max_length: maximum length of string values.
+    :param max_items: maximum number of list items.
+    :return: summarized properties.
+    """
+    return {
+        key: (
+            REDACTED
+            if SENSITIVE_KEYS.search(key)
+            else _summarize(value, max_length, max_items)
+        )
+        for key, value in props.items()
+    }
+
+
+@dataclass
+class CallRecord:
+    """
+    Entry of the slow-call log.
+    """
+
+    timestamp: float
+    method: str
+    props: Dict[str, Any]
+    total_time: Optional[float]
+    serialize_time: Optional[float]
+    network_time: Optional[float]
+    decode_time: Optional[float]
+    request_size: Optional[int]
+    response_size: Optional[int]
+    slow: bool
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert record to a plain dict.
+        """
+        return asdict(self)
+
+
+class SlowCallLog:
+    """
+    Records calls slower than the threshold and a sampled fraction of other calls
+    into a bounded ring buffer and, optionally, a logger.
+    Fast calls that are not sampled cost a single comparison.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 1.0,
+        sample_rate: float = 0.0,
+        maxlen: int = 1000,
+        logger: Optional[logging.Logger] = None,
+        max_value_length: int = 64,
+    ):
+        """
+        Initialize the log.
+
+        :param threshold: latency in seconds from which calls are considered slow.
+        :param sample_rate: fraction (0..1) of other calls to record.
+        :param maxlen: maximum number of kept records.
+        :param logger: logger to write records to (slow calls as warnings, sampled as info).
+        :param max_value_length: maximum length of string values in props summary.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1")
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.logger = logger
+        self.max_value_length = max_value_length
+        self.records: Deque[CallRecord] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def attach(self, client: Any) -> "SlowCallLog":
+        """
+        Start recording calls of the client.
+
+        :param client: ``NovaPoshtaApi`` instance.
+        :return: the log itself.
+        """
+        client.add_hook(AFTER_RESPONSE, self.on_call)
+        client.add_hook(ON_ERROR, self.on_call)
+        return self
+
+    def detach(self, client: Any) -> None:
+        """
+        Stop recording calls of the client.
+
+        :param client: ``NovaPoshtaApi`` instance.
+        """
+        client.remove_hook(AFTER_RESPONSE, self.on_call)
+        client.remove_hook(ON_ERROR, self.on_call)
+
+    def on_call(self, info: RequestInfo) -> None:
+        """
+        Hook for ``after_response`` and ``on_error`` events.
+        """
+        slow = (info.total_time or 0) >= self.threshold
+        if not slow and (not self.sample_rate or random.random() >= self.sample_rate):
+            return
+        record = CallRecord(
+            timestamp=time.time(),
+            method=info.key,
+            props=summarize_props(info.method_props, self.max_value_length),
+            total_time=info.total_time,
+            serialize_time=info.serialize_time,
+            network_time=info.network_time,
+            decode_time=info.decode_time,
+            request_size=info.request_size,
+            response_size=info.response_size,
+            slow=slow,
+            error=repr(info.error) if info.error is not None else None,
+        )
+        with self._lock:
+            self.records.append(record)
+        if self.logger:
+            self.logger.log(
+                logging.WARNING if slow else logging.INFO,
+                "%s call %s took %.3fs",
+                "Slow" if slow else "Sampled",
+                record.method,
+                record.total_time or 0,
+                extra={"novaposhta_call": record.to_dict()},
+            )
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Copy of kept records as plain dicts, oldest first.
+        """
+        with self._lock:
+            return [record.to_dict() for record in self.records]
+
+    def clear(self) -> None:
+        """
+        Drop all kept records.
+        """
+        with self._lock:
+            self.records.clear()
@@ -0,0 +1,254 @@
+"""Incremental parsing of ``data`` items from streamed API responses."""
+
+import codecs
+import json
+import re
+from contextlib import nullcontext
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    Iterator,
+    List,
+    Optional,
+)
+
+import httpx
+
+from .types import DictStrAny
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_MISSING = object()
+
+_START, _KEY, _COLON, _VALUE, _ITEMS, _DONE = range(6)
+
+
+class ItemParser:
+    """
+    Push parser for the API response object. Items of the top-level ``data``
+    array are returned as soon as they are complete; other top-level fields
+    (``success``, ``errors``, ``info``...) are collected into ``envelope``;
+    ``data_index`` is the position of ``data`` among them once the array is found.
+    Memory use depends on the size of a single item, not of the whole body.
+    """
+
+    def __init__(self) -> None:
+        self.envelope: DictStrAny = {}
+        self.data_index: Optional[int] = None
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key: Optional[str] = None
+        self._final = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Consume next chunk of the body.
+
+        :param chunk: bytes of the body.
+        :return: items of ``data`` completed by the chunk.
+        """
+        self._buffer = self._buffer[self._pos :] + self._utf8.decode(chunk)
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """
+        Finish parsing after the last chunk.
+
+        :return: remaining items of ``data``.
+        :raises ValueError: if the body is not a complete JSON object.
+        """
+        self._buffer = self._buffer[self._pos :] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        self._final = True
+        items = self._parse()
+        if self._state != _DONE:
+            raise ValueError("Incomplete JSON response")
+        return items
+
+    def _next_char(self) -> Optional[str]:
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+        if self._pos >= len(self._buffer):
+            return None
+        return self._buffer[self._pos]
+
+    def _value(self) -> Any:
+        """
+        Decode the value at the current position. A value is accepted only when
+        something follows it, so that e.g. a number cut by a chunk border is not
+        taken for a complete one.
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            return _MISSING
+        if end >= len(self._buffer) and not self._final:
+            return _MISSING
+        self._pos = end
+        return value
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} at {self._pos}, got {char!r}")
+        self._pos += 1
+
+    def _parse(self) -> List[Any]:
+        items: List[Any] = []
+        while True:
+            char = self._next_char()
+            if char is None:
+                return items
+            if self._state == _START:
+                self._expect(char, "{")
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char in ",}":
+                    self._pos += 1
+                    self._state = _DONE if char == "}" else _KEY
+                    continue
+                key = self._value()
+                if key is _MISSING:
+                    return items
+                self._key, self._state = key, _COLON
+            elif self._state == _COLON:
+                self._expect(char, ":")
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                if self._key == "data" and char == "[":
+                    self.data_index = len(self.envelope)
+                    self._pos += 1
+                    self._state = _ITEMS
+                    continue
+                value = self._value()
+                if value is _MISSING:
+                    return items
+                self.envelope[str(self._key)] = value
+                self._state = _KEY
+            elif self._state == _ITEMS:
+                if char in ",]":
+                    self._pos += 1
+                    self._state = _KEY if char == "]" else _ITEMS
+                    continue
+                item = self._value()
+                if item is _MISSING:
+                    return items
+                items.append(item)
+            else:
+                raise ValueError(f"Unexpected data after response at {self._pos}")
+
+
+class ItemStream:
+    """
+    Items of ``data`` of a streamed response.
+    Responses with an HTTP error status raise ``httpx.HTTPStatusError``
+    before any item is parsed. Other fields of the response (``success``, ``errors``...) are available
+    in ``envelope`` once all items were consumed; ``received`` is the number
+    of body bytes received so far.
+    """
+
+    def __init__(
+        self,
+        on_finish: Callable[[DictStrAny], Any],
+        chunk_size: int,
+        track: Optional[Callable[["ItemStream"], ContextManager[Any]]] = None,
+    ):
+        """
+        :param on_finish: called with the envelope after the last item
+            (e.g. to raise on API errors).
+        :param chunk_size: size of chunks to read from network.
+        :param track: called with the stream to get a context manager that
+            wraps the whole iteration (e.g. to emit hook events).
+        """
+        self.envelope: Optional[DictStrAny] = None
+        self.received = 0
+        self._on_finish = on_finish
+        self._chunk_size = chunk_size
+        self._track = track
+
+    def _tracked(self) -> ContextManager[Any]:
+        return nullcontext() if self._track is None else self._track(self)
+
+    @property
+    def success(self) -> Optional[bool]:
+        """
+        ``success`` flag of the response (``None`` until the stream is consumed).
+        """
+        return None if self.envelope is None else self.envelope.get("success")
+
+    @property
+    def errors(self) -> Any:
+        """
+        ``errors`` of the response (``None`` until the stream is consumed).
+        """
+        return None if self.envelope is None else self.envelope.get("errors")
+
+    def _finish(self, parser: ItemParser) -> None:
+        self.envelope = parser.envelope
+        self._on_finish(parser.envelope)
+
+
+class SyncItemStream(ItemStream):
+    """
+    Items of a streamed response for sync clients.
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[], ContextManager[httpx.Response]],
+        on_finish: Callable[[DictStrAny], Any],
+        chunk_size: int,
+        track: Optional[Callable[[ItemStream], ContextManager[Any]]] = None,
+    ):
+        super().__init__(on_finish, chunk_size, track)
+        self._open_stream = open_stream
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._tracked():
+            parser = ItemParser()
+            with self._open_stream() as response:
+                if response.is_error:
+                    response.read()
+                    response.raise_for_status()
+                for chunk in response.iter_bytes(self._chunk_size):
+                    self.received += len(chunk)
+                    yield from parser.feed(chunk)
+            yield from parser.close()
+            self._finish(parser)
+
+
+class AsyncItemStream(ItemStream):
+    """
+    Items of a streamed response for async clients.
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[], AsyncContextManager[httpx.Response]],
+        on_finish: Callable[[DictStrAny], Any],
+        chunk_size: int,
+        track: Optional[Callable[[ItemStream], ContextManager[Any]]] = None,
+    ):
+        super().__init__(on_finish, chunk_size, track)
+        self._open_stream = open_stream
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        with self._tracked():
+            parser = ItemParser()
+            async with self._open_stream() as response:
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+                async for chunk in response.aiter_bytes(self._chunk_size):
+                    self.received += len(chunk)
+                    for item in parser.feed(chunk):
+                        yield item
+            for item in parser.close():
+                yield item
+            self._finish(parser)
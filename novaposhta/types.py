@@ -1,6 +1,17 @@
 """Type aliases for novaposhta package."""
 
-from typing import Any, Callable, Coroutine, Dict, List, Optional, TypedDict, Union
+import os
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    TypedDict,
+    Union,
+)
 
 
 class RequestData(TypedDict):
@@ -21,7 +32,7 @@ class HttpRequest(TypedDict):
 
     url: str
     headers: Dict[str, str]
-    json: RequestData
+    content: bytes
     timeout: int
 
 
@@ -29,13 +40,15 @@ OptStr = Optional[str]
 StrOrNum = Union[str, float, int]
 DictStrAny = Dict[str, Any]
 MaybeAsync = Union[Dict[str, Any], Coroutine[Any, Any, Dict[str, Any]]]
-SyncSender = Callable[[HttpRequest], Dict[str, Any]]
-AsyncSender = Callable[[HttpRequest], Coroutine[Any, Any, Dict[str, Any]]]
+SyncSender = Callable[[bytes], Dict[str, Any]]
+AsyncSender = Callable[[bytes], Coroutine[Any, Any, Dict[str, Any]]]
 RequestSender = Union[SyncSender, AsyncSender]
 OptStrOrNum = Optional[StrOrNum]
 OptDict = Optional[Dict[str, str]]
 OptListOfDicts = Optional[List[Dict[str, Any]]]
 OptInt = Optional[int]
+OptFloat = Optional[float]
+Sink = Union[str, "os.PathLike[str]", BinaryIO]
 OptBool = Optional[
     Union[bool, int]
 ]  # assume that support for cases: 0 is False, 1 is True
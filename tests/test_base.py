@@ -0,0 +1,192 @@
+import inspect
+import itertools
+
+import pytest
+
+from novaposhta.fake.handlers import MODELS
+from novaposhta.models.base import BaseModel, api_method, props_builder
+from novaposhta.profiling import Profiler
+
+SAMPLE_VALUES = ["ref", 5, None, ["a", 1], {"k": 1}, True, 1.5, ""]
+
+
+class _Recorder:
+    def __init__(self):
+        self.profiler = None
+        self.calls = []
+
+    def send(self, model_name, method, props):
+        self.calls.append((model_name, method, props))
+        return props
+
+
+def _api_methods():
+    for model in MODELS:
+        for name, func in inspect.getmembers(model, inspect.isfunction):
+            if hasattr(func, "api_method_name"):
+                yield pytest.param(model, func, id=f"{model.name}.{name}")
+
+
+def _call(method, model, kwargs, args=()):
+    try:
+        return method(model, *args, **kwargs)
+    except Exception as e:  # compared with the wrapped method
+        return type(e)
+
+
+@pytest.mark.parametrize("model, method", list(_api_methods()))
+def test_api_methods_send_props_of_wrapped_method(model, method):
+    client = _Recorder()
+    instance = model(client)
+    params = list(inspect.signature(method).parameters.values())[1:]
+    values = itertools.cycle(SAMPLE_VALUES)
+    for shift in range(len(SAMPLE_VALUES)):
+        kwargs = {
+            p.name: v for p, v in zip(params, itertools.islice(values, shift, None))
+        }
+        expected = _call(method.__wrapped__, instance, kwargs)
+        assert _call(method, instance, kwargs) == expected
+        if not isinstance(expected, type):
+            assert client.calls[-1] == (model.name, method.api_method_name, expected)
+        positional = [
+            kwargs[p.name] for p in params if p.kind == p.POSITIONAL_OR_KEYWORD
+        ]
+        keyword = {p.name: kwargs[p.name] for p in params if p.kind == p.KEYWORD_ONLY}
+        assert _call(method, instance, keyword, positional) == expected
+
+
+def test_most_bundled_methods_have_builders():
+    methods = [param.values[1] for param in _api_methods()]
+    built = [method for method in methods if props_builder(method.__wrapped__)]
+    assert len(built) >= len(methods) - 5
+
+
+class CustomModel(BaseModel):
+    name = "Custom"
+
+    @api_method("constants")
+    def constants(self, value=None, *, flag: bool = False):
+        """
+        Constants and expressions.
+        """
+        return self._call_with_props(
+            Empty=None, Number=1, Items=[1], Value=value, Flag=int(flag)
+        )
+
+    @api_method("branches")
+    def branches(self, value=None):
+        if value is None:
+            return {"Value": "default"}
+        return self._call_with_props(Value=value)
+
+    @api_method("plain")
+    def plain(self, ref, limit=50, page=None, unused=None, *, items=None):
+        return self._call_with_props(
+            Ref=ref, Limit=limit, Page=page, Items=items, Kind="x", Empty=None
+        )
+
+
+class OtherModel(CustomModel):
+    name = "Other"
+
+
+class OverridingModel(CustomModel):
+    @staticmethod
+    def _call_with_props(**properties):
+        return {"Overridden": properties}
+
+
+def test_api_method_wrapper():
+    client = _Recorder()
+    model = CustomModel(client)
+
+    assert model.constants(2, flag=True) == {
+        "Number": "1",
+        "Items": [1],
+        "Value": "2",
+        "Flag": "1",
+    }
+    assert model.constants() == {"Number": "1", "Items": [1], "Flag": "0"}
+    assert model.branches() == {"Value": "default"}
+    assert model.branches(1) == {"Value": "1"}
+    assert [call[1] for call in client.calls] == [
+        "constants",
+        "constants",
+        "branches",
+        "branches",
+    ]
+    assert CustomModel.constants.__doc__.strip() == "Constants and expressions."
+    assert CustomModel.constants.__name__ == "constants"
+    assert CustomModel.constants.api_method_name == "constants"
+    assert inspect.signature(CustomModel.constants) == inspect.signature(
+        CustomModel.constants.__wrapped__
+    )
+    with pytest.raises(TypeError):
+        model.constants(1, 2)
+
+
+def test_builder_matches_method_body():
+    model = CustomModel(_Recorder())
+    body = CustomModel.plain.__wrapped__
+
+    assert props_builder(body) is not None
+    assert props_builder(CustomModel.constants.__wrapped__) is None
+    assert props_builder(CustomModel.branches.__wrapped__) is None
+    for kwargs in [
+        {"ref": "a"},
+        {"ref": 1, "limit": None},
+        {"items": [1], "ref": "a", "page": 2, "unused": 3},
+        {"limit": 5.5, "ref": True, "items": None},
+    ]:
+        assert model.plain(**kwargs) == body(model, **kwargs)
+    assert model.plain("a", 10) == {"Ref": "a", "Limit": "10", "Kind": "x"}
+    with pytest.raises(TypeError):
+        model.plain(limit=1)
+    with pytest.raises(TypeError):
+        model.plain(ref="a", other=1)
+    assert OverridingModel(_Recorder()).plain(ref="a") == {
+        "Overridden": {
+            "Ref": "a",
+            "Limit": 50,
+            "Page": None,
+            "Items": None,
+            "Kind": "x",
+            "Empty": None,
+        }
+    }
+
+
+def test_methods_without_builders():
+    def star(self, *refs):
+        return self._call_with_props(Refs=refs)
+
+    def attribute(self, ref):
+        return self._call_with_props(Ref=ref, Name=self.name)
+
+    def other_call(self, ref):
+        return repr(ref)
+
+    def same_param(self, ref):
+        return self._call_with_props(Ref=ref, Other=ref)
+
+    for method in (star, attribute, other_call, same_param):
+        assert props_builder(method) is None
+
+
+def test_api_method_is_profiled_per_model():
+    client = _Recorder()
+    client.profiler = Profiler(trace_allocations=False)
+
+    CustomModel(client).constants(1)
+    OtherModel(client).constants()
+    CustomModel(client).constants()
+
+    snapshot = client.profiler.snapshot()
+    assert snapshot["Custom.constants"]["calls"] == 2
+    assert snapshot["Other.constants"]["calls"] == 1
+    assert snapshot["Custom.constants"]["phases"]["build_props"]
+    assert client.calls[0] == (
+        "Custom",
+        "constants",
+        {"Number": "1", "Items": [1], "Value": "1", "Flag": "0"},
+    )
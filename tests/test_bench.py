@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from novaposhta.bench import (
+    LoadContext,
+    Workload,
+    check_writes,
+    main,
+    parse_mix,
+    run,
+    run_async,
+    run_threaded,
+)
+from novaposhta.cassette import with_transport
+from novaposhta.client import NovaPoshtaApi
+from novaposhta.fake import FakeNovaPoshta, FakeServer
+
+
+def test_parse_mix():
+    assert parse_mix("tracking=3,save") == {"tracking": 3.0, "save": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("unknown=1")
+    with pytest.raises(ValueError):
+        parse_mix("tracking=0")
+
+
+def test_run_threaded_closed_loop_against_fake_server():
+    workload = Workload(
+        parse_mix("tracking=1,price=1,warehouses=1,save=1"), requests=40
+    )
+
+    with FakeServer() as server:
+        report = run(
+            server.url,
+            "key",
+            workload,
+            mode="threaded",
+            cities=["Київ", "Львів"],
+            allow_writes=True,
+        )
+
+    summary = report.summary()
+    assert summary["requests"] == 40
+    assert summary["error_rate"] == 0
+    assert set(summary["operations"]) == {"tracking", "price", "warehouses", "save"}
+    assert summary["cpu_per_request_us"] > 0
+    assert (
+        server.app.stats["InternetDocument.save"]
+        == summary["operations"]["save"]["requests"]
+    )
+
+
+def test_run_async_open_loop_counts_errors():
+    app = FakeNovaPoshta(error_rate=0.5, seed=1)
+    client = NovaPoshtaApi(
+        "key",
+        api_endpoint="http://fake/v2.0/json/",
+        http_client=with_transport(httpx.ASGITransport(app=app)),
+        async_mode=True,
+    )
+    context = LoadContext(client, [c["Ref"] for c in app.directory.cities[:2]], ["123"])
+    workload = Workload({"tracking": 1}, rps=500, concurrency=5, duration=0.1)
+
+    report = asyncio.run(run_async(context, workload))
+
+    summary = report.summary()
+    assert 40 <= summary["requests"] <= 50
+    assert 0 < summary["errors"]["tracking.api"] < summary["requests"]
+    assert (
+        summary["operations"]["tracking"]["p99_ms"]
+        >= summary["operations"]["tracking"]["p50_ms"]
+    )
+
+
+def test_run_threaded_open_loop_counts_exceptions():
+    client = NovaPoshtaApi(
+        "key",
+        api_endpoint="http://fake/v2.0/json/",
+        http_client=with_transport(
+            httpx.MockTransport(lambda request: httpx.Response(500))
+        ),
+    )
+    workload = Workload({"tracking": 1}, rps=1000, concurrency=2, requests=5)
+
+    report = run_threaded(LoadContext(client, ["ref"]), workload)
+
+    assert report.errors == {"tracking.JSONDecodeError": 5}
+
+
+def test_main_with_fake_server(tmp_path, capsys):
+    output = tmp_path / "report.json"
+
+    summary = main(
+        ["--fake", "--requests", "10", "--concurrency", "2", "--output", str(output)]
+    )
+
+    assert summary["requests"] == 10
+    assert json.loads(output.read_text()) == summary
+    assert '"achieved_rps"' in capsys.readouterr().out
+
+
+def test_writes_must_be_allowed(capsys):
+    workload = Workload(parse_mix("tracking=1,save=1"), requests=1)
+
+    with pytest.raises(ValueError, match="save"):
+        run("http://localhost:1/", "key", workload)
+    with pytest.raises(SystemExit):
+        main(["--mix", "tracking=1,save=1", "--endpoint", "http://localhost:1/"])
+    assert "create data on the server" in capsys.readouterr().err
+    check_writes(parse_mix("tracking=1,save=0"), allow_writes=False)
+
+
+def test_main_allows_writes_to_fake_server():
+    summary = main(["--fake", "--mix", "save", "--requests", "3"])
+
+    assert summary["operations"]["save"]["requests"] == 3
+
+
+def test_unknown_cities():
+    with FakeServer() as server:
+        with pytest.raises(ValueError):
+            run(
+                server.url,
+                "key",
+                Workload({"tracking": 1}, requests=1),
+                cities=["Nowhere"],
+            )
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from benchmarks import model_access, response_access
+from benchmarks.suite import (
+    BenchConfig,
+    MockApi,
+    Scenario,
+    find_regressions,
+    main,
+    run_suite,
+    transport_cpu_per_call,
+)
+
+
+def test_run_suite_all_modes_and_scenarios():
+    results = run_suite(BenchConfig(operations=3, payload_items=2, pages=2))
+
+    assert len(results["results"]) == 12
+    assert results["results"]["sync.pagination"]["calls"] == 9
+    assert results["results"]["async.bulk_tracking"]["calls"] == 30
+    assert results["results"]["threaded.chain"]["operations"] == 3
+    assert results["meta"]["config"]["pages"] == 2
+    single = results["results"]["async.single"]
+    assert single["transport_cpu_per_call_us"] > 0
+    assert single["cpu_per_call_us"] >= 0
+
+
+def test_transport_baseline_and_abstract_scenario():
+    api = MockApi(BenchConfig(payload_items=2))
+
+    assert transport_cpu_per_call(api, "sync", calls=5) > 0
+    assert transport_cpu_per_call(api, "async", calls=5) > 0
+    with pytest.raises(TypeError):
+        Scenario(BenchConfig())
+
+
+def test_find_regressions():
+    baseline = {
+        "results": {"sync.single": {"cpu_per_call_us": 100, "calls_per_second": 1000}}
+    }
+    current = {
+        "results": {"sync.single": {"cpu_per_call_us": 130, "calls_per_second": 950}}
+    }
+
+    assert find_regressions(current, baseline, 0.2) == [
+        "sync.single cpu_per_call_us: 100 -> 130 (+30% worse)"
+    ]
+    assert find_regressions(current, {"results": {}}, 0.2) == []
+
+
+def test_main_writes_results_and_fails_on_regression(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    args = ["--operations", "2", "--mode", "sync", "--scenario", "single"]
+
+    assert main(args + ["--output", str(output)]) == 0
+    baseline = json.loads(output.read_text())
+    baseline["results"]["sync.single"]["calls_per_second"] *= 1000
+    output.write_text(json.dumps(baseline))
+
+    assert main(args + ["--baseline", str(output)]) == 1
+    assert "regressions" in capsys.readouterr().out
+
+
+def test_model_access_benchmark(capsys):
+    results = model_access.run(number=10, calls=2, repeat=1)
+
+    assert set(results) == {"access", "call", "build_props"}
+    assert results["build_props"]["builder_ns"] > 0
+    assert results["access"]["pooled_ns"] > 0
+    assert model_access.main(["--number", "10", "--calls", "1", "--repeat", "1"]) == 0
+    assert "saving_pct" in capsys.readouterr().out
+
+
+def test_response_access_benchmark(capsys):
+    results = response_access.run(items=50, number=2, repeat=1)
+
+    assert set(results) == {"first_item", "all_items"}
+    assert results["first_item"]["lazy_ns"] > 0
+    assert (
+        response_access.main(["--items", "10", "--number", "1", "--repeat", "1"]) == 0
+    )
+    assert "saving_pct" in capsys.readouterr().out
@@ -0,0 +1,146 @@
+import time
+from types import MappingProxyType
+
+import pytest
+
+from novaposhta.bulk import BulkResult, RateLimiter, chunked, collect_outcomes, run_bulk
+
+
+def test_chunked():
+    assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert chunked([], 2) == []
+    with pytest.raises(ValueError):
+        chunked([1], 0)
+
+
+def test_collect_outcomes_per_item():
+    response = {
+        "success": True,
+        "data": [
+            {
+                "Data": {
+                    "Success": [{"Ref": "a"}],
+                    "Errors": [{"Ref": "b", "Error": "Document not found"}],
+                }
+            }
+        ],
+    }
+    outcomes = collect_outcomes(["a", "b", "c"], response)
+    assert outcomes == {
+        "a": None,
+        "b": "Document not found",
+        "c": "No result reported for reference",
+    }
+
+
+def test_collect_outcomes_from_sequences_and_mappings():
+    response = {
+        "success": True,
+        "data": (
+            MappingProxyType(
+                {"Success": ("a", "b"), "Errors": [{"Ref": "c", "Error": "Bad"}]}
+            ),
+        ),
+    }
+    outcomes = collect_outcomes(["a", "b", "c"], response)
+    assert outcomes == {"a": None, "b": None, "c": "Bad"}
+    response = {"success": False, "errors": ["Bad"], "data": {"Success": "ab"}}
+    assert collect_outcomes(["a"], response) == {"a": "Bad"}
+
+
+def test_collect_outcomes_without_details():
+    assert collect_outcomes(["a"], {"success": True, "data": []}) == {"a": None}
+    assert collect_outcomes(["a"], {"success": False, "errors": ["Bad"]}) == {
+        "a": "Bad"
+    }
+
+
+def test_run_bulk_sync_retries_only_failed():
+    calls = []
+
+    def call(chunk):
+        calls.append(chunk)
+        failed = [r for r in chunk if r == "b" and len(calls) == 1]
+        return {
+            "success": True,
+            "data": {
+                "Success": [{"Ref": r} for r in chunk if r not in failed],
+                "Errors": [{"Ref": r, "Error": "Busy"} for r in failed],
+            },
+        }
+
+    result = run_bulk(call, ["a", "b", "c", "a"], False, chunk_size=2)
+
+    assert isinstance(result, BulkResult)
+    assert result.success
+    assert sorted(result.succeeded) == ["a", "b", "c"]
+    assert calls == [["a", "b"], ["c"], ["b"]]
+    assert result.attempts == 2
+
+
+def test_run_bulk_sync_concurrent_exceptions():
+    def call(chunk):
+        if "bad" in chunk:
+            raise RuntimeError("boom")
+        return {"success": True, "data": []}
+
+    result = run_bulk(
+        call, ["a", "b", "bad"], False, chunk_size=2, concurrency=2, retries=0
+    )
+
+    assert result.succeeded == ["a", "b"]
+    assert result.failed == {"bad": "boom"}
+    assert not result.success
+
+
+@pytest.mark.asyncio
+async def test_run_bulk_async():
+    async def call(chunk):
+        return {"success": "x" not in chunk, "errors": ["Failed"], "data": []}
+
+    result = await run_bulk(call, ["a", "b", "x"], True, chunk_size=1, retries=2)
+
+    assert sorted(result.succeeded) == ["a", "b"]
+    assert result.failed == {"x": "Failed"}
+    assert result.attempts == 3
+
+
+def test_run_bulk_sync_without_concurrency_runs_inline(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool must not be created")
+
+    monkeypatch.setattr("novaposhta.bulk.ThreadPoolExecutor", no_pool)
+    result = run_bulk(
+        lambda chunk: {"success": True, "data": [{"Ref": r} for r in chunk]},
+        ["a", "b", "c"],
+        False,
+        chunk_size=2,
+    )
+
+    assert sorted(result.succeeded) == ["a", "b", "c"]
+
+
+def test_run_bulk_validation():
+    with pytest.raises(ValueError):
+        run_bulk(lambda chunk: {}, ["a"], False, chunk_size=0)
+    with pytest.raises(ValueError):
+        run_bulk(lambda chunk: {}, ["a"], False, retries=-1)
+
+
+def test_rate_limiter_spaces_calls():
+    limiter = RateLimiter(50)
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.wait_sync()
+    assert time.monotonic() - start >= 3 * limiter.interval * 0.9
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_async():
+    limiter = RateLimiter(50)
+    start = time.monotonic()
+    for _ in range(3):
+        await limiter.wait_async()
+    assert time.monotonic() - start >= 2 * limiter.interval * 0.9
@@ -0,0 +1,190 @@
+import gzip
+import json
+import time
+
+import httpx
+import pytest
+
+from novaposhta.cassette import (
+    Cassette,
+    CassetteMiss,
+    Interaction,
+    RecordingTransport,
+    ReplayTransport,
+    canonical_key,
+    replay_traffic,
+    with_transport,
+)
+from novaposhta.client import NovaPoshtaApi
+from tests.helpers import TEST_URI
+
+
+def _handler(request):
+    props = json.loads(request.content)["methodProperties"]
+    time.sleep(0.02)
+    return httpx.Response(200, json={"success": True, "data": [props]})
+
+
+def _record(calls):
+    cassette = Cassette()
+    transport = RecordingTransport(cassette, httpx.MockTransport(_handler))
+    client = NovaPoshtaApi(
+        "secret", api_endpoint=TEST_URI, http_client=with_transport(transport)
+    )
+    for props in calls:
+        client.send("Address", "getCities", props)
+    client.close_sync()
+    return cassette
+
+
+def test_canonical_key_ignores_api_key_and_order():
+    first = {
+        "apiKey": "a",
+        "modelName": "M",
+        "calledMethod": "m",
+        "methodProperties": {"A": 1, "B": 2},
+    }
+    second = {
+        "methodProperties": {"B": 2, "A": 1},
+        "calledMethod": "m",
+        "modelName": "M",
+        "apiKey": "b",
+    }
+
+    assert canonical_key(first) == canonical_key(second)
+    assert "apiKey" not in canonical_key(first)
+
+
+def test_record_save_load_and_replay(tmp_path):
+    cassette = _record([{"Page": "1"}, {"Page": "2"}, {"Page": "1"}])
+    path = str(tmp_path / "traffic.jsonl.gz")
+    cassette.save(path)
+    loaded = Cassette.load(path)
+
+    assert len(loaded) == 3
+    assert loaded.interactions[0].elapsed >= 0.02
+    assert loaded.interactions[1].offset > loaded.interactions[0].offset
+    assert "secret" not in (tmp_path / "traffic.jsonl.gz").read_bytes().decode(
+        "latin-1"
+    )
+
+    client = NovaPoshtaApi(
+        "other",
+        api_endpoint=TEST_URI,
+        http_client=with_transport(ReplayTransport(loaded, timing=None)),
+    )
+    start = time.perf_counter()
+    assert client.send("Address", "getCities", {"Page": "2"})["data"] == [{"Page": "2"}]
+    assert time.perf_counter() - start < 0.02
+    with pytest.raises(CassetteMiss):
+        client.send("Address", "getCities", {"Page": "3"})
+
+
+def test_binary_body_and_headers_are_replayed(tmp_path):
+    body = bytes(range(256)) * 4
+    compressed = gzip.compress(body)
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            content=compressed,
+            headers=[
+                ("Content-Encoding", "gzip"),
+                ("Content-Type", "application/vnd.ms-excel"),
+                ("X-Request-Id", "a"),
+                ("X-Request-Id", "b"),
+            ],
+        )
+
+    cassette = Cassette()
+    transport = RecordingTransport(cassette, httpx.MockTransport(handler))
+    with httpx.Client(transport=transport) as http:
+        http.post(TEST_URI, content=b"report")
+    path = str(tmp_path / "binary.jsonl")
+    cassette.save(path)
+    loaded = Cassette.load(path)
+
+    assert loaded.interactions[0].encoding == "base64"
+    with httpx.Client(transport=ReplayTransport(loaded, timing=None)) as http:
+        response = http.post(TEST_URI, content=b"report")
+    assert response.content == body
+    assert response.headers["Content-Type"] == "application/vnd.ms-excel"
+    assert response.headers.get_list("X-Request-Id") == ["a", "b"]
+    assert "Content-Encoding" not in response.headers
+
+
+def test_cassettes_without_headers_replay_json():
+    interaction = Interaction("key", 200, '{"success": true}', 0.0, 0.0)
+    response = ReplayTransport(Cassette([interaction]), timing=None)._response(
+        interaction
+    )
+
+    assert interaction.content == b'{"success": true}'
+    assert response.headers["Content-Type"] == "application/json"
+
+
+def test_plain_cassette_file(tmp_path):
+    path = str(tmp_path / "traffic.jsonl")
+    _record([{"Page": "1"}]).save(path)
+
+    assert json.loads(open(path).readline())["status"] == 200
+
+
+@pytest.mark.asyncio
+async def test_async_record_and_scaled_replay():
+    cassette = Cassette()
+    recording = RecordingTransport(cassette, httpx.MockTransport(_handler))
+    client = NovaPoshtaApi(
+        "key",
+        api_endpoint=TEST_URI,
+        http_client=with_transport(recording),
+        async_mode=True,
+    )
+    await client.send("Address", "getAreas", {})
+    await client.close_async()
+
+    replay = ReplayTransport(cassette, timing=2.0)
+    client = NovaPoshtaApi(
+        "key",
+        api_endpoint=TEST_URI,
+        http_client=with_transport(replay),
+        async_mode=True,
+    )
+    start = time.perf_counter()
+    await client.send("Address", "getAreas", {})
+    assert time.perf_counter() - start >= 0.04
+
+
+def test_replay_traffic_sync():
+    cassette = _record([{"Page": str(i)} for i in range(5)])
+    client = NovaPoshtaApi(
+        "key",
+        api_endpoint=TEST_URI,
+        http_client=with_transport(ReplayTransport(cassette, timing=0.5)),
+    )
+
+    report = replay_traffic(client, cassette, speed=2.0)
+    summary = report.summary()
+
+    assert summary["calls"] == 5
+    assert summary["errors"] == 0
+    assert summary["p50_ms"] >= 10
+    with pytest.raises(ValueError):
+        replay_traffic(client, cassette, speed=0)
+
+
+@pytest.mark.asyncio
+async def test_replay_traffic_async_counts_errors():
+    cassette = _record([{"Page": "1"}, {"Page": "2"}])
+    replay_cassette = Cassette(cassette.interactions[:1])
+    client = NovaPoshtaApi(
+        "key",
+        api_endpoint=TEST_URI,
+        http_client=with_transport(ReplayTransport(replay_cassette, timing=None)),
+        async_mode=True,
+    )
+
+    report = await replay_traffic(client, cassette, speed=10)
+
+    assert (report.calls, report.errors) == (2, 1)
+    assert len(report.latencies) == 2
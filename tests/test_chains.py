@@ -1,6 +1,21 @@
-import pytest
+import asyncio
+import json
+import time
 from unittest.mock import AsyncMock, Mock
-from novaposhta.chains import Chain, ChainResult, ChainExecutor
+
+import pytest
+
+from novaposhta.chains import (
+    Chain,
+    ChainCache,
+    ChainExecutor,
+    ChainResult,
+    ChainTrace,
+    FanOut,
+    MapResult,
+)
+from novaposhta.client import NovaPoshtaApi
+from tests.helpers import TEST_API_KEY, TEST_URI
 
 
 @pytest.fixture
@@ -149,3 +164,715 @@ def mock_address_api():
     return api
 
 
+
+
+def _delayed(response, delay=0.1):
+    async def method(**kwargs):
+        await asyncio.sleep(delay)
+        return response
+
+    return AsyncMock(side_effect=method)
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_parallel_branches():
+    city = _delayed({"success": True, "data": [{"Ref": "city-ref"}]})
+    warehouse = _delayed({"success": True, "data": [{"Ref": "wh-ref"}]})
+    save = AsyncMock(return_value={"success": True, "data": []})
+
+    executor = ChainExecutor(
+        [
+            Chain(
+                city,
+                name="city",
+                depends_on=[],
+                prepare_next=lambda x: {"city_sender": x["data"][0]["Ref"]},
+            ),
+            Chain(
+                warehouse,
+                name="warehouse",
+                depends_on=[],
+                prepare_next=lambda x: {"recipient_address": x["data"][0]["Ref"]},
+            ),
+            Chain(save, kwargs={"weight": 1}, depends_on=["city", "warehouse"]),
+        ]
+    )
+    start = time.monotonic()
+    results = await executor.execute_async()
+
+    assert time.monotonic() - start < 0.18
+    assert len(results) == 3
+    assert all(r.success for r in results)
+    save.assert_called_once_with(
+        weight=1, city_sender="city-ref", recipient_address="wh-ref"
+    )
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_skips_dependents_of_failed_branch():
+    failed = AsyncMock(return_value={"success": False, "data": None})
+    ok = AsyncMock(return_value={"success": True, "data": []})
+    never_called = AsyncMock()
+
+    results = await ChainExecutor(
+        [
+            Chain(failed, name="a", depends_on=[]),
+            Chain(ok, name="b", depends_on=[]),
+            Chain(never_called, depends_on=["a", "b"]),
+        ]
+    ).execute_async()
+
+    assert [r.success for r in results] == [False, True]
+    never_called.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_dependencies_order_independent(mock_method):
+    first = AsyncMock(return_value={"success": True, "data": "first"})
+    executor = ChainExecutor(
+        [
+            Chain(mock_method, depends_on=["first"]),
+            Chain(first, name="first", depends_on=[]),
+        ]
+    )
+    results = await executor.execute_async()
+
+    assert [r.data for r in results] == [[{"Ref": "test-ref"}], "first"]
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_invalid_dependencies(mock_method):
+    with pytest.raises(ValueError):
+        await ChainExecutor([Chain(mock_method, depends_on=["missing"])]).execute_async()
+    with pytest.raises(ValueError):
+        await ChainExecutor(
+            [Chain(mock_method, name="a"), Chain(mock_method, name="a")]
+        ).execute_async()
+    with pytest.raises(ValueError):
+        await ChainExecutor(
+            [
+                Chain(mock_method, name="a", depends_on=["b"]),
+                Chain(mock_method, name="b", depends_on=["a"]),
+            ]
+        ).execute_async()
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_join_conflicts_checked_before_calls(mock_method):
+    executor = ChainExecutor(
+        [
+            Chain(mock_method, name="a", depends_on=[]),
+            Chain(mock_method, name="b", depends_on=[]),
+            FanOut(mock_method, name="fan", depends_on=["a", "b"]),
+        ]
+    )
+    with pytest.raises(ValueError, match="single chain"):
+        await executor.execute_async()
+    with pytest.raises(ValueError, match="single chain"):
+        executor.execute_sync()
+    mock_method.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_joined_list_fails_dependent_chain():
+    listed = AsyncMock(return_value={"success": True, "data": []})
+    joined = AsyncMock(return_value={"success": True, "data": []})
+    results = await ChainExecutor(
+        [
+            Chain(listed, name="a", depends_on=[], prepare_next=lambda x: [{"a": 1}]),
+            Chain(listed, name="b", depends_on=[]),
+            Chain(joined, name="joined", depends_on=["a", "b"]),
+        ]
+    ).execute_async()
+
+    assert [result.success for result in results] == [True, True, False]
+    assert "FanOut" in results[2].error
+    joined.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_bounded_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_warehouses(city_ref, limit):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"success": True, "data": [{"Ref": f"{city_ref}-wh"}]}
+
+    settlements = AsyncMock(
+        return_value={"success": True, "data": [{"Ref": f"c{i}"} for i in range(5)]}
+    )
+    executor = Chain(
+        settlements,
+        prepare_next=lambda x: [{"city_ref": item["Ref"]} for item in x["data"][:4]],
+    ) | FanOut(get_warehouses, kwargs={"limit": 1}, concurrency=2)
+
+    results = await executor.execute_async()
+
+    assert max_in_flight == 2
+    assert results[1].success
+    assert results[1].data == [[{"Ref": f"c{i}-wh"}] for i in range(4)]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_reduce_and_prepare_next():
+    method = AsyncMock(side_effect=lambda ref: {"success": True, "data": [ref]})
+    fan_out = FanOut(
+        method,
+        reduce=lambda responses: {
+            "success": True,
+            "data": [item for r in responses for item in r["data"]],
+        },
+        prepare_next=lambda x: {"refs": x["data"]},
+    )
+    prev_result = ChainResult(
+        success=True, data=None, error=None, next_kwargs=[{"ref": "a"}, {"ref": "b"}]
+    )
+
+    result = await fan_out.execute(prev_result)
+
+    assert result.data == ["a", "b"]
+    assert result.next_kwargs == {"refs": ["a", "b"]}
+
+
+@pytest.mark.asyncio
+async def test_fan_out_partial_failure():
+    method = AsyncMock(side_effect=lambda ref: {"success": ref != "b", "data": ref})
+    prev_result = ChainResult(
+        success=True, data=None, error=None, next_kwargs=[{"ref": "a"}, {"ref": "b"}]
+    )
+
+    result = await FanOut(method).execute(prev_result)
+
+    assert not result.success
+    assert result.data == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_cancels_calls_on_failure_and_bounds_retries():
+    in_flight = 0
+    max_in_flight = 0
+    cancelled = []
+    attempts = {}
+
+    async def method(ref):
+        nonlocal in_flight, max_in_flight
+        attempts[ref] = attempts.get(ref, 0) + 1
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            if ref == "b" and attempts[ref] == 1:
+                await asyncio.sleep(0.01)
+                raise ValueError("Temporary error")
+            await asyncio.sleep(0.05)
+            return {"success": True, "data": ref}
+        except asyncio.CancelledError:
+            cancelled.append(ref)
+            raise
+        finally:
+            in_flight -= 1
+
+    prev_result = ChainResult(
+        success=True,
+        data=None,
+        error=None,
+        next_kwargs=[{"ref": ref} for ref in "abcd"],
+    )
+
+    result = await FanOut(method, concurrency=2, retries=1).execute(prev_result)
+
+    assert result.success
+    assert result.attempts == 2
+    assert result.data == ["a", "b", "c", "d"]
+    assert "a" in cancelled
+    assert max_in_flight == 2
+    assert in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_fan_out_failure_leaves_no_running_calls():
+    in_flight = 0
+
+    async def method(ref):
+        nonlocal in_flight
+        in_flight += 1
+        try:
+            await asyncio.sleep(0.01 if ref == "b" else 0.05)
+            if ref == "b":
+                raise ValueError("Error")
+            return {"success": True, "data": ref}
+        finally:
+            in_flight -= 1
+
+    prev_result = ChainResult(
+        success=True, data=None, error=None, next_kwargs=[{"ref": "a"}, {"ref": "b"}]
+    )
+
+    result = await FanOut(method).execute(prev_result)
+
+    assert not result.success
+    assert result.error == "Error"
+    assert in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_chain_rejects_list_of_kwargs(mock_method):
+    prev_result = ChainResult(success=True, data=None, error=None, next_kwargs=[{}])
+
+    result = await Chain(mock_method).execute(prev_result)
+
+    assert not result.success
+    assert "FanOut" in result.error
+    mock_method.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_initial_kwargs(mock_method):
+    results = await ChainExecutor([Chain(mock_method, kwargs={"a": 1})]).execute_async(
+        {"b": 2}
+    )
+
+    assert results[0].success
+    mock_method.assert_called_once_with(a=1, b=2)
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_map():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def lookup(order):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 if order % 2 else 0.03)
+        in_flight -= 1
+        return {"success": order != 3, "data": order}
+
+    save = AsyncMock(side_effect=lambda ref: {"success": True, "data": ref})
+    executor = Chain(lookup, prepare_next=lambda x: {"ref": x["data"] * 10}) | Chain(
+        save
+    )
+
+    collected = [
+        result
+        async for result in executor.map(({"order": i} for i in range(6)), concurrency=3)
+    ]
+
+    assert max_in_flight == 3
+    assert all(isinstance(r, MapResult) for r in collected)
+    assert sorted(r.input["order"] for r in collected) == list(range(6))
+    by_order = {r.input["order"]: r for r in collected}
+    assert not by_order[3].success
+    assert len(by_order[3].results) == 1
+    assert by_order[4].success
+    assert by_order[4].results[1].data == 40
+    assert collected[0].input["order"] % 2 == 1
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_map_async_inputs(mock_method):
+    async def inputs():
+        for i in range(3):
+            yield {"i": i}
+
+    executor = ChainExecutor([Chain(mock_method)])
+    collected = [result async for result in executor.map(inputs())]
+
+    assert len(collected) == 3
+    assert mock_method.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_map_close_awaits_cancelled_pipelines():
+    cancelled = []
+
+    async def method(i):
+        try:
+            await asyncio.sleep(0 if i == 0 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+        return {"success": True, "data": i}
+
+    results = ChainExecutor([Chain(method)]).map(
+        ({"i": i} for i in range(3)), concurrency=3
+    )
+    first = await results.__anext__()
+    await results.aclose()
+
+    assert first.input == {"i": 0}
+    assert sorted(cancelled) == [1, 2]
+
+
+def test_chain_executor_execute_sync():
+    first = Mock(return_value={"success": True, "data": [{"Ref": "ref"}]})
+    second = Mock(return_value={"success": True, "data": "done"})
+    executor = Chain(
+        first, kwargs={"a": 1}, prepare_next=lambda x: {"ref": x["data"][0]["Ref"]}
+    ) | Chain(second)
+
+    results = executor.execute_sync({"b": 2})
+
+    assert [r.success for r in results] == [True, True]
+    first.assert_called_once_with(a=1, b=2)
+    second.assert_called_once_with(ref="ref")
+
+
+def test_chain_executor_execute_sync_stops_on_failure():
+    failed = Mock(return_value={"success": False, "data": None})
+    never_called = Mock()
+
+    results = (Chain(failed) | Chain(never_called)).execute_sync()
+
+    assert len(results) == 1
+    never_called.assert_not_called()
+
+
+def test_chain_executor_execute_sync_thread_pool():
+    def slow(**kwargs):
+        time.sleep(0.1)
+        return {"success": True, "data": kwargs}
+
+    joined = Mock(return_value={"success": True, "data": []})
+    failed = Mock(return_value={"success": False, "data": None})
+    skipped = Mock()
+    executor = ChainExecutor(
+        [
+            Chain(slow, kwargs={"a": 1}, name="a", depends_on=[], prepare_next=lambda x: x["data"]),
+            Chain(slow, kwargs={"b": 2}, name="b", depends_on=[], prepare_next=lambda x: x["data"]),
+            Chain(joined, name="joined", depends_on=["a", "b"]),
+            Chain(failed, name="failed", depends_on=[]),
+            Chain(skipped, name="skipped", depends_on=["failed"]),
+            Chain(skipped, depends_on=["skipped", "joined"]),
+        ]
+    )
+
+    start = time.monotonic()
+    results = executor.execute_sync(max_workers=4)
+
+    assert time.monotonic() - start < 0.18
+    assert [r.success for r in results] == [True, True, True, False]
+    joined.assert_called_once_with(a=1, b=2)
+    skipped.assert_not_called()
+
+
+def test_chain_execute_sync_rejects_async_method(mock_method):
+    result = Chain(mock_method).execute_sync()
+
+    assert not result.success
+    assert "synchronously" in result.error
+
+
+def test_fan_out_execute_sync():
+    method = Mock(side_effect=lambda ref: {"success": True, "data": ref})
+    prev_result = ChainResult(
+        success=True, data=None, error=None, next_kwargs=[{"ref": "a"}, {"ref": "b"}]
+    )
+
+    result = FanOut(method, concurrency=2).execute_sync(prev_result)
+
+    assert result.success
+    assert result.data == ["a", "b"]
+
+
+def test_chain_execute_sync_with_client(httpx_mock):
+    httpx_mock.add_response(json={"success": True, "data": [{"Ref": "area"}]})
+    httpx_mock.add_response(json={"success": True, "data": [{"Ref": "city"}]})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+
+    results = (
+        Chain(client.address.get_areas, prepare_next=lambda x: {"ref": x["data"][0]["Ref"]})
+        | Chain(client.address.get_cities)
+    ).execute_sync()
+
+    assert [r.data for r in results] == [[{"Ref": "area"}], [{"Ref": "city"}]]
+
+
+@pytest.mark.asyncio
+async def test_chain_retries_on_error():
+    method = AsyncMock(
+        side_effect=[Exception("Temporary"), {"success": True, "data": "ok"}]
+    )
+
+    result = await Chain(method, retries=1).execute()
+
+    assert result.success
+    assert result.data == "ok"
+    assert method.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_chain_timeout_and_fallback():
+    slow = _delayed({"success": True, "data": "slow"}, delay=1)
+    fallback = Mock(return_value={"success": True, "data": "cached"})
+
+    result = await Chain(
+        slow, kwargs={"ref": "a"}, timeout=0.01, retries=1, fallback=fallback
+    ).execute()
+
+    assert result.success
+    assert result.data == "cached"
+    assert slow.call_count == 2
+    fallback.assert_called_once_with(ref="a")
+
+
+@pytest.mark.asyncio
+async def test_chain_timeout_error():
+    slow = _delayed({"success": True, "data": "slow"}, delay=1)
+
+    result = await Chain(slow, timeout=0.01).execute()
+
+    assert not result.success
+    assert "timed out" in result.error
+
+
+@pytest.mark.asyncio
+async def test_chain_fallback_is_bound_by_timeout_and_deadline():
+    slow = _delayed({"success": True, "data": "slow"}, delay=1)
+    slow_fallback = _delayed({"success": True, "data": "fallback"}, delay=1)
+    fallback = Mock(return_value={"success": True, "data": "cached"})
+
+    start = time.monotonic()
+    result = await Chain(slow, timeout=0.01, fallback=slow_fallback).execute()
+    assert time.monotonic() - start < 0.5
+    assert "timed out" in result.error
+
+    failing = AsyncMock(side_effect=Exception("Boom"))
+    start = time.monotonic()
+    result = await Chain(failing, fallback=slow_fallback).execute(
+        deadline=time.monotonic() + 0.05
+    )
+    assert time.monotonic() - start < 0.5
+    assert "timed out" in result.error
+
+    result = await Chain(slow, fallback=fallback).execute(
+        deadline=time.monotonic() - 1
+    )
+    assert result.error == "Chain deadline exceeded"
+    fallback.assert_not_called()
+
+
+def test_chain_sync_fallback_checks_deadline():
+    method = Mock(side_effect=Exception("Boom"))
+    fallback = Mock(return_value={"success": True, "data": "cached"})
+
+    def expire(**kwargs):
+        time.sleep(0.02)
+        raise Exception("Boom")
+
+    result = Chain(expire, fallback=fallback).execute_sync(
+        deadline=time.monotonic() + 0.01
+    )
+    assert result.error == "Chain deadline exceeded"
+    fallback.assert_not_called()
+    assert Chain(method, fallback=fallback).execute_sync().data == "cached"
+
+
+def test_chain_sync_timeout_and_negative_retries_are_rejected(mock_method):
+    method = Mock(return_value={"success": True, "data": 1})
+    with pytest.raises(ValueError):
+        Chain(method, timeout=1).execute_sync()
+    with pytest.raises(ValueError):
+        ChainExecutor([Chain(method), Chain(method, timeout=1)]).execute_sync()
+    method.assert_not_called()
+    with pytest.raises(ValueError):
+        Chain(mock_method, retries=-1)
+
+
+@pytest.mark.asyncio
+async def test_chain_executor_budget_cancels_outstanding_steps():
+    fast = AsyncMock(return_value={"success": True, "data": "fast"})
+    slow = _delayed({"success": True, "data": "slow"}, delay=1)
+    never_called = AsyncMock()
+    executor = ChainExecutor(
+        [
+            Chain(fast, name="fast", depends_on=[]),
+            Chain(slow, name="slow", depends_on=[], timeout=5),
+            Chain(never_called, depends_on=["slow"]),
+        ]
+    )
+
+    start = time.monotonic()
+    results = await executor.execute_async(budget=0.05)
+
+    assert time.monotonic() - start < 0.5
+    assert [r.success for r in results] == [True, False]
+    assert "timed out" in results[1].error
+    never_called.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_chain_deadline_exceeded_before_start(mock_method):
+    result = await Chain(mock_method).execute(deadline=time.monotonic() - 1)
+
+    assert not result.success
+    assert result.error == "Chain deadline exceeded"
+    mock_method.assert_not_called()
+
+
+def test_chain_execute_sync_retries_and_budget():
+    method = Mock(side_effect=[Exception("Temporary"), {"success": True, "data": 1}])
+
+    results = ChainExecutor([Chain(method, retries=2)]).execute_sync(budget=1)
+
+    assert results[0].success
+    assert method.call_count == 2
+    with pytest.raises(ValueError):
+        ChainExecutor([Chain(method)]).execute_sync(budget=0)
+
+
+@pytest.mark.asyncio
+async def test_chain_cache_reused_across_runs():
+    cache = ChainCache(ttl=60)
+    areas = AsyncMock(return_value={"success": True, "data": [{"Ref": "area"}]})
+    cities = AsyncMock(return_value={"success": True, "data": [{"Ref": "city"}]})
+
+    def build():
+        return Chain(
+            areas, cache=cache, prepare_next=lambda x: {"ref": x["data"][0]["Ref"]}
+        ) | Chain(cities, cache=cache)
+
+    first = await build().execute_async()
+    second = await build().execute_async()
+
+    assert [r.data for r in first] == [r.data for r in second]
+    assert areas.call_count == 1
+    assert cities.call_count == 1
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_chain_cache_keyed_on_kwargs_and_skips_failures():
+    cache = ChainCache()
+    method = AsyncMock(side_effect=lambda ref: {"success": ref != "bad", "data": ref})
+
+    for ref in ["a", "b", "a", "bad", "bad"]:
+        await Chain(method, kwargs={"ref": ref}, cache=cache).execute()
+
+    assert method.call_count == 4
+    assert len(cache) == 2
+
+
+def test_chain_cache_ttl_and_maxsize():
+    cache = ChainCache(ttl=0.01, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") == (False, None)
+    assert cache.get("c") == (True, 3)
+    time.sleep(0.02)
+    assert len(cache) == 0
+    assert cache.get("c") == (False, None)
+    cache.set("d", 4)
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        ChainCache(ttl=0)
+
+
+def test_chain_cache_sync_and_model_key(httpx_mock):
+    httpx_mock.add_response(json={"success": True, "data": [{"Ref": "area"}]})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    cache = ChainCache()
+
+    for _ in range(3):
+        result = Chain(client.address.get_areas, cache=cache).execute_sync()
+        assert result.data == [{"Ref": "area"}]
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert cache.make_key(client.address.get_areas, {}).endswith(
+        ":Address.get_areas:{}"
+    )
+    assert TEST_API_KEY not in cache.make_key(client.address.get_areas, {})
+
+
+def test_chain_cache_is_not_shared_between_api_keys(httpx_mock):
+    httpx_mock.add_response(json={"success": True, "data": [{"Ref": "area"}]})
+    httpx_mock.add_response(json={"success": True, "data": [{"Ref": "other"}]})
+    cache = ChainCache()
+    first = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    second = NovaPoshtaApi("other-key", api_endpoint=TEST_URI)
+
+    assert Chain(first.address.get_areas, cache=cache).execute_sync().data == [
+        {"Ref": "area"}
+    ]
+    assert Chain(second.address.get_areas, cache=cache).execute_sync().data == [
+        {"Ref": "other"}
+    ]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_chain_result_timings_attempts_and_cache_flag():
+    cache = ChainCache()
+    method = AsyncMock(
+        side_effect=[Exception("Temporary"), {"success": True, "data": "ok"}]
+    )
+
+    first = await Chain(method, name="step", retries=1, cache=cache).execute()
+    second = await Chain(method, name="step", cache=cache).execute()
+
+    assert first.name == "step"
+    assert first.attempts == 2
+    assert not first.cached
+    assert first.duration >= 0
+    assert first.started_at <= time.time()
+    assert second.cached
+    assert second.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_chain_trace_parallel_branches():
+    spans = []
+    trace = ChainTrace(on_span=spans.append)
+    a = _delayed({"success": True, "data": "a"}, delay=0.01)
+    items = AsyncMock(side_effect=lambda ref: {"success": True, "data": ref})
+    executor = ChainExecutor(
+        [
+            Chain(a, name="a", depends_on=[], prepare_next=lambda x: [{"ref": 1}, {"ref": 2}]),
+            Chain(a, name="b", depends_on=[]),
+            FanOut(items, name="items", depends_on=["a"]),
+        ]
+    )
+
+    await executor.execute_async(trace=trace)
+
+    assert len(spans) == 6
+    by_name = {span.name: span for span in trace.spans}
+    root = by_name["ChainExecutor"]
+    assert root.parent_id is None
+    assert root.success
+    assert {by_name[n].parent_id for n in ("a", "b", "items")} == {root.span_id}
+    assert by_name["items[0]"].parent_id == by_name["items"].span_id
+    assert by_name["items[1]"].success
+    exported = json.loads(trace.to_json())
+    assert exported["spans"][0]["name"] == "ChainExecutor"
+    assert "_started" not in exported["spans"][0]
+
+
+def test_chain_trace_sync_thread_pool():
+    trace = ChainTrace()
+    ok = Mock(return_value={"success": True, "data": []})
+    failed = Mock(side_effect=Exception("boom"))
+    executor = ChainExecutor(
+        [
+            Chain(ok, name="ok", depends_on=[]),
+            Chain(failed, name="failed", depends_on=[], retries=1),
+            FanOut(ok, name="fan", depends_on=["ok"], concurrency=2),
+        ]
+    )
+
+    executor.execute_sync(max_workers=2, trace=trace)
+
+    by_name = {span.name: span for span in trace.spans}
+    assert not by_name["ChainExecutor"].success
+    assert by_name["failed"].attempts == 2
+    assert by_name["failed"].error == "boom"
+    assert by_name["fan"].parent_id == by_name["ChainExecutor"].span_id
+    assert by_name["fan[0]"].parent_id == by_name["fan"].span_id
@@ -1,7 +1,15 @@
+import asyncio
+import io
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import httpx
 import pytest
 
-from novaposhta.client import (APIRequestError, InvalidAPIKeyError,
-                               NovaPoshtaApi)
+from novaposhta.client import APIRequestError, InvalidAPIKeyError, NovaPoshtaApi
+from novaposhta.models.address import Address
+from novaposhta.serializers import StdlibSerializer
 from tests.helpers import TEST_API_KEY, TEST_URI, MockModel
 
 
@@ -99,6 +107,34 @@ def test_client_reset():
     assert reset_model != model
 
 
+def test_model_properties_are_cached():
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    address = client.address
+
+    assert client.address is address
+    assert client.get("Address") is address
+    assert client.new(Address) is not address
+    assert client.address is client.get("Address")
+
+
+def test_model_properties_keep_pooled_subclass():
+    class CustomAddress(Address):
+        pass
+
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    custom = client.new(CustomAddress)
+
+    assert client.address is custom
+
+
+def test_model_properties_from_threads_share_instance():
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        models = list(pool.map(lambda _: client.internet_document, range(100)))
+
+    assert all(model is models[0] for model in models)
+
+
 def test_has_models():
     client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
 
@@ -133,7 +169,7 @@ async def test_async_client_context_manager(httpx_mock):
     httpx_mock.add_response(json=json_response, status_code=200)
 
     async with NovaPoshtaApi(
-            TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True
+        TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True
     ) as client:
         model = client.new(MockModel)
         saved_model = client.get(MockModel.name)
@@ -177,3 +213,214 @@ def test_client_fails_on_sync_call_with_async_client(httpx_mock):
         req = {"url": TEST_URI, "json": {}}
         client._send_sync(req)
     assert "Sync client is not initialized" in str(e.value)
+
+
+def test_client_download(httpx_mock):
+    httpx_mock.add_response(content=b"x" * 100)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    sink = io.BytesIO()
+
+    assert client.download("test", "test", {}, sink, chunk_size=10) == 100
+    assert sink.getvalue() == b"x" * 100
+
+
+@pytest.mark.asyncio
+async def test_async_client_download(httpx_mock):
+    httpx_mock.add_response(content=b"report")
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+    sink = io.BytesIO()
+
+    assert await client.download("test", "test", {}, sink) == 6
+    assert sink.getvalue() == b"report"
+
+
+def test_client_download_skips_lines(httpx_mock):
+    httpx_mock.add_response(content=b"head\ner\nrow\n")
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    sink = io.BytesIO()
+
+    assert client.download("test", "test", {}, sink, chunk_size=3, skip_lines=2) == 4
+    assert sink.getvalue() == b"row\n"
+
+
+def test_client_download_raises_api_error(httpx_mock):
+    httpx_mock.add_response(
+        json={"success": False, "data": [], "errors": ["Document not found"]}
+    )
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    sink = io.BytesIO()
+
+    with pytest.raises(APIRequestError, match="Document not found"):
+        client.download("test", "test", {}, sink, chunk_size=8)
+    assert sink.getvalue() == b""
+
+
+@pytest.mark.asyncio
+async def test_async_client_download_raises_errors(httpx_mock):
+    httpx_mock.add_response(
+        json={"success": False, "data": [], "errors": ["API key expired"]}
+    )
+    httpx_mock.add_response(status_code=502, content=b"Bad gateway")
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+    sink = io.BytesIO()
+
+    with pytest.raises(InvalidAPIKeyError):
+        await client.download("test", "test", {}, sink, chunk_size=8)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.download("test", "test", {}, sink)
+    assert sink.getvalue() == b""
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_async_client_offloads_large_response_decode(httpx_mock):
+    httpx_mock.add_response(json={"success": True, "data": ["x" * 100]})
+    httpx_mock.add_response(json={"success": True, "data": []})
+    executor = _CountingExecutor(max_workers=1)
+    client = NovaPoshtaApi(
+        TEST_API_KEY,
+        api_endpoint=TEST_URI,
+        async_mode=True,
+        decode_offload_threshold=100,
+        decode_executor=executor,
+    )
+
+    large = await client.send("test", "test", {})
+    small = await client.send("test", "test", {})
+
+    assert large["data"] == ["x" * 100]
+    assert small["data"] == []
+    assert executor.submitted == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "threshold, lazy_responses", [(None, False), (1000000, False), (0, True)]
+)
+async def test_async_client_skips_decode_offload(httpx_mock, threshold, lazy_responses):
+    httpx_mock.add_response(json={"success": True, "data": ["x" * 100]})
+    httpx_mock.add_response(json={"success": True, "data": ["x" * 100]})
+    executor = _CountingExecutor(max_workers=1)
+    client = NovaPoshtaApi(
+        TEST_API_KEY,
+        api_endpoint=TEST_URI,
+        async_mode=True,
+        decode_offload_threshold=threshold,
+        decode_executor=executor,
+        lazy_responses=lazy_responses,
+    )
+
+    plain = await client.send("test", "test", {})
+    client.add_hook("after_response", lambda info: None)
+    instrumented = await client.send("test", "test", {})
+
+    assert plain["data"][0] == instrumented["data"][0] == "x" * 100
+    assert executor.submitted == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_decode_offload_with_msgspec_in_process_pool(httpx_mock):
+    pytest.importorskip("msgspec")
+    httpx_mock.add_response(json={"success": True, "data": ["x" * 100]})
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        client = NovaPoshtaApi(
+            TEST_API_KEY,
+            api_endpoint=TEST_URI,
+            async_mode=True,
+            serializer="msgspec",
+            decode_offload_threshold=0,
+            decode_executor=executor,
+        )
+
+        response = await client.send("test", "test", {})
+
+    assert response["data"] == ["x" * 100]
+
+
+def test_decode_offload_rejects_unpicklable_serializer():
+    class LocalSerializer(StdlibSerializer):
+        pass
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError, match="can not be pickled"):
+            NovaPoshtaApi(
+                TEST_API_KEY,
+                async_mode=True,
+                serializer=LocalSerializer(),
+                decode_offload_threshold=0,
+                decode_executor=executor,
+            )
+
+
+def test_decode_offload_requires_executor():
+    with pytest.raises(ValueError):
+        NovaPoshtaApi(TEST_API_KEY, async_mode=True, decode_offload_threshold=100)
+
+
+class _SlowSerializer(StdlibSerializer):
+    """
+    Decodes a large padding document along with every body, holding the GIL.
+    """
+
+    def __init__(self, padding):
+        super().__init__()
+        self.padding = padding
+
+    def loads(self, data):
+        json.loads(self.padding)
+        return super().loads(data)
+
+
+async def _max_loop_lag(coro):
+    lags = []
+    done = False
+
+    async def tick():
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start)
+
+    ticker = asyncio.create_task(tick())
+    await asyncio.sleep(0.01)
+    result = await coro
+    done = True
+    await ticker
+    return result, max(lags)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "executor_type, blocks_loop",
+    [(ThreadPoolExecutor, True), (ProcessPoolExecutor, False)],
+)
+async def test_decode_offload_loop_lag(httpx_mock, executor_type, blocks_loop):
+    httpx_mock.add_response(json={"success": True, "data": []})
+    serializer = _SlowSerializer(json.dumps(list(range(1000000))).encode())
+    start = time.perf_counter()
+    serializer.loads(b"{}")
+    decode_time = time.perf_counter() - start
+    with executor_type(max_workers=1) as executor:
+        executor.submit(int).result()
+        client = NovaPoshtaApi(
+            TEST_API_KEY,
+            api_endpoint=TEST_URI,
+            async_mode=True,
+            serializer=serializer,
+            decode_offload_threshold=0,
+            decode_executor=executor,
+        )
+
+        response, lag = await _max_loop_lag(client.send("test", "test", {}))
+
+    assert response["success"]
+    assert (lag > decode_time / 2) is blocks_loop
@@ -0,0 +1,236 @@
+import asyncio
+import io
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from novaposhta.client import APIRequestError, InvalidAPIKeyError, NovaPoshtaApi
+from novaposhta.fake import FakeDirectory, FakeNovaPoshta, FakeServer
+from novaposhta.fake.handlers import supported_methods
+from novaposhta.fake.server import TokenBucket, main
+from tests.helpers import TEST_API_KEY
+
+
+def _asgi_client(app, **kwargs):
+    http_client = SimpleNamespace(
+        AsyncClient=lambda timeout: httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), timeout=timeout
+        )
+    )
+    return NovaPoshtaApi(
+        TEST_API_KEY,
+        api_endpoint="http://fake/v2.0/json/",
+        http_client=http_client,
+        async_mode=True,
+        **kwargs,
+    )
+
+
+def test_directory_is_seeded():
+    first, second = FakeDirectory(seed=1), FakeDirectory(seed=1)
+
+    assert first.cities == second.cities
+    assert first.warehouses[0] == second.warehouses[0]
+    assert first.cities != FakeDirectory(seed=2).cities
+    assert len(FakeDirectory(warehouses_per_city=3).warehouses) == 3 * len(first.cities)
+
+
+def test_dispatch_every_model_method():
+    app = FakeNovaPoshta()
+
+    for model, method in sorted(supported_methods()):
+        response = app.dispatch(
+            {"modelName": model, "calledMethod": method, "methodProperties": {}}
+        )
+        assert isinstance(response["data"], list), (model, method)
+    assert {model for model, _ in supported_methods()} == {
+        "AdditionalService",
+        "Address",
+        "Common",
+        "ContactPerson",
+        "Counterparty",
+        "InternetDocument",
+        "ScanSheet",
+        "TrackingDocument",
+    }
+    unknown = app.dispatch({"modelName": "Address", "calledMethod": "unknown"})
+    assert unknown["errors"] == ["Method Address.unknown not found"]
+
+
+@pytest.mark.asyncio
+async def test_asgi_directories():
+    client = _asgi_client(FakeNovaPoshta(FakeDirectory(warehouses_per_city=7)))
+
+    cities = await client.address.search_settlements("Київ", limit=5)
+    city = cities["data"][0]["Addresses"][0]
+    first = await client.address.get_warehouses(city_ref=city["DeliveryCity"], limit=5)
+    second = await client.address.get_warehouses(
+        city_ref=city["DeliveryCity"], limit=5, page=2
+    )
+    streets = await client.address.search_settlement_streets("Шев", city["Ref"])
+    price = await client.internet_document.get_document_price(
+        city["Ref"], city["Ref"], 2, "WarehouseWarehouse", 1000, "Cargo", 1
+    )
+
+    assert city["MainDescription"] == "Київ"
+    assert len(first["data"]) == 5 and len(second["data"]) == 2
+    assert first["info"] == {"totalCount": 7}
+    assert {w["CityDescription"] for w in first["data"]} == {"Київ"}
+    assert (
+        streets["data"][0]["Addresses"][0]["SettlementStreetDescription"] == "Шевченка"
+    )
+    assert price["data"][0]["Cost"] == 75
+    await client.close_async()
+
+
+def test_server_documents_and_scan_sheets():
+    with FakeServer() as server:
+        client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=server.url)
+        saved = [client.internet_document.save()["data"][0] for _ in range(3)]
+        refs = [d["Ref"] for d in saved]
+
+        tracking = client.tracking_document.get_status_documents(
+            [{"DocumentNumber": saved[0]["IntDocNumber"]}, {"DocumentNumber": "123"}]
+        )
+        inserted = client.scan_sheet.insert_documents_bulk(
+            refs + ["missing"], None, "20.10.2026", chunk_size=2, retries=0
+        )
+        listed = client.internet_document.get_document_list("from", "to")
+        deleted = client.internet_document.delete_bulk(
+            refs[:2] + ["missing"], retries=0
+        )
+        client.close_sync()
+
+    assert tracking["data"][0]["StatusCode"] == "1"
+    assert len(tracking["data"]) == 2
+    assert sorted(inserted.succeeded) == sorted(refs)
+    assert inserted.failed == {"missing": "Document not found"}
+    assert len(listed["data"]) == 3
+    assert sorted(deleted.succeeded) == sorted(refs[:2])
+    assert list(deleted.failed) == ["missing"]
+    assert server.app.stats["InternetDocument.save"] == 3
+
+
+def test_server_rate_limit():
+    with FakeServer(rate_limit=1, burst=2) as server:
+        client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=server.url)
+        responses = [client.common.get_cargo_types() for _ in range(3)]
+        client.close_sync()
+
+    assert [r["success"] for r in responses] == [True, True, False]
+    assert responses[2]["errors"] == ["To many requests"]
+    assert server.app.stats["rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_and_api_keys():
+    failing = _asgi_client(FakeNovaPoshta(error_rate=1), raise_for_errors=True)
+    with pytest.raises(APIRequestError):
+        await failing.common.get_cargo_types()
+
+    unavailable = _asgi_client(FakeNovaPoshta(http_error_rate=1))
+    transport = unavailable.async_http_client
+    response = await transport.post("http://fake/v2.0/json/", json={"apiKey": "k"})
+    assert response.status_code == 503
+
+    keyed = _asgi_client(FakeNovaPoshta(api_keys=["other"]), raise_for_errors=True)
+    with pytest.raises(InvalidAPIKeyError):
+        await keyed.common.get_cargo_types()
+
+    assert (await transport.get("http://fake/")).status_code == 405
+    assert (await transport.post("http://fake/", content=b"{")).status_code == 400
+
+
+def test_latency_distributions():
+    assert FakeNovaPoshta(latency=0.5)._delay() == 0.5
+    assert 0.1 <= FakeNovaPoshta(latency=(0.1, 0.2))._delay() <= 0.2
+    assert FakeNovaPoshta(latency=lambda rng: 0.3)._delay() == 0.3
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_raw_http_server():
+    with FakeServer(latency=0.01) as server:
+        with httpx.Client() as http:
+            assert http.get(server.url).status_code == 405
+            response = http.post(
+                server.url,
+                content=json.dumps(
+                    {"modelName": "Address", "calledMethod": "getAreas"}
+                ),
+                headers={"Connection": "close"},
+            )
+    assert response.json()["success"]
+
+
+def test_server_start_fails_on_taken_port():
+    with FakeServer() as server:
+        with pytest.raises(OSError):
+            FakeServer(port=server.port).start(timeout=5)
+
+
+def _broken_app():
+    app = FakeNovaPoshta()
+
+    def dispatch(payload):
+        raise KeyError("bug")
+
+    app.dispatch = dispatch
+    return app
+
+
+def test_raw_http_server_handler_error():
+    app = _broken_app()
+    with FakeServer(app) as server:
+        with httpx.Client() as http:
+            response = http.post(
+                server.url,
+                content=json.dumps(
+                    {"modelName": "Address", "calledMethod": "getAreas"}
+                ),
+            )
+            assert response.status_code == 500
+            assert "bug" in response.json()["errors"][0]
+            assert http.post(server.url, content=b"{}").status_code == 500
+    assert app.stats["server_errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_asgi_handler_error():
+    client = _asgi_client(_broken_app())
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.download("Address", "getAreas", {}, io.BytesIO())
+    await client.close_async()
+
+
+@pytest.mark.asyncio
+async def test_asgi_lifespan():
+    app = FakeNovaPoshta()
+    messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent = []
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await app({"type": "lifespan"}, receive, send)
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+def test_main_parses_options(monkeypatch):
+    started = []
+
+    def run(coro):
+        started.append(coro)
+        coro.close()
+
+    monkeypatch.setattr(asyncio, "run", run)
+    main(["--port", "0", "--latency", "0.01", "0.02", "--rate-limit", "10"])
+
+    assert len(started) == 1
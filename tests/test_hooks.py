@@ -0,0 +1,110 @@
+import httpx
+import pytest
+
+from novaposhta.chains import Chain, ChainCache
+from novaposhta.client import APIRequestError, NovaPoshtaApi
+from novaposhta.hooks import RequestInfo
+from tests.helpers import TEST_API_KEY, TEST_URI, MockModel
+
+
+def _record(client):
+    events = []
+    for event in (
+        "before_request",
+        "after_response",
+        "on_error",
+        "on_retry",
+        "on_cache_hit",
+    ):
+        client.add_hook(event, lambda info, event=event: events.append((event, info)))
+    return events
+
+
+def test_hooks_sync_timings_and_sizes(httpx_mock):
+    httpx_mock.add_response(json={"success": True, "data": [1, 2, 3]})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    events = _record(client)
+
+    response = client.new(MockModel).test()
+
+    assert response == {"success": True, "data": [1, 2, 3]}
+    assert [event for event, _ in events] == ["before_request", "after_response"]
+    info = events[1][1]
+    assert isinstance(info, RequestInfo)
+    assert info.key == "MockModel.test"
+    assert info.request_size == len(httpx_mock.get_request().content)
+    assert info.response_size == len(b'{"success":true,"data":[1,2,3]}')
+    assert info.serialize_time >= 0
+    assert info.network_time >= 0
+    assert info.decode_time >= 0
+    assert info.total_time >= info.network_time
+    assert info.response == response
+
+
+@pytest.mark.asyncio
+async def test_hooks_async_on_error(httpx_mock):
+    httpx_mock.add_response(json={"success": False, "errors": ["Wrong"]})
+    client = NovaPoshtaApi(
+        TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True, raise_for_errors=True
+    )
+    events = _record(client)
+
+    with pytest.raises(APIRequestError):
+        await client.send("Model", "method", {"Ref": "ref"})
+
+    assert [event for event, _ in events] == ["before_request", "on_error"]
+    assert isinstance(events[1][1].error, APIRequestError)
+    assert events[1][1].method_props == {"Ref": "ref"}
+
+
+def test_hooks_on_transport_error(httpx_mock):
+    httpx_mock.add_exception(httpx.ConnectError("No route"))
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    events = _record(client)
+
+    with pytest.raises(httpx.ConnectError):
+        client.send("Model", "method", {})
+
+    assert events[-1][0] == "on_error"
+    assert events[-1][1].network_time is None
+
+
+def test_hooks_add_remove(httpx_mock):
+    httpx_mock.add_response(json={"success": True})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    calls = []
+    hook = calls.append
+
+    client.add_hook("after_response", hook)
+    client.remove_hook("after_response", hook)
+    client.send("Model", "method", {})
+
+    assert calls == []
+    assert not client._hooks
+    with pytest.raises(ValueError):
+        client.add_hook("unknown", hook)
+
+
+def test_hooks_emitted_by_chains(httpx_mock):
+    httpx_mock.add_exception(httpx.ReadTimeout("Slow"))
+    httpx_mock.add_response(json={"success": True, "data": []})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    events = _record(client)
+    cache = ChainCache()
+
+    Chain(client.address.get_areas, retries=1, cache=cache).execute_sync()
+    Chain(client.address.get_areas, cache=cache).execute_sync()
+
+    names = [event for event, _ in events]
+    assert names == [
+        "before_request",
+        "on_error",
+        "on_retry",
+        "before_request",
+        "after_response",
+        "on_cache_hit",
+    ]
+    retry = events[2][1]
+    assert retry.key == "Address.getAreas"
+    assert retry.attempt == 2
+    assert isinstance(retry.error, httpx.ReadTimeout)
@@ -1,7 +1,12 @@
+import io
+import json
+
+import httpx
 import pytest
 
+from novaposhta.client import NovaPoshtaApi
 from novaposhta.models.internet_document import InternetDocument
-from tests.helpers import method_test
+from tests.helpers import TEST_API_KEY, TEST_URI, method_test
 
 methods_to_test = [
     {
@@ -88,3 +93,96 @@ methods_to_test = [
 @pytest.mark.parametrize("test_input", methods_to_test)
 def test_internet_document(test_input, httpx_mock):
     method_test(InternetDocument, test_input, httpx_mock)
+
+
+def _delete_callback(request):
+    refs = json.loads(request.content)["methodProperties"]["DocumentRefs"]
+    deleted = [{"Ref": r} for r in refs if not r.startswith("locked")]
+    return httpx.Response(
+        200,
+        json={
+            "success": bool(deleted),
+            "data": deleted,
+            "errors": [] if len(deleted) == len(refs) else ["Document is locked"],
+        },
+    )
+
+
+def test_delete_bulk(httpx_mock):
+    httpx_mock.add_callback(_delete_callback, is_reusable=True)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    refs = [f"ref{i}" for i in range(5)] + ["locked"]
+
+    result = client.internet_document.delete_bulk(refs, chunk_size=2, retries=0)
+
+    assert sorted(result.succeeded) == sorted(refs[:-1])
+    assert result.failed == {"locked": "Document is locked"}
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_delete_bulk_async_rate_limited(httpx_mock):
+    httpx_mock.add_callback(_delete_callback, is_reusable=True)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+
+    result = await client.internet_document.delete_bulk(
+        ["a", "b", "c"], chunk_size=1, rate_limit=100
+    )
+
+    assert result.success
+    assert sorted(result.succeeded) == ["a", "b", "c"]
+
+
+def test_download_report_to_path(httpx_mock, tmp_path):
+    httpx_mock.add_response(content=b"ref1;ref2\n")
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    path = tmp_path / "report.csv"
+
+    written = client.internet_document.download_report(
+        str(path), ["ref1", "ref2"], "csv", "date_time"
+    )
+
+    assert written == 10
+    assert path.read_bytes() == b"ref1;ref2\n"
+
+
+def _report_callback(request):
+    refs = json.loads(request.content)["methodProperties"]["DocumentRefs"]
+    rows = "".join(f"{ref};1\n" for ref in refs)
+    return httpx.Response(200, content=f"Ref;Cost\n{rows}".encode())
+
+
+def test_download_report_chunked_writes_header_once(httpx_mock):
+    httpx_mock.add_callback(_report_callback, is_reusable=True)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    sink = io.BytesIO()
+
+    written = client.internet_document.download_report(
+        sink, ["a", "b", "c", "d", "e"], "csv", "date_time", refs_per_request=2
+    )
+
+    assert sink.getvalue() == b"Ref;Cost\na;1\nb;1\nc;1\nd;1\ne;1\n"
+    assert written == len(sink.getvalue())
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_download_report_chunked_async(httpx_mock):
+    httpx_mock.add_callback(_report_callback, is_reusable=True)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+    sink = io.BytesIO()
+
+    written = await client.internet_document.download_report(
+        sink, ["a", "b", "c"], "csv", "date_time", refs_per_request=2
+    )
+
+    assert sink.getvalue() == b"Ref;Cost\na;1\nb;1\nc;1\n"
+    assert written == len(sink.getvalue())
+
+
+def test_download_report_cannot_split_other_types():
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    with pytest.raises(ValueError):
+        client.internet_document.download_report(
+            io.BytesIO(), ["a", "b", "c"], "xls", "date_time", refs_per_request=2
+        )
@@ -0,0 +1,184 @@
+import io
+
+import httpx
+import pytest
+
+from novaposhta.client import NovaPoshtaApi
+from novaposhta.hooks import RequestInfo
+from novaposhta.metrics import Histogram, MetricsRegistry
+from tests.helpers import TEST_API_KEY, TEST_URI
+
+
+def test_histogram_quantiles():
+    histogram = Histogram(buckets=(0.1, 0.2, 0.5))
+    for value in [0.05] * 50 + [0.15] * 45 + [0.4] * 4 + [2.0]:
+        histogram.observe(value)
+
+    assert histogram.count == 100
+    assert histogram.counts == [50, 45, 4, 1]
+    assert 0 < histogram.quantile(0.5) <= 0.1
+    assert 0.1 < histogram.quantile(0.95) <= 0.2
+    assert 0.2 < histogram.quantile(0.99) <= 0.5
+    assert histogram.quantile(1) == 2.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_metrics_registry_collects_client_metrics(httpx_mock):
+    httpx_mock.add_response(json={"success": True})
+    httpx_mock.add_response(json={"success": False, "errors": ["API key expired"]})
+    httpx_mock.add_response(json={"success": False, "errors": ["Wrong"]})
+    httpx_mock.add_exception(httpx.ConnectError("No route"))
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, raise_for_errors=True)
+    registry = client.enable_metrics()
+
+    client.send("Address", "getAreas", {})
+    for _ in range(3):
+        with pytest.raises(Exception):
+            client.send("Address", "getAreas", {})
+    client.emit("on_retry", RequestInfo("Address", "getAreas", {}))
+    client.emit("on_cache_hit", RequestInfo("Address", "getCities", {}))
+
+    snapshot = registry.snapshot()
+    assert snapshot["requests"] == {"Address.getAreas": 4}
+    assert snapshot["errors"] == {
+        "Address.getAreas": {
+            "InvalidAPIKeyError": 1,
+            "APIRequestError": 1,
+            "TransportError": 1,
+        }
+    }
+    assert snapshot["retries"] == {"Address.getAreas": 1}
+    assert snapshot["cache_hits"] == {"Address.getCities": 1}
+    latency = snapshot["latency"]["Address.getAreas"]
+    assert latency["count"] == 4
+    assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+
+
+@pytest.mark.parametrize("lazy_responses", [False, True])
+def test_metrics_count_failed_responses_without_raising(httpx_mock, lazy_responses):
+    httpx_mock.add_response(json={"success": True})
+    httpx_mock.add_response(json={"success": False, "errors": ["API key expired"]})
+    httpx_mock.add_response(json={"success": False, "errors": {"Ref": "Wrong"}})
+    client = NovaPoshtaApi(
+        TEST_API_KEY, api_endpoint=TEST_URI, lazy_responses=lazy_responses
+    )
+    registry = client.enable_metrics()
+
+    for _ in range(3):
+        client.send("Address", "getAreas", {})
+
+    snapshot = registry.snapshot()
+    assert snapshot["requests"] == {"Address.getAreas": 3}
+    assert snapshot["errors"] == {
+        "Address.getAreas": {"InvalidAPIKeyError": 1, "APIRequestError": 1}
+    }
+
+
+def test_enable_metrics_twice(httpx_mock):
+    httpx_mock.add_response(json={"success": True}, is_reusable=True)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    first = client.enable_metrics()
+    second = client.enable_metrics()
+
+    assert second is not first
+    assert client.enable_metrics(second) is second
+    client.send("Address", "getAreas", {})
+    assert first.snapshot()["requests"] == {}
+    assert second.snapshot()["requests"] == {"Address.getAreas": 1}
+    assert client.disable_metrics() is second
+    assert not client._hooks
+
+
+def test_metrics_registry_prometheus_and_detach(httpx_mock):
+    httpx_mock.add_response(json={"success": True})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    registry = MetricsRegistry(buckets=(0.5, 1)).attach(client)
+
+    client.send("Address", "getAreas", {})
+    registry.detach(client)
+    client_without_hooks = not client._hooks
+
+    text = registry.to_prometheus()
+    assert client_without_hooks
+    assert "# TYPE novaposhta_requests_total counter" in text
+    assert 'novaposhta_requests_total{method="Address.getAreas"} 1' in text
+    assert (
+        'novaposhta_request_duration_seconds_bucket{method="Address.getAreas",le="0.5"} 1'
+        in text
+    )
+    assert (
+        'novaposhta_request_duration_seconds_bucket{method="Address.getAreas",le="+Inf"} 1'
+        in text
+    )
+    assert (
+        'novaposhta_request_duration_seconds_count{method="Address.getAreas"} 1' in text
+    )
+    registry.reset()
+    assert registry.snapshot()["requests"] == {}
+
+
+def test_disable_metrics(httpx_mock):
+    httpx_mock.add_response(json={"success": True})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    registry = client.enable_metrics()
+
+    client.send("Address", "getAreas", {})
+
+    assert client.disable_metrics() is registry
+    assert client.metrics is None
+    assert not client._hooks
+    assert client.disable_metrics() is None
+    assert registry.snapshot()["requests"] == {"Address.getAreas": 1}
+
+
+def test_metrics_of_streams_and_downloads(httpx_mock):
+    httpx_mock.add_response(
+        json={"success": True, "data": [{"Ref": "1"}, {"Ref": "2"}]}
+    )
+    httpx_mock.add_response(json={"success": True, "data": [{"Ref": "1"}]})
+    httpx_mock.add_response(content=b"report")
+    httpx_mock.add_response(status_code=500)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    registry = client.enable_metrics()
+    profiler = client.enable_profiling(trace_allocations=False)
+    seen = []
+    client.add_hook("after_response", seen.append)
+
+    assert len(list(client.stream("Address", "getWarehouses", {}))) == 2
+    for _ in client.stream("Address", "getWarehouses", {}):
+        break
+    client.download("InternetDocument", "generateReport", {}, io.BytesIO())
+    with pytest.raises(httpx.HTTPStatusError):
+        client.download("InternetDocument", "generateReport", {}, io.BytesIO())
+
+    snapshot = registry.snapshot()
+    assert snapshot["requests"] == {
+        "Address.getWarehouses": 2,
+        "InternetDocument.generateReport": 2,
+    }
+    assert snapshot["errors"] == {
+        "InternetDocument.generateReport": {"HTTPStatusError": 1}
+    }
+    assert seen[0].response_size > 0
+    assert seen[2].response_size == 6
+    phases = profiler.snapshot()["InternetDocument.generateReport"]["phases"]
+    assert phases["encode"]["count"] == phases["network"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_of_async_streams_and_downloads(httpx_mock):
+    httpx_mock.add_response(json={"success": False, "data": [], "errors": ["Boom"]})
+    httpx_mock.add_response(content=b"report")
+    client = NovaPoshtaApi(
+        TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True, raise_for_errors=True
+    )
+    registry = client.enable_metrics()
+
+    with pytest.raises(Exception):
+        async for _ in client.stream("Address", "getWarehouses", {}):
+            pass
+    await client.download("InternetDocument", "generateReport", {}, io.BytesIO())
+
+    snapshot = registry.snapshot()
+    assert snapshot["errors"] == {"Address.getWarehouses": {"APIRequestError": 1}}
+    assert snapshot["requests"]["InternetDocument.generateReport"] == 1
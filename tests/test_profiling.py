@@ -0,0 +1,88 @@
+import tracemalloc
+
+import pytest
+
+from novaposhta.client import NovaPoshtaApi
+from novaposhta.profiling import Profiler
+from tests.helpers import TEST_API_KEY, TEST_URI, MockModel
+
+
+def test_profiling_phases_per_method(httpx_mock):
+    httpx_mock.add_response(json={"success": True, "data": [{"Ref": "a"}] * 100})
+    httpx_mock.add_response(json={"success": True, "data": []})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    profiler = client.enable_profiling()
+
+    client.new(MockModel).test()
+    client.send("Address", "getCities", {"Page": "1"})
+    assert client.disable_profiling() is profiler
+
+    snapshot = profiler.snapshot()
+    phases = snapshot["MockModel.test"]["phases"]
+    assert set(phases) == {"build_props", "encode", "network", "decode", "check_errors"}
+    assert snapshot["MockModel.test"]["calls"] == 1
+    assert phases["decode"]["allocated"] > 0
+    assert "peak" not in phases["decode"]
+    assert "build_props" not in snapshot["Address.getCities"]["phases"]
+    assert snapshot["Address.getCities"]["client_time"] > 0
+    assert not tracemalloc.is_tracing()
+    assert "MockModel.test" in profiler.report()
+
+
+def test_enable_profiling_twice():
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    first = client.enable_profiling()
+    second = client.enable_profiling()
+
+    assert second is not first
+    assert client.enable_profiling(second) is second
+    assert client.profiler is second
+    assert tracemalloc.is_tracing()
+    assert client.disable_profiling() is second
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.asyncio
+async def test_profiling_async_without_allocations(httpx_mock):
+    httpx_mock.add_response(json={"success": True})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+    profiler = client.enable_profiling(trace_allocations=False)
+
+    await client.new(MockModel).test()
+
+    phases = profiler.snapshot()["MockModel.test"]["phases"]
+    assert phases["network"]["count"] == 1
+    assert phases["decode"]["allocated"] == 0
+    profiler.reset()
+    assert profiler.snapshot() == {}
+
+
+def test_profiler_keeps_external_tracing():
+    tracemalloc.start()
+    try:
+        profiler = Profiler().start()
+        with profiler.measure("Model.method", "encode"):
+            data = [str(i) for i in range(1000)]
+        profiler.stop()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert data
+    assert profiler.snapshot()["Model.method"]["phases"]["encode"]["allocated"] > 0
+
+
+def test_profiler_overlapping_measurements():
+    profiler = Profiler().start()
+    try:
+        with profiler.measure("Outer.method", "decode"):
+            outer = [str(i) for i in range(1000)]
+            with profiler.measure("Inner.method", "decode"):
+                inner = [str(i) for i in range(1000)]
+    finally:
+        profiler.stop()
+
+    snapshot = profiler.snapshot()
+    outer_allocated = snapshot["Outer.method"]["phases"]["decode"]["allocated"]
+    inner_allocated = snapshot["Inner.method"]["phases"]["decode"]["allocated"]
+    assert outer and inner
+    assert outer_allocated > inner_allocated > 0
@@ -0,0 +1,219 @@
+import json
+
+import pytest
+
+from novaposhta.client import APIRequestError, NovaPoshtaApi
+from novaposhta.responses import (
+    LAZY_CHUNK_SIZE,
+    LazyItems,
+    LazyResponse,
+    RawResponse,
+)
+from novaposhta.serializers import StdlibSerializer
+from tests.helpers import TEST_API_KEY, TEST_URI
+
+OK_BODY = b'{"success":true,"data":[{"Ref":"1"}],"errors":[]}'
+FAILED_BODY = b'{ "success" : false, "data": [], "errors": ["Boom"]}'
+
+
+class _CountingSerializer(StdlibSerializer):
+    def __init__(self):
+        super().__init__()
+        self.decoded = 0
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+def test_raw_response_success_is_scanned_without_decoding():
+    serializer = _CountingSerializer()
+    response = RawResponse(OK_BODY, serializer=serializer)
+    assert response.success is True
+    assert response.errors == []
+    assert serializer.decoded == 0
+    assert bytes(response) == OK_BODY
+    assert len(response) == len(OK_BODY)
+    assert "200" in repr(response)
+
+
+def test_raw_response_decodes_errors_once():
+    serializer = _CountingSerializer()
+    response = RawResponse(FAILED_BODY, serializer=serializer)
+    assert response.success is False
+    assert response.errors == ["Boom"]
+    assert response.json()["data"] == []
+    assert serializer.decoded == 1
+
+
+@pytest.mark.parametrize(
+    "body, success",
+    [
+        (b'{"data": [], "success": true}', True),
+        (b'{"data": [], "success": false}', False),
+        (b"<html>Bad gateway</html>", False),
+        (b"[]", False),
+    ],
+)
+def test_raw_response_success_falls_back_to_decoding(body, success):
+    assert RawResponse(body).success is success
+
+
+def test_client_send_raw(httpx_mock):
+    httpx_mock.add_response(content=OK_BODY)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    response = client.send("Address", "getWarehouses", {}, raw=True)
+    assert isinstance(response, RawResponse)
+    assert response.content == OK_BODY
+    assert response.success
+
+
+def test_client_send_raw_raises_for_errors(httpx_mock):
+    httpx_mock.add_response(content=FAILED_BODY)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, raise_for_errors=True)
+    with pytest.raises(APIRequestError):
+        client.send("Address", "getWarehouses", {}, raw=True)
+
+
+@pytest.mark.asyncio
+async def test_async_client_send_raw(httpx_mock):
+    httpx_mock.add_response(content=FAILED_BODY, status_code=200)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+    response = await client.send("Address", "getWarehouses", {}, raw=True)
+    assert response.content == FAILED_BODY
+    assert response.errors == ["Boom"]
+
+
+def test_client_send_raw_with_hooks(httpx_mock):
+    httpx_mock.add_response(content=OK_BODY)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    seen = []
+    client.add_hook("after_response", seen.append)
+    response = client.send("Address", "getWarehouses", {}, raw=True)
+    assert response.content == OK_BODY
+    assert seen[0].response is None
+    assert seen[0].response_size == len(OK_BODY)
+
+
+@pytest.mark.asyncio
+async def test_async_client_send_raw_with_profiler(httpx_mock):
+    httpx_mock.add_response(content=FAILED_BODY)
+    client = NovaPoshtaApi(
+        TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True, raise_for_errors=True
+    )
+    profiler = client.enable_profiling(trace_allocations=False)
+    with pytest.raises(APIRequestError):
+        await client.send("Address", "getWarehouses", {}, raw=True)
+    assert profiler.snapshot()["Address.getWarehouses"]["calls"] == 1
+    sent = json.loads(httpx_mock.get_requests()[0].content)
+    assert sent["calledMethod"] == "getWarehouses"
+
+
+WAREHOUSES = {
+    "success": True,
+    "data": [
+        {"Ref": "1", "Description": '"]}[{" №1', "Schedule": {"Mon": "8-20"}},
+        {"Ref": "2", "Description": "Відділення №2", "Codes": [[1], []]},
+        [3],
+    ],
+    "errors": [],
+    "info": {"totalCount": 3},
+}
+
+
+def _large_body(items=2000):
+    data = [{"Ref": str(i), "Description": f"Відділення №{i}"} for i in range(items)]
+    return json.dumps(
+        {"success": True, "data": data, "errors": [], "info": {"totalCount": items}},
+        ensure_ascii=False,
+    ).encode()
+
+
+def test_lazy_response_parses_only_what_is_read():
+    body = _large_body()
+    response = LazyResponse(body)
+
+    assert response["success"] is True
+    assert response["data"][0]["Ref"] == "0"
+    assert response._offset <= LAZY_CHUNK_SIZE < len(body)
+    assert response["data"][5]["Description"] == "Відділення №5"
+    assert response._offset <= LAZY_CHUNK_SIZE
+    assert response["info"] == {"totalCount": 2000}
+    assert len(response["data"]) == 2000
+    assert response == json.loads(body)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_lazy_response_mapping_and_sequence(indent):
+    body = json.dumps(WAREHOUSES, ensure_ascii=False, indent=indent).encode()
+    response = LazyResponse(body)
+    items = response["data"]
+
+    assert isinstance(items, LazyItems)
+    assert items[-2]["Ref"] == "2"
+    assert items[1:] == WAREHOUSES["data"][1:]
+    assert list(items) == WAREHOUSES["data"]
+    assert items == WAREHOUSES["data"]
+    assert items != 1
+    assert list(response) == list(WAREHOUSES)
+    assert len(response) == 4
+    assert response.get("missing") is None
+    assert "errors" in response
+    assert response.to_dict() == WAREHOUSES
+    assert type(response.to_dict()["data"]) is list
+    assert "LazyResponse" in repr(response)
+    assert "3 parsed" in repr(items)
+    with pytest.raises(IndexError):
+        items[3]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"success": true, "data": [1, {"a": 2}], "errors": []}',
+        b'{"success": true, "data": {"a": [1]}, "errors": []}',
+        b'{"success": true, "info": {"data": [{"a": 1}]}}',
+        b'{"errors": ["Boom"], "success": false, "data": []}',
+    ],
+)
+def test_lazy_response_matches_plain_decoding(body):
+    assert LazyResponse(body).to_dict() == json.loads(body)
+
+
+def test_lazy_response_invalid_body():
+    response = LazyResponse(b'{"success": true, "data": [{"a": 1}, {"b"')
+
+    assert response["data"][0] == {"a": 1}
+    with pytest.raises(ValueError):
+        response["data"][1]
+    with pytest.raises(ValueError):
+        LazyResponse(b"<html>")["success"]
+
+
+def test_client_lazy_responses(httpx_mock):
+    httpx_mock.add_response(json=WAREHOUSES)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, lazy_responses=True)
+    response = client.address.get_warehouses(limit=3)
+    assert isinstance(response, LazyResponse)
+    assert response["data"][0]["Ref"] == "1"
+
+
+def test_client_lazy_responses_raise_for_errors(httpx_mock):
+    httpx_mock.add_response(content=FAILED_BODY)
+    client = NovaPoshtaApi(
+        TEST_API_KEY, api_endpoint=TEST_URI, lazy_responses=True, raise_for_errors=True
+    )
+    with pytest.raises(APIRequestError, match="Boom"):
+        client.address.get_warehouses()
+
+
+@pytest.mark.asyncio
+async def test_async_client_lazy_responses(httpx_mock):
+    httpx_mock.add_response(json=WAREHOUSES)
+    client = NovaPoshtaApi(
+        TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True, lazy_responses=True
+    )
+    client.add_hook("after_response", lambda info: None)
+    response = await client.address.get_warehouses()
+    assert isinstance(response, LazyResponse)
+    assert response["data"][2] == [3]
@@ -1,7 +1,11 @@
+import json
+
+import httpx
 import pytest
 
+from novaposhta.client import NovaPoshtaApi
 from novaposhta.models.scan_sheet import ScanSheet
-from tests.helpers import method_test
+from tests.helpers import TEST_API_KEY, TEST_URI, method_test
 
 methods_to_test = [
     {
@@ -31,3 +35,73 @@ methods_to_test = [
 @pytest.mark.parametrize("test_input", methods_to_test)
 def test_scan_sheet(test_input, httpx_mock):
     method_test(ScanSheet, test_input, httpx_mock)
+
+
+def _scan_sheet_callback(request):
+    props = json.loads(request.content)["methodProperties"]
+    refs = props.get("DocumentRefs") or props.get("ScanSheetRefs")
+    return httpx.Response(
+        200,
+        json={
+            "success": True,
+            "data": [
+                {
+                    "Data": {
+                        "Success": [{"Ref": r} for r in refs if r != "bad"],
+                        "Errors": [
+                            {"Ref": r, "Error": "Wrong"} for r in refs if r == "bad"
+                        ],
+                    }
+                }
+            ],
+        },
+    )
+
+
+def test_insert_documents_bulk(httpx_mock):
+    httpx_mock.add_callback(_scan_sheet_callback, is_reusable=True)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+
+    result = client.scan_sheet.insert_documents_bulk(
+        ["a", "b", "c", "bad"], ref="ref", date="date", chunk_size=3
+    )
+
+    assert result.succeeded == ["a", "b", "c"]
+    assert result.failed == {"bad": "Wrong"}
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_insert_documents_bulk_with_lazy_responses(httpx_mock):
+    httpx_mock.add_callback(_scan_sheet_callback, is_reusable=True)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, lazy_responses=True)
+
+    result = client.scan_sheet.insert_documents_bulk(
+        ["a", "b", "c", "bad"], ref="ref", date="date", chunk_size=3
+    )
+
+    assert result.succeeded == ["a", "b", "c"]
+    assert result.failed == {"bad": "Wrong"}
+
+
+@pytest.mark.asyncio
+async def test_delete_scan_sheet_bulk_async(httpx_mock):
+    httpx_mock.add_callback(_scan_sheet_callback, is_reusable=True)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+
+    result = await client.scan_sheet.delete_scan_sheet_bulk(
+        [str(i) for i in range(10)], chunk_size=4
+    )
+
+    assert result.success
+    assert sorted(result.succeeded, key=int) == [str(i) for i in range(10)]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_remove_documents_bulk_async(httpx_mock):
+    httpx_mock.add_callback(_scan_sheet_callback, is_reusable=True)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+
+    result = await client.scan_sheet.remove_documents_bulk(["a"], ref="ref")
+
+    assert result.succeeded == ["a"]
@@ -0,0 +1,90 @@
+import json
+import pickle
+import sys
+
+import pytest
+
+from novaposhta.client import NovaPoshtaApi
+from novaposhta.serializers import (
+    MsgspecSerializer,
+    OrjsonSerializer,
+    Serializer,
+    StdlibSerializer,
+    get_serializer,
+)
+from tests.helpers import TEST_API_KEY, TEST_URI
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_serializer_roundtrip(name):
+    if name != "json":
+        pytest.importorskip(name)
+    serializer = get_serializer(name)
+    data = {"CityName": "Київ", "Limit": 50, "Items": [{"Ref": "a"}], "Flag": None}
+
+    encoded = serializer.dumps(data)
+
+    assert (
+        encoded == json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+    )
+    assert serializer.loads(encoded) == data
+    assert serializer.name == name
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_serializer_pickles(name):
+    if name != "json":
+        pytest.importorskip(name)
+    loads = pickle.loads(pickle.dumps(get_serializer(name).loads))
+
+    assert loads(b'{"Ref":"a"}') == {"Ref": "a"}
+
+
+def test_get_serializer_resolution(monkeypatch):
+    stdlib = StdlibSerializer()
+    assert get_serializer(stdlib) is stdlib
+    with pytest.raises(ValueError):
+        get_serializer("yaml")
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    assert isinstance(get_serializer(), StdlibSerializer)
+    with pytest.raises(ImportError):
+        OrjsonSerializer()
+    with pytest.raises(ImportError):
+        MsgspecSerializer()
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_client_body_with_static_prefix(name, httpx_mock):
+    if name != "json":
+        pytest.importorskip(name)
+    httpx_mock.add_response(json={"success": True, "data": ["Київ"]})
+    httpx_mock.add_response(json={"success": True, "data": []})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, serializer=name)
+
+    response = client.send("Address", "getCities", {"FindByString": "Київ"})
+    client.api_key = "other"
+    client.send("Address", "getCities", {})
+
+    first, second = httpx_mock.get_requests()
+    assert response["data"] == ["Київ"]
+    assert json.loads(first.content) == {
+        "apiKey": TEST_API_KEY,
+        "modelName": "Address",
+        "calledMethod": "getCities",
+        "methodProperties": {"FindByString": "Київ"},
+    }
+    assert json.loads(second.content)["apiKey"] == "other"
+    assert len(client._body_prefixes) == 2
+
+
+def test_serializer_must_implement_both_methods():
+    class DumpsOnly(Serializer):
+        def dumps(self, obj):
+            return b""
+
+    with pytest.raises(TypeError):
+        Serializer()
+    with pytest.raises(TypeError):
+        DumpsOnly()
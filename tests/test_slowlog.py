@@ -0,0 +1,120 @@
+import logging
+
+import pytest
+
+from novaposhta.client import NovaPoshtaApi
+from novaposhta.hooks import RequestInfo
+from novaposhta.slowlog import SlowCallLog, summarize_props
+from tests.helpers import TEST_API_KEY, TEST_URI
+
+
+def _info(total_time, **props):
+    return RequestInfo(
+        "InternetDocument",
+        "getDocumentPrice",
+        props,
+        total_time=total_time,
+        network_time=total_time,
+    )
+
+
+def test_summarize_props_redacts_and_cuts():
+    summary = summarize_props(
+        {
+            "apiKey": "secret",
+            "RecipientsPhone": "380501234567",
+            "Description": "Call me at +38 (050) 123-45-67 please",
+            "CargoDetails": [{"Phone": "0501234567"}] * 7,
+            "Comment": "x" * 100,
+            "Weight": "1",
+        },
+        max_length=10,
+        max_items=2,
+    )
+
+    assert summary["apiKey"] == "***"
+    assert summary["RecipientsPhone"] == "***"
+    assert "123" not in summary["Description"]
+    assert summary["CargoDetails"] == [
+        {"Phone": "***"},
+        {"Phone": "***"},
+        "... (7 items)",
+    ]
+    assert summary["Comment"] == "xxxxxxxxxx... (100 chars)"
+    assert summary["Weight"] == "1"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "+380501234567",
+        "380501234567",
+        "0501234567",
+        "+38 (050) 123-45-67",
+        "050 123 45 67",
+        "38-050-123-45-67",
+    ],
+)
+def test_summarize_props_masks_phone_formats(text):
+    assert summarize_props({"Note": f"tel {text}!"}) == {"Note": "tel ***!"}
+
+
+def test_summarize_props_keeps_document_numbers():
+    props = {
+        "DocumentNumber": "20450123456789",
+        "Documents": [{"DocumentNumber": "59000123456789"}],
+        "Note": "TTN 20450123456789",
+    }
+
+    assert summarize_props(props) == props
+
+
+def test_slow_call_log_threshold_and_ring_buffer(caplog):
+    log = SlowCallLog(threshold=0.5, maxlen=2, logger=logging.getLogger("np.slow"))
+
+    with caplog.at_level(logging.INFO, logger="np.slow"):
+        log.on_call(_info(0.1, Weight="1"))
+        for total in (0.6, 0.7, 0.8):
+            log.on_call(_info(total, SendersPhone="380501234567"))
+
+    records = log.snapshot()
+    assert [r["total_time"] for r in records] == [0.7, 0.8]
+    assert all(r["slow"] for r in records)
+    assert records[0]["props"] == {"SendersPhone": "***"}
+    assert records[0]["method"] == "InternetDocument.getDocumentPrice"
+    assert len(caplog.records) == 3
+    assert caplog.records[0].levelno == logging.WARNING
+    log.clear()
+    assert log.snapshot() == []
+
+
+def test_slow_call_log_sampling(monkeypatch):
+    log = SlowCallLog(threshold=10, sample_rate=0.5)
+    values = iter([0.4, 0.6])
+    monkeypatch.setattr("novaposhta.slowlog.random.random", lambda: next(values))
+
+    log.on_call(_info(0.1))
+    log.on_call(_info(0.1))
+
+    assert [r["slow"] for r in log.snapshot()] == [False]
+    with pytest.raises(ValueError):
+        SlowCallLog(sample_rate=2)
+
+
+def test_slow_call_log_attached_to_client(httpx_mock):
+    httpx_mock.add_response(json={"success": True})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    log = SlowCallLog(threshold=0).attach(client)
+
+    client.send(
+        "TrackingDocument",
+        "getStatusDocuments",
+        {"Documents": [{"Phone": "380501234567"}]},
+    )
+    log.detach(client)
+
+    record = log.snapshot()[0]
+    assert record["method"] == "TrackingDocument.getStatusDocuments"
+    assert record["props"] == {"Documents": [{"Phone": "***"}]}
+    assert record["request_size"] > 0
+    assert not client._hooks
@@ -0,0 +1,151 @@
+import json
+import tracemalloc
+
+import httpx
+import pytest
+
+from novaposhta.client import APIRequestError, NovaPoshtaApi
+from novaposhta.streaming import ItemParser
+from tests.helpers import TEST_API_KEY, TEST_URI
+
+RESPONSE = {
+    "success": True,
+    "data": [
+        {"Ref": "1", "Description": "Відділення №1", "Number": 1},
+        {"Ref": "2", "Description": 'quoted "]},{" text', "Number": 2.5},
+        [1, 2, {"nested": [True, False, None]}],
+        12345,
+        "plain",
+    ],
+    "errors": [],
+    "info": {"totalCount": 5},
+}
+
+
+def _parse(body: bytes, chunk_size: int):
+    parser = ItemParser()
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[i : i + chunk_size]))
+    items.extend(parser.close())
+    return items, parser.envelope
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 100000])
+def test_parser_yields_items_for_any_chunking(chunk_size):
+    body = json.dumps(RESPONSE, ensure_ascii=False, indent=1).encode()
+    items, envelope = _parse(body, chunk_size)
+    assert items == RESPONSE["data"]
+    assert envelope == {"success": True, "errors": [], "info": {"totalCount": 5}}
+
+
+def test_parser_keeps_non_list_data_in_envelope():
+    items, envelope = _parse(b'{"data": {"a": 1}, "success": false}', 3)
+    assert items == []
+    assert envelope == {"data": {"a": 1}, "success": False}
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"data": [1, 2', b'["data"]', b'{"data": []} x', b'{"data": [nope]}']
+)
+def test_parser_rejects_invalid_body(body):
+    with pytest.raises(ValueError):
+        _parse(body, 4)
+
+
+def test_parser_memory_does_not_grow_with_body():
+    item = json.dumps({"Ref": "x" * 36, "Description": "y" * 200}).encode()
+    chunk = b",".join([item] * 100)
+    tracemalloc.start()
+    try:
+        parser = ItemParser()
+        parser.feed(b'{"success": true, "data": [')
+        count = len(parser.feed(chunk))
+        tracemalloc.reset_peak()
+        for _ in range(200):
+            count += len(parser.feed(b"," + chunk))
+        count += len(parser.feed(b"]}")) + len(parser.close())
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert count == 20100
+    assert peak < 10 * len(chunk)
+
+
+def test_client_stream_sync(httpx_mock):
+    httpx_mock.add_response(json=RESPONSE)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    stream = client.stream("Address", "getWarehouses", {"Limit": "5"}, chunk_size=8)
+    assert stream.success is None
+    assert list(stream) == RESPONSE["data"]
+    assert stream.success is True
+    assert stream.errors == []
+    assert stream.envelope["info"] == {"totalCount": 5}
+    sent = json.loads(httpx_mock.get_requests()[0].content)
+    assert sent["calledMethod"] == "getWarehouses"
+    assert sent["methodProperties"] == {"Limit": "5"}
+
+
+def test_client_stream_raises_errors_at_end(httpx_mock):
+    httpx_mock.add_response(json={"success": False, "data": [1], "errors": ["Boom"]})
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, raise_for_errors=True)
+    items = []
+    with pytest.raises(APIRequestError):
+        for item in client.stream("Address", "getWarehouses", {}):
+            items.append(item)
+    assert items == [1]
+
+
+@pytest.mark.asyncio
+async def test_client_stream_async(httpx_mock):
+    httpx_mock.add_response(json=RESPONSE)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+    stream = client.stream("Address", "getWarehouses", {}, chunk_size=16)
+    items = [item async for item in stream]
+    assert items == RESPONSE["data"]
+    assert stream.success is True
+
+
+def test_client_stream_raises_http_errors(httpx_mock):
+    httpx_mock.add_response(status_code=502, text='{"data": [1]}')
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    items = []
+    with pytest.raises(httpx.HTTPStatusError) as error:
+        for item in client.stream("Address", "getWarehouses", {}):
+            items.append(item)
+    assert items == []
+    assert error.value.response.text == '{"data": [1]}'
+
+
+@pytest.mark.asyncio
+async def test_client_stream_async_raises_http_errors(httpx_mock):
+    httpx_mock.add_response(status_code=500, text="Internal Server Error")
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI, async_mode=True)
+    stream = client.stream("Address", "getWarehouses", {})
+    with pytest.raises(httpx.HTTPStatusError):
+        [item async for item in stream]
+    assert stream.envelope is None
+
+
+def test_model_stream_by_name_and_method(httpx_mock):
+    httpx_mock.add_response(json=RESPONSE)
+    httpx_mock.add_response(json=RESPONSE)
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    address = client.address
+    assert list(address.stream("get_warehouses", city_ref="c", limit=5)) == (
+        RESPONSE["data"]
+    )
+    assert list(address.stream(address.get_warehouses, city_ref="c")) == (
+        RESPONSE["data"]
+    )
+    sent = json.loads(httpx_mock.get_requests()[0].content)
+    assert sent["modelName"] == "Address"
+    assert sent["calledMethod"] == "getWarehouses"
+    assert sent["methodProperties"]["CityRef"] == "c"
+    assert sent["methodProperties"]["Limit"] == "5"
+
+
+def test_model_stream_rejects_non_api_method():
+    client = NovaPoshtaApi(TEST_API_KEY, api_endpoint=TEST_URI)
+    with pytest.raises(ValueError):
+        client.internet_document.stream("download_report")